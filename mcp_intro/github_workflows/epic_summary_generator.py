@@ -11,24 +11,29 @@ Usage:
     python epic_summary_generator.py --repo org/repo --date 2024-01-15 --output report.json --issues-file sample_issues.txt
 """
 
-import argparse
+import array
+import functools
 import os
+import re
 import sys
-import json
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from pathlib import Path
 
-# Import the GitHub MCP library
-from github_mcp import (
-    crawl_specific_issues,
-    generate_board_report,
-    generate_epic_status_summary,
-    generate_epic_summary_report
-)
+# The GitHub MCP library (and pandas through it) is imported inside the
+# functions that need it, so --help and validation errors return quickly
 
+# API credentials, read once at startup
+GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
+DEEPSEEK_API_KEY = os.environ.get('DEEPSEEK_API_KEY')
 
-def parse_issue_numbers(issues_input: str) -> List[int]:
+# One match per comma/newline-separated field: a '#' comment, an issue number,
+# or anything else (reported as invalid). A comment, like any field, ends at
+# the next comma, so "# note, 12" still yields issue 12.
+_ISSUE_TOKEN_RE = re.compile(r'[^\S\n]*(?:#[^,\n]*|(\d+)|([^,\s][^,\n]*?))[^\S\n]*(?=[,\n]|\Z)')
+
+
+def parse_issue_numbers(issues_input: str) -> array.array:
     """
     Parse issue numbers from a string input.
     Supports comma-separated values and newline-separated values.
@@ -37,27 +42,27 @@ def parse_issue_numbers(issues_input: str) -> List[int]:
         issues_input: String containing issue numbers
         
     Returns:
-        List of integer issue numbers
+        Compact array ('i') of issue numbers
     """
-    issues = []
-    
-    # Split by comma first, then by newline for each part
-    for part in issues_input.split(','):
-        part = part.strip()
-        if part:
-            # Handle newline-separated values within each comma-separated part
-            for line in part.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('#'):  # Skip comments
-                    try:
-                        issues.append(int(line))
-                    except ValueError:
-                        print(f"Warning: Skipping invalid issue number '{line}'")
+    # Unboxed int32 storage; large issue files would otherwise hold one
+    # PyLong object per entry
+    issues = array.array('i')
+    
+    # Single scan with the compiled pattern; blank fields never match and
+    # comments match without capturing anything
+    for number, invalid in _ISSUE_TOKEN_RE.findall(issues_input):
+        if number:
+            try:
+                issues.append(int(number))
+            except OverflowError:
+                print(f"Warning: Skipping invalid issue number '{number}'")
+        elif invalid:
+            print(f"Warning: Skipping invalid issue number '{invalid}'")
     
     return issues
 
 
-def read_issues_from_file(file_path: str) -> List[int]:
+def read_issues_from_file(file_path: str) -> array.array:
     """
     Read issue numbers from a text file.
     
@@ -65,12 +70,10 @@ def read_issues_from_file(file_path: str) -> List[int]:
         file_path: Path to the file containing issue numbers
         
     Returns:
-        List of integer issue numbers
+        Compact array ('i') of issue numbers
     """
     try:
-        with open(file_path, 'r') as f:
-            content = f.read()
-        return parse_issue_numbers(content)
+        return parse_issue_numbers(Path(file_path).read_text())
     except FileNotFoundError:
         print(f"Error: Issue file '{file_path}' not found.")
         sys.exit(1)
@@ -79,6 +82,16 @@ def read_issues_from_file(file_path: str) -> List[int]:
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=16)
+def _parse_date(date_string: str) -> datetime:
+    """Parse a strict YYYY-MM-DD date through the C fromisoformat fast path."""
+    # fromisoformat also accepts other ISO 8601 forms (20240115, 2024-W03-1),
+    # so pin the layout first
+    if len(date_string) != 10 or date_string[4] != '-' or date_string[7] != '-':
+        raise ValueError(f"Invalid date format: {date_string}")
+    return datetime.fromisoformat(date_string)
+
+
 def validate_date(date_string: str) -> str:
     """
     Validate and format a date string.
@@ -93,7 +106,7 @@ def validate_date(date_string: str) -> str:
         ValueError: If date is invalid
     """
     try:
-        datetime.strptime(date_string, '%Y-%m-%d')
+        _parse_date(date_string)
         return date_string
     except ValueError:
         raise ValueError(f"Invalid date format: {date_string}. Use YYYY-MM-DD format.")
@@ -112,63 +125,151 @@ def validate_repo(repo_string: str) -> str:
     Raises:
         ValueError: If repository format is invalid
     """
-    if '/' not in repo_string or repo_string.count('/') != 1:
+    if repo_string.count('/') != 1:
         raise ValueError(f"Invalid repository format: {repo_string}. Use 'org/repo' format.")
     return repo_string
 
 
-def create_date_folder_structure(target_date: str, base_output_dir: str = "reports") -> tuple[str, str]:
+def create_date_folder_structure(target_date: str, base_output_dir: str = "reports") -> str:
     """
     Create a date-based folder structure for organizing reports.
     
     Args:
-        target_date: Target date in YYYY-MM-DD format
+        target_date: Target date in YYYY-MM-DD format (already validated)
         base_output_dir: Base directory for reports (default: "reports")
         
     Returns:
-        Tuple of (date_folder_path, full_output_path)
+        Path of the date folder (reports/YYYY-MM/YYYY-MM-DD)
     """
-    # Parse the date to create folder structure
-    try:
-        date_obj = datetime.strptime(target_date, '%Y-%m-%d')
-        year_month = date_obj.strftime('%Y-%m')
-        date_folder = date_obj.strftime('%Y-%m-%d')
-    except ValueError:
-        # If date parsing fails, use the date string as-is
-        year_month = target_date[:7] if len(target_date) >= 7 else target_date
-        date_folder = target_date
-    
-    # Create the folder structure
-    date_folder_path = Path(base_output_dir) / year_month / date_folder
+    date_folder_path = Path(base_output_dir) / target_date[:7] / target_date
     date_folder_path.mkdir(parents=True, exist_ok=True)
     
-    return str(date_folder_path), str(date_folder_path)
+    return str(date_folder_path)
 
 
-def generate_epic_summary(repo: str, issue_numbers: List[int], target_date: str, output_path: str) -> None:
+def _write_json_member(f, key: str, value, level: int) -> None:
+    """Write one indented '"key": value' member at the given nesting level"""
+    from github_mcp.utils.json_utils import dumpb
+    
+    # Encoded JSON only contains newlines as layout, so re-indenting is safe
+    pad = b'  ' * level
+    f.write(pad + dumpb(key) + b': ' + dumpb(value, indent=True).replace(b'\n', b'\n' + pad))
+
+
+def write_report(output_path: str, result: dict) -> None:
     """
-    Generate EPIC summary for the given issues and save to output file.
+    Write the report as indented JSON, streaming raw_epic_data['updates'].
+    
+    Updates are encoded one at a time so the encoded report is never held
+    in memory as a whole; peak usage is bounded by the largest update.
+    
+    Args:
+        output_path: Path to save the output report
+        result: Report built by generate_epic_summary
+    """
+    from github_mcp.utils.json_utils import dumpb
+    
+    with open(output_path, 'wb') as f:
+        f.write(b'{\n')
+        for i, (key, value) in enumerate(result.items()):
+            if i:
+                f.write(b',\n')
+            
+            if key != 'raw_epic_data' or not isinstance(value, dict) or not value.get('updates'):
+                _write_json_member(f, key, value, 1)
+                continue
+            
+            f.write(b'  "raw_epic_data": {\n')
+            for name, field in value.items():
+                if name != 'updates':
+                    _write_json_member(f, name, field, 2)
+                    f.write(b',\n')
+            f.write(b'    "updates": [\n')
+            for j, update in enumerate(value['updates']):
+                if j:
+                    f.write(b',\n')
+                f.write(b'      ' + dumpb(update, indent=True).replace(b'\n', b'\n      '))
+            f.write(b'\n    ]\n  }')
+        f.write(b'\n}')
+
+
+def _route(path: str, date_folder_path: str) -> str:
+    """
+    Place an output file in the date folder unless an explicit path was given.
+    
+    Absolute paths (including Windows drive paths) and paths starting with
+    './' are used as-is; anything else is reduced to its file name.
+    """
+    if os.path.isabs(path) or path.startswith(('./', '.' + os.sep)):
+        return path
+    return os.path.join(date_folder_path, os.path.basename(path))
+
+
+def cached_crawl(repo: str, issue_numbers: Sequence[int], use_cache: bool = True, cache_ttl: float = 0) -> dict:
+    """
+    Crawl specific issues, reusing cached GitHub responses where possible.
+    
+    Without GITHUB_TOKEN the issues are fetched over REST, and cached responses
+    are revalidated with their ETag, so unchanged issues come back as 304 Not
+    Modified without a body transfer. With a token they are fetched over
+    GraphQL, which has no ETags: cached responses are then only reused within
+    cache_ttl, so no cache is opened when cache_ttl is 0.
     
     Args:
         repo: Repository name in org/repo format
         issue_numbers: List of issue numbers to process
+        use_cache: Whether to use the on-disk response cache
+        cache_ttl: Seconds to reuse cached responses without revalidating them
+        
+    Returns:
+        EPIC data in the crawl_specific_issues format
+        
+    Raises:
+        CrawlError: If the issues could not be crawled
+    """
+    from github_mcp import GitHubIssueCrawler
+    from github_mcp.tools.github_tools import collect_issue_updates
+    from github_mcp.utils.http_cache import ResponseCache
+    
+    # A cache the crawl could never read from would only be written to
+    revalidates = not os.getenv('GITHUB_TOKEN')
+    cache = ResponseCache(ttl=cache_ttl) if use_cache and (revalidates or cache_ttl > 0) else None
+    try:
+        return collect_issue_updates(repo, issue_numbers, GitHubIssueCrawler(cache=cache))
+    finally:
+        if cache:
+            cache.close()
+
+
+def generate_epic_summary(repo: str, issue_numbers: Sequence[int], target_date: str, output_path: str,
+                          use_cache: bool = True, cache_ttl: float = 0) -> dict:
+    """
+    Generate EPIC summary for the given issues and save to output file.
+    
+    Args:
+        repo: Repository name in org/repo format
+        issue_numbers: Issue numbers to process, already deduplicated and sorted
         target_date: Target date for the summary
         output_path: Path to save the output report
+        use_cache: Whether to use the on-disk GitHub response cache
+        cache_ttl: Seconds to reuse cached responses without revalidating them
+        
+    Returns:
+        The combined report that was written to output_path
     """
+    from github_mcp import CrawlError, generate_board_report, generate_epic_status_summary
+    
     print(f"🔍 Processing {len(issue_numbers)} issues from {repo}")
     print(f"📅 Target date: {target_date}")
     print(f"💾 Output will be saved to: {output_path}")
     
-    # Convert issue numbers to comma-separated string
-    issues_str = ','.join(map(str, issue_numbers))
-    
     try:
         # Crawl specific issues to get EPIC updates
         print("📊 Crawling EPIC updates...")
-        epic_data = crawl_specific_issues(repo=repo, issue_numbers=issues_str)
-        
-        if isinstance(epic_data, str) and epic_data.startswith("Error"):
-            print(f"❌ Error crawling issues: {epic_data}")
+        try:
+            epic_data = cached_crawl(repo, issue_numbers, use_cache, cache_ttl)
+        except CrawlError as e:
+            print(f"❌ {e}")
             sys.exit(1)
         
         # Generate board report
@@ -183,7 +284,7 @@ def generate_epic_summary(repo: str, issue_numbers: List[int], target_date: str,
         result = {
             "repo": repo,
             "target_date": target_date,
-            "issue_numbers": issue_numbers,
+            "issue_numbers": list(issue_numbers),
             "generated_at": datetime.now().isoformat(),
             "board_report": board_report,
             "status_summary": status_summary,
@@ -191,11 +292,11 @@ def generate_epic_summary(repo: str, issue_numbers: List[int], target_date: str,
         }
         
         # Save to file
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=2)
+        write_report(output_path, result)
         
         print(f"✅ EPIC summary generated successfully!")
         print(f"📄 Report saved to: {output_path}")
+        return result
         
     except Exception as e:
         print(f"❌ Error generating EPIC summary: {e}")
@@ -204,6 +305,9 @@ def generate_epic_summary(repo: str, issue_numbers: List[int], target_date: str,
 
 def main():
     """Main CLI function."""
+    # Imported here so the parser is only built when the script runs as a CLI
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Generate EPIC summaries from GitHub issues. Reports are automatically organized in date-based folders (reports/YYYY-MM/YYYY-MM-DD/).",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -223,6 +327,9 @@ Examples:
   
   # Use absolute paths to override folder structure
   python epic_summary_generator.py --repo LDFLK/launch --date 2025-08-07 --output /absolute/path/report.json --issues 144
+  
+  # Bypass the GitHub response cache
+  python epic_summary_generator.py --repo LDFLK/launch --date 2025-08-07 --output report.json --issues 144 --no-cache
         """
     )
     
@@ -275,6 +382,20 @@ Examples:
         help='Path to save the LLM summary report (default: <output>.md). Will be placed in reports/YYYY-MM/YYYY-MM-DD/ folder unless absolute path is specified.'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not use the GitHub response cache (~/.cache/github_mcp/http_cache.sqlite)'
+    )
+    
+    parser.add_argument(
+        '--cache-ttl',
+        type=float,
+        default=0,
+        help='Seconds to reuse cached GitHub responses without revalidating them (default: 0, always revalidate via ETag). '
+             'With GITHUB_TOKEN set, issues are fetched over GraphQL, which cannot be revalidated, so the cache is only used when this is above 0.'
+    )
+    
     args = parser.parse_args()
     
     # Validate inputs
@@ -290,31 +411,23 @@ Examples:
         issue_numbers = parse_issue_numbers(args.issues)
     else:
         issue_numbers = read_issues_from_file(args.issues_file)
+    # Each issue only needs to be fetched once; sorting keeps the output deterministic
+    issue_numbers = array.array('i', sorted(set(issue_numbers)))
     
     if not issue_numbers:
         print("❌ No valid issue numbers found.")
         sys.exit(1)
     
     # Create date-based folder structure
-    date_folder_path, _ = create_date_folder_structure(target_date)
+    date_folder_path = create_date_folder_structure(target_date)
     
     # Update output paths to use the date folder
-    if not args.output.startswith('/') and not args.output.startswith('./'):
-        # If output is not an absolute path, place it in the date folder
-        output_filename = os.path.basename(args.output)
-        final_output_path = os.path.join(date_folder_path, output_filename)
-    else:
-        final_output_path = args.output
+    final_output_path = _route(args.output, date_folder_path)
     
     # Determine summary output path
     if args.generate_summary:
         if args.summary_output:
-            if not args.summary_output.startswith('/') and not args.summary_output.startswith('./'):
-                # If summary output is not an absolute path, place it in the date folder
-                summary_filename = os.path.basename(args.summary_output)
-                final_summary_path = os.path.join(date_folder_path, summary_filename)
-            else:
-                final_summary_path = args.summary_output
+            final_summary_path = _route(args.summary_output, date_folder_path)
         else:
             # Default summary output in the same date folder
             summary_filename = f"{os.path.splitext(os.path.basename(final_output_path))[0]}.md"
@@ -323,41 +436,40 @@ Examples:
     if args.verbose:
         print(f"🔍 Repository: {repo}")
         print(f"📅 Target date: {target_date}")
-        print(f"📋 Issue numbers: {issue_numbers}")
+        print(f"📋 Issue numbers: {issue_numbers.tolist()}")
         print(f"📁 Date folder: {date_folder_path}")
         print(f"💾 Output path: {final_output_path}")
         if args.generate_summary:
             print(f"📝 Summary output: {final_summary_path}")
     
     # Check if GitHub token is available
-    if not os.getenv('GITHUB_TOKEN'):
+    if not GITHUB_TOKEN:
         print("⚠️  Warning: GITHUB_TOKEN environment variable not set")
         print("   Set it with: export GITHUB_TOKEN='your-github-token'")
         print("   For public repositories, this may not be required.")
     
     # Check if DeepSeek token is available for summary generation
-    if args.generate_summary and not os.getenv('DEEPSEEK_API_KEY'):
+    if args.generate_summary and not DEEPSEEK_API_KEY:
         print("⚠️  Warning: DEEPSEEK_API_KEY environment variable not set")
         print("   Set it with: export DEEPSEEK_API_KEY='your-deepseek-api-key'")
         print("   Required for generating LLM-powered summaries.")
     
     # Generate the EPIC summary
-    generate_epic_summary(repo, issue_numbers, target_date, final_output_path)
+    result = generate_epic_summary(repo, issue_numbers, target_date, final_output_path,
+                                   use_cache=not args.no_cache, cache_ttl=args.cache_ttl)
     
     # Generate LLM summary if requested
     if args.generate_summary:
         print(f"🤖 Generating LLM-powered summary...")
         try:
-            # Read the generated JSON report
-            with open(final_output_path, 'r') as f:
-                report_data = json.load(f)
+            from github_mcp import generate_epic_summary_report
             
-            # Generate the summary
-            summary_report = generate_epic_summary_report(json.dumps(report_data))
+            # Generate the summary from the in-memory report; the tool accepts
+            # a dict as well as a JSON string, so no re-encoding is needed
+            summary_report = generate_epic_summary_report(result)
             
             # Save the summary
-            with open(final_summary_path, 'w') as f:
-                f.write(summary_report)
+            Path(final_summary_path).write_text(summary_report)
             
             print(f"✅ LLM summary saved to: {final_summary_path}")
         except Exception as e:
@@ -4,10 +4,49 @@ Base class for GitHub MCP EPIC examples.
 Contains common utilities and configuration used across all examples.
 """
 
+import io
 import os
+import sys
 import json
+import time
+import functools
+import contextlib
+from operator import itemgetter
 from typing import Dict, Any, Optional
 
+# GitHub token, read once when the examples are loaded
+GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
+
+# Rule printed above and below section headers
+SEPARATOR = "=" * 60
+
+# Fields always present in the update dicts returned by the tools
+UPDATE_FIELDS = itemgetter('issue_number', 'issue_title', 'author', 'created_at')
+PARSED_FIELDS = itemgetter('epic_name', 'status', 'progress')
+
+
+def report_errors(label: str):
+    """
+    Decorator for example methods: report an exception instead of raising it,
+    and print how long the example took
+    
+    Args:
+        label: Completes "Error ..." in the failure message
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                print(f"❌ Error {label}: {e}")
+                return None
+            finally:
+                print(f"⏱️  {func.__name__} took {time.perf_counter() - start:.2f}s")
+        return wrapper
+    return decorator
+
 
 class BaseExample:
     """Base class for all GitHub MCP EPIC examples"""
@@ -23,7 +62,7 @@ class BaseExample:
         # Default configuration
         self.repo_name = repo_name or "LDFLK/launch"
         self.github_url = github_url or "https://github.com/LDFLK/launch/issues/151"
-        self.github_token = os.getenv('GITHUB_TOKEN')
+        self.github_token = GITHUB_TOKEN
     
     def setup_github_token(self) -> bool:
         """Set up GitHub token for API access"""
@@ -38,15 +77,28 @@ class BaseExample:
             print("   4. Copy the token and set: export GITHUB_TOKEN='your-token'")
             return False
         
-        os.environ['GITHUB_TOKEN'] = self.github_token
         print("✅ GitHub token configured")
         return True
     
+    def emit(self, example, *args, **kwargs):
+        """
+        Run an example with its output buffered, then write it to stdout at once
+        
+        Args:
+            example: Example method to run
+            *args, **kwargs: Passed on to the example
+        """
+        buffer = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(buffer):
+                return example(*args, **kwargs)
+        finally:
+            sys.stdout.write(buffer.getvalue())
+            sys.stdout.flush()
+    
     def print_header(self, title: str):
         """Print a formatted header for examples"""
-        print("\n" + "="*60)
-        print(title)
-        print("="*60)
+        sys.stdout.write(f"\n{SEPARATOR}\n{title}\n{SEPARATOR}\n")
     
     def print_result_summary(self, result: Any, title: str = "Result Summary"):
         """Print a formatted result summary"""
@@ -63,34 +115,48 @@ class BaseExample:
     
     def _print_dict_summary(self, data: Dict[str, Any]):
         """Print a formatted dictionary summary"""
+        # Collect the lines and write them once rather than one print per line
+        lines = []
         if 'total_updates' in data:
-            print(f"📊 Found {data.get('total_updates', 0)} EPIC updates")
+            lines.append(f"📊 Found {data.get('total_updates', 0)} EPIC updates\n")
         
         if 'repo' in data:
-            print(f"📁 Repository: {data.get('repo', 'N/A')}")
+            lines.append(f"📁 Repository: {data.get('repo', 'N/A')}\n")
         
         if 'days_back' in data:
-            print(f"📅 Period: Last {data.get('days_back', 0)} days")
+            lines.append(f"📅 Period: Last {data.get('days_back', 0)} days\n")
         
         if 'issue_numbers' in data:
-            print(f"🔢 Issues checked: {data.get('issue_numbers', [])}")
+            lines.append(f"🔢 Issues checked: {data.get('issue_numbers', [])}\n")
+        
+        sys.stdout.write("".join(lines))
         
         if 'updates' in data:
             self._print_updates_summary(data['updates'])
     
     def _print_updates_summary(self, updates: list):
         """Print a summary of EPIC updates"""
+        # Build the whole summary first so it goes out in a single write
+        lines = []
         for i, update in enumerate(updates, 1):
-            print(f"\n📝 Update {i}:")
-            print(f"   Issue: #{update.get('issue_number', 'N/A')} - {update.get('issue_title', 'N/A')}")
-            print(f"   Author: {update.get('author', 'N/A')}")
-            print(f"   Date: {update.get('created_at', 'N/A')}")
+            number, title, author, created_at = UPDATE_FIELDS(update)
+            lines.append(
+                f"\n📝 Update {i}:\n"
+                f"   Issue: #{number} - {title}\n"
+                f"   Author: {author}\n"
+                f"   Date: {created_at}\n"
+            )
             
-            parsed_data = update.get('parsed_data', {})
+            parsed_data = update.get('parsed_data')
             if parsed_data:
-                print(f"   Epic: {parsed_data.get('epic_name', 'N/A')}")
-                print(f"   Status: {parsed_data.get('status', 'N/A')}")
-                print(f"   Progress: {parsed_data.get('progress', 'N/A')}")
+                epic_name, status, progress = PARSED_FIELDS(parsed_data)
+                lines.append(
+                    f"   Epic: {epic_name}\n"
+                    f"   Status: {status}\n"
+                    f"   Progress: {progress}\n"
+                )
+        
+        sys.stdout.write("".join(lines))
     
     def handle_result(self, result: Any, success_message: str = None) -> Optional[Dict]:
         """Handle and validate a result from API calls"""
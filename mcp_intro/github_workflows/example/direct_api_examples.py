@@ -4,13 +4,35 @@ Direct API examples for GitHub MCP EPIC tools.
 Demonstrates how to use the GitHubIssueCrawler directly for advanced use cases.
 """
 
-from base_example import BaseExample
-from github_mcp.tools.github_tools import GitHubIssueCrawler
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from base_example import BaseExample, report_errors
+from github_mcp.tools.github_tools import GitHubIssueCrawler, RateLimitError
+from github_mcp.utils import json_utils
+
+# Rough number of API requests spent per repository in bulk processing
+REQUESTS_PER_REPO = 6
+
+# Bulk processing writes one EPIC update per line to this file
+BULK_OUTPUT_PATH = "epic_updates.jsonl"
+
+# Repositories processed at once in bulk processing; each may fan out further
+# to fetch comments, so keep the product within GitHub's secondary rate limits
+BULK_MAX_REPOS_IN_FLIGHT = 8
 
 
 class DirectAPIExamples(BaseExample):
     """Examples for using the GitHubIssueCrawler directly"""
     
+    def __init__(self, repo_name: str = None, github_url: str = None, issue_crawler: Optional[GitHubIssueCrawler] = None):
+        super().__init__(repo_name, github_url)
+        # One crawler for all examples, so a resource fetched by one example is
+        # reused by the others instead of being requested again
+        self.issue_crawler = issue_crawler or GitHubIssueCrawler()
+    
     def run(self):
         """Run all direct API examples"""
         self.print_header("🔧 GitHub MCP EPIC Direct API Examples")
@@ -26,248 +48,256 @@ class DirectAPIExamples(BaseExample):
         self.example_issue_analysis()
         self.example_comment_filtering()
     
+    def _iter_epic_comments(self, crawler, comments):
+        """Yield (comment, parsed_data) for EPIC update comments, scanning each body once"""
+        for comment in comments:
+            if crawler.is_epic_update_comment(comment['body']):
+                yield comment, crawler.parse_epic_template(comment['body'])
+    
+    @report_errors("using GitHubIssueCrawler")
     def example_github_issue_crawler(self):
         """Example: Using GitHubIssueCrawler directly"""
         self.print_header("EXAMPLE 1: Using GitHubIssueCrawler Directly")
         
-        try:
-            # Create crawler instance
-            crawler = GitHubIssueCrawler()
+        # Create crawler instance
+        crawler = self.issue_crawler
+        
+        # Get issues from the repository
+        issues = crawler.get_issues(self.repo_name, state="open")
+        print(f"📋 Found {len(issues)} open issues")
+        
+        # Get comments from the first issue (if any)
+        if issues:
+            first_issue = issues[0]
+            print(f"🔍 Analyzing issue #{first_issue['number']}: {first_issue['title']}")
             
-            # Get issues from the repository
-            issues = crawler.get_issues(self.repo_name, state="open")
-            print(f"📋 Found {len(issues)} open issues")
+            comments = crawler.get_issue_comments(self.repo_name, first_issue['number'])
+            print(f"💬 Found {len(comments)} comments")
             
-            # Get comments from the first issue (if any)
-            if issues:
-                first_issue = issues[0]
-                print(f"🔍 Analyzing issue #{first_issue['number']}: {first_issue['title']}")
-                
-                comments = crawler.get_issue_comments(self.repo_name, first_issue['number'])
-                print(f"💬 Found {len(comments)} comments")
-                
-                # Check for EPIC updates
-                epic_comments = []
-                for comment in comments:
-                    if crawler.is_epic_update_comment(comment['body']):
-                        epic_comments.append(comment)
-                
-                print(f"🚀 Found {len(epic_comments)} EPIC update comments")
-                
-                # Parse the first EPIC update (if any)
-                if epic_comments:
-                    first_epic = epic_comments[0]
-                    parsed_data = crawler.parse_epic_template(first_epic['body'])
-                    
-                    if parsed_data:
-                        print(f"📊 Parsed EPIC Data:")
-                        print(f"   Epic: {parsed_data.epic_name}")
-                        print(f"   Status: {parsed_data.status}")
-                        print(f"   Progress: {parsed_data.progress}")
-                        print(f"   Owner: {parsed_data.owner}")
-                        print(f"   Date: {parsed_data.date}")
-                        print(f"   What happened: {len(parsed_data.what_happened)} items")
-                        print(f"   Risks/Blockers: {len(parsed_data.risks_blockers)} items")
-                        print(f"   Next steps: {len(parsed_data.next_steps)} items")
+            # Check for EPIC updates
+            epic_comments = []
+            for comment in comments:
+                if crawler.is_epic_update_comment(comment['body']):
+                    epic_comments.append(comment)
+            
+            print(f"🚀 Found {len(epic_comments)} EPIC update comments")
             
-        except Exception as e:
-            print(f"❌ Error using GitHubIssueCrawler: {e}")
+            # Parse the first EPIC update (if any)
+            if epic_comments:
+                first_epic = epic_comments[0]
+                parsed_data = crawler.parse_epic_template(first_epic['body'])
+                
+                if parsed_data:
+                    print(f"📊 Parsed EPIC Data:")
+                    print(f"   Epic: {parsed_data.epic_name}")
+                    print(f"   Status: {parsed_data.status}")
+                    print(f"   Progress: {parsed_data.progress}")
+                    print(f"   Owner: {parsed_data.owner}")
+                    print(f"   Date: {parsed_data.date}")
+                    print(f"   What happened: {len(parsed_data.what_happened)} items")
+                    print(f"   Risks/Blockers: {len(parsed_data.risks_blockers)} items")
+                    print(f"   Next steps: {len(parsed_data.next_steps)} items")
     
+    @report_errors("in custom EPIC extraction")
     def example_custom_epic_extraction(self):
         """Example: Custom EPIC extraction with filtering"""
         self.print_header("EXAMPLE 2: Custom EPIC Extraction with Filtering")
         
-        try:
-            crawler = GitHubIssueCrawler()
-            
-            # Get issues from the last 30 days
-            issues = crawler.get_issues(self.repo_name, state="open")
-            print(f"📋 Found {len(issues)} open issues")
-            
-            # Custom filtering logic
-            epic_updates = []
-            for issue in issues[:5]:  # Limit to first 5 issues for demo
-                print(f"\n🔍 Checking issue #{issue['number']}: {issue['title']}")
-                
-                comments = crawler.get_issue_comments(self.repo_name, issue['number'])
-                
-                for comment in comments:
-                    if crawler.is_epic_update_comment(comment['body']):
-                        parsed_data = crawler.parse_epic_template(comment['body'])
-                        
-                        if parsed_data:
-                            # Custom filtering: only include "On Track" or "At Risk" epics
-                            if parsed_data.status in ["On Track", "At Risk"]:
-                                epic_updates.append({
-                                    'issue_number': issue['number'],
-                                    'issue_title': issue['title'],
-                                    'epic_name': parsed_data.epic_name,
-                                    'status': parsed_data.status,
-                                    'progress': parsed_data.progress,
-                                    'owner': parsed_data.owner,
-                                    'date': parsed_data.date
-                                })
-                                print(f"   ✅ Found EPIC update: {parsed_data.epic_name} ({parsed_data.status})")
-            
-            print(f"\n📊 Summary: Found {len(epic_updates)} filtered EPIC updates")
-            for update in epic_updates:
-                print(f"   - #{update['issue_number']}: {update['epic_name']} ({update['status']})")
+        crawler = self.issue_crawler
+        
+        # Get the first 5 open issues with their comments in one request
+        issues_with_comments = crawler.get_issues_with_comments_graphql(self.repo_name, state="open", first=5)
+        print(f"📋 Checking {len(issues_with_comments)} open issues")
+        
+        # Custom filtering logic; output is collected and written once
+        epic_updates = []
+        lines = []
+        for issue, comments in issues_with_comments:
+            lines.append(f"\n🔍 Checking issue #{issue['number']}: {issue['title']}\n")
             
-        except Exception as e:
-            print(f"❌ Error in custom EPIC extraction: {e}")
+            for comment, parsed_data in self._iter_epic_comments(crawler, comments):
+                if parsed_data:
+                    # Custom filtering: only include "On Track" or "At Risk" epics
+                    if parsed_data.status in ["On Track", "At Risk"]:
+                        epic_updates.append({
+                            'issue_number': issue['number'],
+                            'issue_title': issue['title'],
+                            'epic_name': parsed_data.epic_name,
+                            'status': parsed_data.status,
+                            'progress': parsed_data.progress,
+                            'owner': parsed_data.owner,
+                            'date': parsed_data.date
+                        })
+                        lines.append(f"   ✅ Found EPIC update: {parsed_data.epic_name} ({parsed_data.status})\n")
+        
+        lines.append(f"\n📊 Summary: Found {len(epic_updates)} filtered EPIC updates\n")
+        for update in epic_updates:
+            lines.append(f"   - #{update['issue_number']}: {update['epic_name']} ({update['status']})\n")
+        sys.stdout.write("".join(lines))
     
+    @report_errors("in issue analysis")
     def example_issue_analysis(self):
         """Example: Detailed issue analysis"""
         self.print_header("EXAMPLE 3: Detailed Issue Analysis")
         
-        try:
-            crawler = GitHubIssueCrawler()
+        crawler = self.issue_crawler
+        
+        # Get a specific issue for detailed analysis, fetching its
+        # comments at the same time
+        issue_number = 1  # Example issue number
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            issue_future = executor.submit(crawler.get_issue, self.repo_name, issue_number)
+            comments_future = executor.submit(crawler.get_issue_comments, self.repo_name, issue_number)
+            issue = issue_future.result()
+        
+        if issue:
+            print(f"📋 Issue Analysis for #{issue['number']}")
+            print(f"   Title: {issue['title']}")
+            print(f"   State: {issue['state']}")
+            print(f"   Created: {issue['created_at']}")
+            print(f"   Updated: {issue['updated_at']}")
+            print(f"   Author: {issue['user']['login']}")
             
-            # Get a specific issue for detailed analysis
-            issue_number = 1  # Example issue number
-            issue = crawler.get_issue(self.repo_name, issue_number)
+            # Get all comments
+            comments = comments_future.result()
+            print(f"   Comments: {len(comments)}")
             
-            if issue:
-                print(f"📋 Issue Analysis for #{issue['number']}")
-                print(f"   Title: {issue['title']}")
-                print(f"   State: {issue['state']}")
-                print(f"   Created: {issue['created_at']}")
-                print(f"   Updated: {issue['updated_at']}")
-                print(f"   Author: {issue['user']['login']}")
-                
-                # Get all comments
-                comments = crawler.get_issue_comments(self.repo_name, issue_number)
-                print(f"   Comments: {len(comments)}")
-                
-                # Analyze comment types
-                epic_comments = []
-                regular_comments = []
-                
-                for comment in comments:
-                    if crawler.is_epic_update_comment(comment['body']):
-                        epic_comments.append(comment)
-                    else:
-                        regular_comments.append(comment)
-                
-                print(f"   EPIC updates: {len(epic_comments)}")
-                print(f"   Regular comments: {len(regular_comments)}")
-                
-                # Show recent activity
-                if comments:
-                    print(f"\n📅 Recent Activity:")
-                    for comment in comments[-3:]:  # Last 3 comments
-                        comment_type = "🚀 EPIC Update" if crawler.is_epic_update_comment(comment['body']) else "💬 Comment"
-                        print(f"   {comment_type} by {comment['user']['login']} on {comment['created_at'][:10]}")
-            else:
-                print(f"❌ Issue #{issue_number} not found")
+            # Analyze comment types; classify each comment once and reuse it below
+            is_epic = [crawler.is_epic_update_comment(comment['body']) for comment in comments]
+            epic_count = sum(is_epic)
+            
+            print(f"   EPIC updates: {epic_count}")
+            print(f"   Regular comments: {len(comments) - epic_count}")
             
-        except Exception as e:
-            print(f"❌ Error in issue analysis: {e}")
+            # Show recent activity
+            if comments:
+                lines = [f"\n📅 Recent Activity:\n"]
+                for comment, epic in zip(comments[-3:], is_epic[-3:]):  # Last 3 comments
+                    comment_type = "🚀 EPIC Update" if epic else "💬 Comment"
+                    lines.append(f"   {comment_type} by {comment['user']['login']} on {comment['created_at'][:10]}\n")
+                sys.stdout.write("".join(lines))
+        else:
+            print(f"❌ Issue #{issue_number} not found")
     
+    @report_errors("in comment filtering")
     def example_comment_filtering(self):
         """Example: Advanced comment filtering"""
         self.print_header("EXAMPLE 4: Advanced Comment Filtering")
         
-        try:
-            crawler = GitHubIssueCrawler()
-            
-            # Get issues and analyze comment patterns
-            issues = crawler.get_issues(self.repo_name, state="open")
-            print(f"📋 Analyzing {len(issues)} open issues")
-            
-            # Statistics
-            total_comments = 0
-            total_epic_updates = 0
-            epic_authors = set()
-            epic_statuses = {}
+        crawler = self.issue_crawler
+        
+        # Get issues and analyze comment patterns
+        issues = crawler.get_issues(self.repo_name, state="open")
+        print(f"📋 Analyzing {len(issues)} open issues")
+        
+        # Statistics
+        total_comments = 0
+        total_epic_updates = 0
+        epic_authors = set()
+        parsed_updates = []
+        
+        # Fetch comments for the selected issues concurrently
+        selected_issues = issues[:10]  # Limit for demo
+        all_comments = crawler.get_comments_for_issues(self.repo_name, [issue['number'] for issue in selected_issues])
+        
+        for comments in all_comments:
+            total_comments += len(comments)
             
-            for issue in issues[:10]:  # Limit for demo
-                comments = crawler.get_issue_comments(self.repo_name, issue['number'])
-                total_comments += len(comments)
+            for comment, parsed_data in self._iter_epic_comments(crawler, comments):
+                total_epic_updates += 1
+                epic_authors.add(comment['user']['login'])
                 
-                for comment in comments:
-                    if crawler.is_epic_update_comment(comment['body']):
-                        total_epic_updates += 1
-                        epic_authors.add(comment['user']['login'])
-                        
-                        parsed_data = crawler.parse_epic_template(comment['body'])
-                        if parsed_data:
-                            status = parsed_data.status
-                            epic_statuses[status] = epic_statuses.get(status, 0) + 1
-            
-            # Print statistics
-            print(f"\n📊 Comment Analysis Summary:")
-            print(f"   Total comments analyzed: {total_comments}")
-            print(f"   EPIC updates found: {total_epic_updates}")
-            print(f"   EPIC update authors: {len(epic_authors)}")
-            print(f"   Authors: {', '.join(sorted(epic_authors))}")
-            
-            print(f"\n📈 EPIC Status Distribution:")
-            for status, count in epic_statuses.items():
-                print(f"   {status}: {count}")
-            
-        except Exception as e:
-            print(f"❌ Error in comment filtering: {e}")
+                if parsed_data:
+                    parsed_updates.append(parsed_data)
+        
+        epic_statuses = Counter(parsed.status for parsed in parsed_updates)
+        
+        # Print statistics
+        print(f"\n📊 Comment Analysis Summary:")
+        print(f"   Total comments analyzed: {total_comments}")
+        print(f"   EPIC updates found: {total_epic_updates}")
+        print(f"   EPIC update authors: {len(epic_authors)}")
+        print(f"   Authors: {', '.join(sorted(epic_authors))}")
+        
+        lines = [f"\n📈 EPIC Status Distribution:\n"]
+        for status, count in epic_statuses.items():
+            lines.append(f"   {status}: {count}\n")
+        sys.stdout.write("".join(lines))
     
+    def _collect_repo_epic_updates(self, crawler, repo):
+        """Fetch the open issues of a repository and return (issue_count, epic_update_records)"""
+        # Get open issues and their comments in a single GraphQL request
+        issues_with_comments = crawler.get_issues_with_comments_graphql(repo, state="open")
+        records = [
+            {
+                'repo': repo,
+                'issue_number': issue['number'],
+                'issue_title': issue['title'],
+                'author': comment['user']['login'],
+                'created_at': comment['created_at']
+            }
+            for issue, comments in issues_with_comments
+            for comment in comments
+            if crawler.is_epic_update_comment(comment['body'])
+        ]
+        return len(issues_with_comments), records
+    
+    @report_errors("in bulk processing")
     def example_bulk_processing(self):
         """Example: Bulk processing of multiple repositories"""
         self.print_header("EXAMPLE 5: Bulk Processing Multiple Repositories")
         
-        try:
-            crawler = GitHubIssueCrawler()
-            
-            # Example repositories to process
-            repositories = [
-                self.repo_name,
-                "octocat/Hello-World",
-                # Add more repositories as needed
-            ]
-            
-            all_epic_updates = []
+        crawler = self.issue_crawler
+        
+        # Example repositories to process
+        repositories = [
+            self.repo_name,
+            "octocat/Hello-World",
+            # Add more repositories as needed
+        ]
+        
+        # EPIC updates per repository; the updates themselves are streamed to disk
+        repo_stats = Counter()
+        
+        # Wait for the quota once up front rather than failing midway
+        if crawler.remaining() < len(repositories) * REQUESTS_PER_REPO:
+            print(f"   ⏳ Only {crawler.remaining()} API requests left, waiting for the rate limit to reset...")
+            crawler.sleep_until_reset()
+        
+        # Repositories are independent, so fetch them concurrently and
+        # report the results in the order listed
+        workers = min(len(repositories), BULK_MAX_REPOS_IN_FLIGHT)
+        with ThreadPoolExecutor(max_workers=workers) as executor, \
+                open(BULK_OUTPUT_PATH, 'wb') as output:
+            futures = [executor.submit(self._collect_repo_epic_updates, crawler, repo) for repo in repositories]
             
-            for repo in repositories:
+            for repo, future in zip(repositories, futures):
                 print(f"\n🔍 Processing repository: {repo}")
                 
                 try:
-                    # Get issues from the repository
-                    issues = crawler.get_issues(repo, state="open")
-                    print(f"   Found {len(issues)} open issues")
+                    issue_count, records = future.result()
+                    print(f"   Found {issue_count} open issues")
                     
-                    repo_epic_updates = 0
+                    for record in records:
+                        output.write(json_utils.dumpb(record) + b'\n')
+                    repo_stats[repo] += len(records)
                     
-                    for issue in issues[:5]:  # Limit per repo for demo
-                        comments = crawler.get_issue_comments(repo, issue['number'])
-                        
-                        for comment in comments:
-                            if crawler.is_epic_update_comment(comment['body']):
-                                repo_epic_updates += 1
-                                all_epic_updates.append({
-                                    'repo': repo,
-                                    'issue_number': issue['number'],
-                                    'issue_title': issue['title'],
-                                    'author': comment['user']['login'],
-                                    'created_at': comment['created_at']
-                                })
-                    
-                    print(f"   Found {repo_epic_updates} EPIC updates")
+                    print(f"   Found {len(records)} EPIC updates")
                     
+                except RateLimitError as e:
+                    # Remaining repositories would fail the same way
+                    print(f"   ❌ {e}")
+                    for pending in futures:
+                        pending.cancel()
+                    break
                 except Exception as e:
                     print(f"   ❌ Error processing {repo}: {e}")
-            
-            print(f"\n📊 Bulk Processing Summary:")
-            print(f"   Total EPIC updates across all repositories: {len(all_epic_updates)}")
-            
-            # Group by repository
-            repo_stats = {}
-            for update in all_epic_updates:
-                repo = update['repo']
-                repo_stats[repo] = repo_stats.get(repo, 0) + 1
-            
-            for repo, count in repo_stats.items():
-                print(f"   {repo}: {count} EPIC updates")
-            
-        except Exception as e:
-            print(f"❌ Error in bulk processing: {e}")
+        
+        print(f"\n📊 Bulk Processing Summary:")
+        print(f"   Total EPIC updates across all repositories: {repo_stats.total()}")
+        print(f"   Updates written to: {BULK_OUTPUT_PATH}")
+        
+        sys.stdout.write("".join(f"   {repo}: {count} EPIC updates\n" for repo, count in repo_stats.items()))
 
 
 if __name__ == "__main__":
@@ -5,8 +5,9 @@ This script shows various ways to interact with GitHub EPIC updates using the gi
 """
 
 import os
-import json
+import sys
 from datetime import datetime, timedelta
+from operator import itemgetter
 
 # Import the GitHub MCP tools
 from github_mcp.tools.github_tools import (
@@ -24,6 +25,10 @@ GITHUB_URL = "https://github.com/LDFLK/launch/issues/151"
 REPO_NAME = "LDFLK/launch"  # Change this to your own repository
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
 
+# Fields always present in the update dicts returned by the tools
+UPDATE_FIELDS = itemgetter('issue_number', 'issue_title', 'author', 'created_at')
+PARSED_FIELDS = itemgetter('epic_name', 'status', 'progress')
+
 # Alternative repositories for testing:
 # REPO_NAME = "your-username/your-repo"  # Your own repository
 # REPO_NAME = "microsoft/vscode"  # Public repository for testing
@@ -41,7 +46,6 @@ def setup_github_token():
         print("   4. Copy the token and set: export GITHUB_TOKEN='your-token'")
         return False
     
-    os.environ['GITHUB_TOKEN'] = GITHUB_TOKEN
     print("✅ GitHub token configured")
     return True
 
@@ -70,18 +74,27 @@ def example_crawl_epic_updates():
             print(f"📅 Period: Last {result.get('days_back', 0)} days")
             
             # Display each update
+            # Collect the lines and write them once rather than one print per line
             updates = result.get('updates', [])
+            lines = []
             for i, update in enumerate(updates, 1):
-                print(f"\n📝 Update {i}:")
-                print(f"   Issue: #{update.get('issue_number', 'N/A')} - {update.get('issue_title', 'N/A')}")
-                print(f"   Author: {update.get('author', 'N/A')}")
-                print(f"   Date: {update.get('created_at', 'N/A')}")
+                number, title, author, created_at = UPDATE_FIELDS(update)
+                lines.append(
+                    f"\n📝 Update {i}:\n"
+                    f"   Issue: #{number} - {title}\n"
+                    f"   Author: {author}\n"
+                    f"   Date: {created_at}\n"
+                )
                 
-                parsed_data = update.get('parsed_data', {})
+                parsed_data = update.get('parsed_data')
                 if parsed_data:
-                    print(f"   Epic: {parsed_data.get('epic_name', 'N/A')}")
-                    print(f"   Status: {parsed_data.get('status', 'N/A')}")
-                    print(f"   Progress: {parsed_data.get('progress', 'N/A')}")
+                    epic_name, status, progress = PARSED_FIELDS(parsed_data)
+                    lines.append(
+                        f"   Epic: {epic_name}\n"
+                        f"   Status: {status}\n"
+                        f"   Progress: {progress}\n"
+                    )
+            sys.stdout.write("".join(lines))
             
             return result
         else:
@@ -120,18 +133,27 @@ def example_crawl_specific_issues():
             print(f"🔢 Issues checked: {result.get('issue_numbers', [])}")
             
             # Display each update
+            # Collect the lines and write them once rather than one print per line
             updates = result.get('updates', [])
+            lines = []
             for i, update in enumerate(updates, 1):
-                print(f"\n📝 Update {i}:")
-                print(f"   Issue: #{update.get('issue_number', 'N/A')} - {update.get('issue_title', 'N/A')}")
-                print(f"   Author: {update.get('author', 'N/A')}")
-                print(f"   Date: {update.get('created_at', 'N/A')}")
+                number, title, author, created_at = UPDATE_FIELDS(update)
+                lines.append(
+                    f"\n📝 Update {i}:\n"
+                    f"   Issue: #{number} - {title}\n"
+                    f"   Author: {author}\n"
+                    f"   Date: {created_at}\n"
+                )
                 
-                parsed_data = update.get('parsed_data', {})
+                parsed_data = update.get('parsed_data')
                 if parsed_data:
-                    print(f"   Epic: {parsed_data.get('epic_name', 'N/A')}")
-                    print(f"   Status: {parsed_data.get('status', 'N/A')}")
-                    print(f"   Progress: {parsed_data.get('progress', 'N/A')}")
+                    epic_name, status, progress = PARSED_FIELDS(parsed_data)
+                    lines.append(
+                        f"   Epic: {epic_name}\n"
+                        f"   Status: {status}\n"
+                        f"   Progress: {progress}\n"
+                    )
+            sys.stdout.write("".join(lines))
             
             return result
         else:
@@ -275,33 +297,34 @@ def example_github_issue_crawler():
         print(f"📋 Found {len(issues)} open issues\n\n")
         print("="*60)
         
-        # Get comments from the first issue (if any)
+        # Get comments from the first issues (if any), fetched concurrently
         if issues:
-            first_issue = issues[0]
-            print(f"🔍 Analyzing issue #{first_issue['number']}: {first_issue['title']}")
-            
-            comments = crawler.get_issue_comments(REPO_NAME, first_issue['number'])
-            print(f"💬 Found {len(comments)} comments")
-            
-            # Check for EPIC updates
-            epic_comments = []
-            for comment in comments:
-                if crawler.is_epic_update_comment(comment['body']):
-                    epic_comments.append(comment)
-            
-            print(f"🚀 Found {len(epic_comments)} EPIC update comments")
+            selected_issues = issues[:10]  # Limit for demo
+            all_comments = crawler.get_comments_for_issues(REPO_NAME, [issue['number'] for issue in selected_issues])
             
-            # Parse the first EPIC update (if any)
-            if epic_comments:
-                first_epic = epic_comments[0]
-                parsed_data = crawler.parse_epic_template(first_epic['body'])
+            for issue, comments in zip(selected_issues, all_comments):
+                print(f"🔍 Analyzing issue #{issue['number']}: {issue['title']}")
+                print(f"💬 Found {len(comments)} comments")
                 
-                if parsed_data:
-                    print(f"📊 Parsed EPIC Data:")
-                    print(f"   Epic: {parsed_data.epic_name}")
-                    print(f"   Status: {parsed_data.status}")
-                    print(f"   Progress: {parsed_data.progress}")
-                    print(f"   Owner: {parsed_data.owner}")
+                # Check for EPIC updates
+                epic_comments = []
+                for comment in comments:
+                    if crawler.is_epic_update_comment(comment['body']):
+                        epic_comments.append(comment)
+                
+                print(f"🚀 Found {len(epic_comments)} EPIC update comments")
+                
+                # Parse the first EPIC update (if any)
+                if epic_comments:
+                    first_epic = epic_comments[0]
+                    parsed_data = crawler.parse_epic_template(first_epic['body'])
+                    
+                    if parsed_data:
+                        print(f"📊 Parsed EPIC Data:")
+                        print(f"   Epic: {parsed_data.epic_name}")
+                        print(f"   Status: {parsed_data.status}")
+                        print(f"   Progress: {parsed_data.progress}")
+                        print(f"   Owner: {parsed_data.owner}")
         
     except Exception as e:
         print(f"❌ Error using GitHubIssueCrawler: {e}")
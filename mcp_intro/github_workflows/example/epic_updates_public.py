@@ -5,8 +5,9 @@ This script shows how to test the functionality without needing access to privat
 """
 
 import os
-import json
+import sys
 from datetime import datetime, timedelta
+from operator import itemgetter
 
 # Import the GitHub MCP tools
 from github_mcp.tools.github_tools import (
@@ -24,6 +25,9 @@ PUBLIC_REPO_NAME = "LDFLK/archives"  # Well-known public repository
 PUBLIC_ISSUE_URL = "https://github.com/LDFLK/archives/issues/1"  # Example issue
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
 
+# Fields always present in the update dicts returned by the tools
+UPDATE_FIELDS = itemgetter('issue_number', 'issue_title', 'author', 'created_at')
+
 def setup_github_token():
     """Set up GitHub token for API access"""
     if not GITHUB_TOKEN:
@@ -38,7 +42,6 @@ def setup_github_token():
         print("\n💡 Note: For public repositories, you can use a token with minimal permissions")
         return False
     
-    os.environ['GITHUB_TOKEN'] = GITHUB_TOKEN
     print("✅ GitHub token configured")
     return True
 
@@ -91,12 +94,18 @@ def example_crawl_public_repository():
             print(f"📅 Period: Since {result.get('start_date', 'N/A')}")
             
             # Display each update
+            # Collect the lines and write them once rather than one print per line
             updates = result.get('updates', [])
+            lines = []
             for i, update in enumerate(updates, 1):
-                print(f"\n📝 Update {i}:")
-                print(f"   Issue: #{update.get('issue_number', 'N/A')} - {update.get('issue_title', 'N/A')}")
-                print(f"   Author: {update.get('author', 'N/A')}")
-                print(f"   Date: {update.get('created_at', 'N/A')}")
+                number, title, author, created_at = UPDATE_FIELDS(update)
+                lines.append(
+                    f"\n📝 Update {i}:\n"
+                    f"   Issue: #{number} - {title}\n"
+                    f"   Author: {author}\n"
+                    f"   Date: {created_at}\n"
+                )
+            sys.stdout.write("".join(lines))
             
             return result
         else:
@@ -146,30 +155,31 @@ def example_github_issue_crawler_direct():
         issues = crawler.get_issues(PUBLIC_REPO_NAME, state="open", since="2024-01-01")
         print(f"📋 Found {len(issues)} open issues since 2024-01-01")
         
-        # Get comments from the first issue (if any)
+        # Get comments from the first issues (if any), fetched concurrently
         if issues:
-            first_issue = issues[0]
-            print(f"🔍 Analyzing issue #{first_issue['number']}: {first_issue['title'][:50]}...")
-            
-            comments = crawler.get_issue_comments(PUBLIC_REPO_NAME, first_issue['number'])
-            print(f"💬 Found {len(comments)} comments")
-            
-            # Check for EPIC updates (unlikely in this repo, but good for testing)
-            epic_comments = []
-            for comment in comments:
-                if crawler.is_epic_update_comment(comment['body']):
-                    epic_comments.append(comment)
-            
-            print(f"🚀 Found {len(epic_comments)} EPIC update comments")
+            selected_issues = issues[:10]  # Limit for demo
+            all_comments = crawler.get_comments_for_issues(PUBLIC_REPO_NAME, [issue['number'] for issue in selected_issues])
             
-            # Show sample comment structure
-            if comments:
-                print(f"\n📝 Sample comment structure:")
-                sample_comment = comments[0]
-                print(f"   ID: {sample_comment['id']}")
-                print(f"   Author: {sample_comment['user']['login']}")
-                print(f"   Created: {sample_comment['created_at']}")
-                print(f"   Body length: {len(sample_comment['body'])} characters")
+            for issue, comments in zip(selected_issues, all_comments):
+                print(f"🔍 Analyzing issue #{issue['number']}: {issue['title'][:50]}...")
+                print(f"💬 Found {len(comments)} comments")
+                
+                # Check for EPIC updates (unlikely in this repo, but good for testing)
+                epic_comments = []
+                for comment in comments:
+                    if crawler.is_epic_update_comment(comment['body']):
+                        epic_comments.append(comment)
+                
+                print(f"🚀 Found {len(epic_comments)} EPIC update comments")
+                
+                # Show sample comment structure
+                if comments:
+                    print(f"\n📝 Sample comment structure:")
+                    sample_comment = comments[0]
+                    print(f"   ID: {sample_comment['id']}")
+                    print(f"   Author: {sample_comment['user']['login']}")
+                    print(f"   Created: {sample_comment['created_at']}")
+                    print(f"   Body length: {len(sample_comment['body'])} characters")
         
     except Exception as e:
         print(f"❌ Error using GitHubIssueCrawler: {e}")
@@ -6,22 +6,43 @@ Orchestrates all example classes and provides a clean interface.
 
 import sys
 import argparse
+from functools import cached_property
 from typing import List, Optional
 
 from base_example import BaseExample
-from crawling_examples import CrawlingExamples
-from report_examples import ReportExamples
-from direct_api_examples import DirectAPIExamples
 
 
 class MainRunner(BaseExample):
     """Main runner that orchestrates all example classes"""
     
-    def __init__(self, repo_name: str = None, github_url: str = None):
-        super().__init__(repo_name, github_url)
-        self.crawler = CrawlingExamples(repo_name, github_url)
-        self.reporter = ReportExamples(repo_name, github_url)
-        self.api_examples = DirectAPIExamples(repo_name, github_url)
+    # The example classes pull in github_mcp (and with it requests and pandas),
+    # so they are imported and built on first use; --list never loads them
+    
+    @cached_property
+    def crawler(self):
+        from crawling_examples import CrawlingExamples
+        return CrawlingExamples(self.repo_name, self.github_url)
+    
+    @cached_property
+    def reporter(self):
+        from report_examples import ReportExamples
+        return ReportExamples(self.repo_name, self.github_url)
+    
+    @cached_property
+    def issue_crawler(self):
+        """Crawler shared by the direct API examples; responses are memoized per crawler"""
+        from github_mcp.tools.github_tools import GitHubIssueCrawler
+        return GitHubIssueCrawler()
+    
+    @cached_property
+    def api_examples(self):
+        from direct_api_examples import DirectAPIExamples
+        return DirectAPIExamples(self.repo_name, self.github_url, self.issue_crawler)
+    
+    def clear_cache(self):
+        """Forget GitHub responses fetched so far so the next examples refetch them"""
+        if 'issue_crawler' in self.__dict__:
+            self.issue_crawler.clear_cache()
     
     def run_all_examples(self):
         """Run all examples in sequence"""
@@ -33,21 +54,15 @@ class MainRunner(BaseExample):
             print("   Set GITHUB_TOKEN environment variable to enable full functionality")
         
         # Run crawling examples and get data for reports
-        print("\n" + "="*60)
-        print("STEP 1: Crawling Examples")
-        print("="*60)
+        self.print_header("STEP 1: Crawling Examples")
         epic_data = self.crawler.run()
         
         # Run report examples with the crawled data
-        print("\n" + "="*60)
-        print("STEP 2: Report Generation Examples")
-        print("="*60)
+        self.print_header("STEP 2: Report Generation Examples")
         self.reporter.run(epic_data)
         
         # Run direct API examples
-        print("\n" + "="*60)
-        print("STEP 3: Direct API Examples")
-        print("="*60)
+        self.print_header("STEP 3: Direct API Examples")
         self.api_examples.run()
         
         # Print completion message
@@ -92,6 +107,8 @@ class MainRunner(BaseExample):
                 self.reporter.example_generate_epic_status_summary(sample_data)
             elif example_name == "trends":
                 self.reporter.example_analyze_epic_trends(sample_data)
+            elif example_name == "all_reports":
+                self.reporter.example_generate_all_reports(sample_data)
             elif example_name == "dated_update":
                 self.reporter.example_process_dated_epic_update()
             else:
@@ -116,9 +133,7 @@ class MainRunner(BaseExample):
     
     def print_completion_message(self):
         """Print completion message with tips"""
-        print("\n" + "="*60)
-        print("✅ All examples completed!")
-        print("="*60)
+        self.print_header("✅ All examples completed!")
         self.print_tips()
     
     def list_available_examples(self):
@@ -133,6 +148,7 @@ class MainRunner(BaseExample):
         print("   - board_report: Generate board report")
         print("   - status_summary: Generate EPIC status summary")
         print("   - trends: Analyze EPIC trends")
+        print("   - all_reports: Generate all three reports in one pass")
         print("   - dated_update: Process dated EPIC update")
         
         print("\n🔧 API Examples:")
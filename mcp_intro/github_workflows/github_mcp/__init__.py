@@ -8,42 +8,73 @@ __version__ = "0.1.0"
 __author__ = " Vibhatha Abeykoon"
 __email__ = "vibhatha@gmail.com"
 
-# Import main modules for easier access
-from .tools.github_tools import (
-    GitHubIssueCrawler,
-    EpicUpdate,
-    ParsedEpicData,
-    crawl_epic_updates,
-    crawl_specific_issues,
-    get_epic_updates_from_issue,
-    process_dated_epic_update,
-    generate_board_report,
-    generate_epic_status_summary,
-    analyze_epic_trends
-)
-
-# Import CSV and Parquet functions
-from .tools.csv_tools import summarize_csv_file, read_csv_file
-from .tools.parquet_tools import summarize_parquet_file, read_parquet_file
-
-# Import Reporting functions
-from .tools.reporting_tools import (
-    generate_epic_summary_report,
-    generate_individual_epic_summary,
-    generate_project_overview_summary
-)
+import importlib
+
+# Public names and the modules that define them. They are imported on first
+# access (PEP 562) so that `import github_mcp` does not load pandas, pyarrow
+# and requests for callers that only need some of the tools
+_LAZY_IMPORTS = {
+    # GitHub EPIC tools
+    'GitHubIssueCrawler': '.tools.github_tools',
+    'CrawlError': '.tools.github_tools',
+    'RateLimitError': '.tools.github_tools',
+    'EpicUpdate': '.tools.github_tools',
+    'ParsedEpicData': '.tools.github_tools',
+    'crawl_epic_updates': '.tools.github_tools',
+    'crawl_epic_updates_metadata_only': '.tools.github_tools',
+    'crawl_specific_issues': '.tools.github_tools',
+    'get_epic_updates_from_issue': '.tools.github_tools',
+    'process_dated_epic_update': '.tools.github_tools',
+    'process_dated_epic_update_result': '.tools.github_tools',
+    'DatedEpicResult': '.tools.github_tools',
+    'generate_board_report': '.tools.github_tools',
+    'generate_epic_status_summary': '.tools.github_tools',
+    'analyze_epic_trends': '.tools.github_tools',
+    'generate_all_reports': '.tools.github_tools',
+    # CSV and Parquet functions
+    'summarize_csv_file': '.tools.csv_tools',
+    'read_csv_file': '.tools.csv_tools',
+    'summarize_parquet_file': '.tools.parquet_tools',
+    'read_parquet_file': '.tools.parquet_tools',
+    # Reporting functions
+    'generate_epic_summary_report': '.tools.reporting_tools',
+    'generate_individual_epic_summary': '.tools.reporting_tools',
+    'generate_project_overview_summary': '.tools.reporting_tools',
+}
+
+
+def __getattr__(name):
+    """Import a public name from its module on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Later lookups find the attribute directly and skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the not yet imported public names"""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     'GitHubIssueCrawler',
+    'CrawlError',
+    'RateLimitError',
     'EpicUpdate', 
     'ParsedEpicData',
     'crawl_epic_updates',
+    'crawl_epic_updates_metadata_only',
     'crawl_specific_issues',
     'get_epic_updates_from_issue',
     'process_dated_epic_update',
+    'process_dated_epic_update_result',
+    'DatedEpicResult',
     'generate_board_report',
     'generate_epic_status_summary',
     'analyze_epic_trends',
+    'generate_all_reports',
     'summarize_csv_file',
     'read_csv_file',
     'summarize_parquet_file',
@@ -14,13 +14,20 @@ except ImportError:
             return decorator
     mcp = DummyMCP()
 
-from ..utils.file_reader import read_csv_summary
-import pandas as pd
+from ..utils.file_reader import (
+    read_csv_summary, open_csv_batches, resolve_data_file, slice_batches, format_batches_text
+)
+from typing import Iterable, Optional
 from pathlib import Path
-import os
+import pyarrow as pa
+import pyarrow.parquet as pq
+import base64
 
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
-EXTERNAL_DATA_DIR = os.getenv('EXTERNAL_DATA_DIR')
+DATA_DIR_STR = str(DATA_DIR)
+
+# Values accepted by read_csv_file's output_format
+CSV_OUTPUT_FORMATS = ("text", "arrow", "parquet")
 
 @mcp.tool()
 def summarize_csv_file(filename: str) -> str:
@@ -35,14 +42,49 @@ def summarize_csv_file(filename: str) -> str:
 
 
 @mcp.tool()
-def read_csv_file(filename: str) -> str:
+def read_csv_file(filename: str, output_format: str = "text", offset: int = 0, limit: Optional[int] = None) -> str:
     """
     Read a CSV file and return the contents.
     Args:
         filename: Name of the CSV file in the /data directory (e.g., 'sample.csv')
+        output_format: 'text' for a formatted table, 'arrow' for a base64-encoded
+            Arrow IPC stream, or 'parquet' for base64-encoded zstd Parquet
+        offset: Number of data rows to skip (default: 0)
+        limit: Maximum number of rows to return (default: all); page through
+            large files with offset/limit to keep each response small
     Returns:
-        A string describing the file's contents.
+        A string describing the file's contents, or the base64-encoded file in
+        the requested binary format.
     """
-    file_path = DATA_DIR / filename
-    df = pd.read_csv(file_path)
-    return df.to_string()
\ No newline at end of file
+    if output_format not in CSV_OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output_format {output_format!r}, expected one of {CSV_OUTPUT_FORMATS}")
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must not be negative")
+    file_path = resolve_data_file(DATA_DIR_STR, filename)
+    # Outputs are not cached: they can be as large as the file, and the
+    # long-lived server would keep every one of them in memory
+    reader = open_csv_batches(file_path)
+    batches = slice_batches(reader, offset, limit)
+    if output_format == "arrow":
+        return _encode_arrow(reader.schema, batches)
+    elif output_format == "parquet":
+        return _encode_parquet(reader.schema, batches)
+    return format_batches_text(batches, reader.schema, offset)
+
+
+def _encode_arrow(schema: pa.Schema, batches: Iterable[pa.RecordBatch]) -> str:
+    """Write CSV record batches as a base64-encoded Arrow IPC stream"""
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode('ascii')
+
+
+def _encode_parquet(schema: pa.Schema, batches: Iterable[pa.RecordBatch]) -> str:
+    """Write CSV record batches as a base64-encoded, zstd-compressed Parquet file"""
+    sink = pa.BufferOutputStream()
+    with pq.ParquetWriter(sink, schema, compression='zstd') as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode('ascii')
\ No newline at end of file
@@ -2,10 +2,27 @@
 
 import os
 import re
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+import sys
+import json
+import hashlib
+import logging
+import time
+import threading
+from typing import List, Dict, Optional, Tuple, Union
+from datetime import datetime, timedelta, time as dt_time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..utils import json_utils
+from ..utils.http_cache import ResponseCache, cache_from_env
+
+logger = logging.getLogger(__name__)
 
 # Try to import MCP server, but make it optional
 try:
@@ -21,7 +38,128 @@ except ImportError:
             return decorator
     mcp = DummyMCP()
 
-@dataclass
+# Issues of a repository with their first comments, fetched in one round trip
+ISSUES_WITH_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $states: [IssueState!]) {
+  repository(owner: $owner, name: $name) {
+    issues(first: $first, states: $states, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number
+        title
+        comments(first: $first) {
+          pageInfo { hasNextPage }
+          nodes { databaseId body author { login } createdAt }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Issues updated since a date with their first comments, one page per request
+ISSUES_SINCE_QUERY = """
+query($owner: String!, $name: String!, $since: DateTime, $states: [IssueState!], $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $cursor, states: $states, filterBy: {since: $since}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        number
+        title
+        comments(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { databaseId body author { login } createdAt }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Pull requests, most recently updated first, with their first comments. The
+# connection has no "since" filter, so pages are read until one is too old.
+PULL_REQUESTS_SINCE_QUERY = """
+query($owner: String!, $name: String!, $states: [PullRequestState!], $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, after: $cursor, states: $states, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        number
+        title
+        updatedAt
+        comments(first: 100) {
+          pageInfo { hasNextPage }
+          nodes { databaseId body author { login } createdAt }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Fields selected for each issue (or pull request) fetched by number
+ISSUE_FIELDS = """
+number
+title
+comments(first: 100) {
+  pageInfo { hasNextPage }
+  nodes { databaseId body author { login } createdAt }
+}
+"""
+
+# Issues looked up by number per aliased GraphQL query
+GRAPHQL_BATCH_SIZE = 50
+
+# Section headings of the EPIC update template and the ParsedEpicData list each fills
+EPIC_SECTIONS = {
+    '### What happened since last update': 'what_happened',
+    '### Scope changes': 'scope_changes',
+    '### Risks / blockers': 'risks_blockers',
+    '### Next steps (with owners & dates)': 'next_steps',
+    '### Metrics / deliverables': 'metrics_deliverables',
+}
+
+# Field markers of the EPIC update template and the ParsedEpicData field each sets
+EPIC_FIELDS = {
+    '**Date:**': 'date',
+    '**Owner:**': 'owner',
+    '**Epic:**': 'epic_name',
+    '- **Current status:**': 'status',
+    '- **Progress (%):**': 'progress',
+}
+
+# Classifies template lines in a single scan: a field marker with its value, a
+# section heading on its own, or a "- " bullet. Leading whitespace is ignored.
+EPIC_LINE_RE = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<field>' + '|'.join(map(re.escape, EPIC_FIELDS)) + r')(?P<value>.*)'
+    r'|(?P<section>' + '|'.join(map(re.escape, EPIC_SECTIONS)) + r')[ \t\r]*$'
+    r'|- [ \t]*(?P<item>\S.*))',
+    re.M
+)
+
+# Markers of an EPIC update, lowercased; they are plain substrings, so a
+# comment is matched case-insensitively with `in` rather than a regex
+EPIC_UPDATE_MARKERS = ('<!-- epic-update-template -->', '## 🚀 epic update', '@epic-update')
+
+# URL of the next page in a paginated response's Link header
+LINK_NEXT_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+class CrawlError(RuntimeError):
+    """Raised when EPIC updates cannot be crawled from GitHub"""
+
+class RateLimitError(CrawlError):
+    """Raised when the GitHub API rate limit is exhausted"""
+    
+    def __init__(self, message: str, reset_at: int, status_code: int = 403):
+        super().__init__(message)
+        # Unix timestamp at which the quota is replenished
+        self.reset_at = reset_at
+        # HTTP status GitHub answered with (403 or 429)
+        self.status_code = status_code
+
+# Crawls create an instance per matching comment, so these are slotted; they
+# are frozen because parsed data is memoized and shared between updates
+@dataclass(frozen=True, slots=True)
 class EpicUpdate:
     """Represents an EPIC update from a GitHub issue comment"""
     issue_number: int
@@ -31,9 +169,18 @@ class EpicUpdate:
     author: str
     created_at: str
     repo: str
-    parsed_data: Optional[Dict] = None
+    parsed_data: Optional['ParsedEpicData'] = None
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class DatedEpicResult:
+    """Outcome of process_dated_epic_update_result"""
+    ok: bool
+    # Formatted output (or raw EPIC data) on success, an "Error ..." message otherwise
+    body: Union[str, Dict]
+    # HTTP status of the failed GitHub request, if the failure came from one
+    status_code: Optional[int] = None
+
+@dataclass(frozen=True, slots=True)
 class ParsedEpicData:
     """Parsed structured data from EPIC update template"""
     date: str
@@ -41,17 +188,112 @@ class ParsedEpicData:
     epic_name: str
     status: str
     progress: str
-    what_happened: List[str]
-    scope_changes: List[str]
-    risks_blockers: List[str]
-    next_steps: List[str]
-    metrics_deliverables: List[str]
+    # Tuples, since parsed templates are memoized and shared between updates
+    what_happened: Tuple[str, ...]
+    scope_changes: Tuple[str, ...]
+    risks_blockers: Tuple[str, ...]
+    next_steps: Tuple[str, ...]
+    metrics_deliverables: Tuple[str, ...]
+
+def create_session(pool_size: int = 20) -> requests.Session:
+    """
+    Create a keep-alive session for the GitHub API.
+    
+    Transient server errors and secondary rate limits (429) are retried with
+    exponential backoff, waiting as long as a Retry-After header asks; requests
+    already asks for gzip-compressed responses.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        # 403 is left out: it also means "forbidden", and an exhausted primary
+        # quota is reported as RateLimitError rather than waited out here
+        status_forcelist=(429, 500, 502, 503, 504),
+        # The GraphQL endpoint is read-only here, so POSTs are safe to retry
+        allowed_methods=frozenset({'GET', 'POST'}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+# Used by every crawler not given its own session, so that the tools, which
+# create a crawler per call, reuse connections and their TLS handshakes
+SHARED_SESSION = create_session()
+
+@lru_cache(maxsize=4096)
+def _parse_epic_template(comment_body: str) -> Optional[ParsedEpicData]:
+    """Parse an EPIC update template, memoized on the comment body
+    
+    Results are shared between callers, so they are immutable throughout.
+    """
+    try:
+        # ParsedEpicData is frozen, so its values are gathered first
+        fields = dict.fromkeys(EPIC_FIELDS.values(), "")
+        sections = {name: [] for name in EPIC_SECTIONS.values()}
+        
+        current_section = None
+        
+        # The regex skips every line that is not a field, heading or bullet
+        for match in EPIC_LINE_RE.finditer(comment_body):
+            marker = match.group('field')
+            
+            # Extract date, owner, epic name, status and progress
+            if marker:
+                value = match.group('value').replace(marker, '').strip()
+                if EPIC_FIELDS[marker] == 'status' and '_' in value:
+                    value = value.split('_')[1].split('_')[0].strip()
+                fields[EPIC_FIELDS[marker]] = value
+            
+            # Detect sections
+            elif match.group('section'):
+                current_section = sections[EPIC_SECTIONS[match.group('section')]]
+            
+            # Collect section content
+            elif current_section is not None:
+                current_section.append(match.group('item').strip())
+        
+        return ParsedEpicData(**fields, **{name: tuple(items) for name, items in sections.items()})
+        
+    except Exception as e:
+        print(f"Error parsing EPIC template: {e}")
+        return None
+
+@lru_cache(maxsize=4096)
+def _is_epic_update_comment(comment_body: str) -> bool:
+    """Check if a comment contains an EPIC update, memoized on the comment body"""
+    comment_lower = comment_body.lower()
+    
+    # Skip comments that are just the trigger
+    if comment_lower.strip() == '@epic-update':
+        return False
+    
+    # Look for the specific EPIC update template markers
+    return any(marker in comment_lower for marker in EPIC_UPDATE_MARKERS)
 
 class GitHubIssueCrawler:
     """Crawls GitHub issues to find EPIC update comments"""
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, token: Optional[str] = None, max_workers: int = 10, cache: Optional[ResponseCache] = None,
+                 session: Optional[requests.Session] = None):
         self.token = token or os.getenv('GITHUB_TOKEN')
+        # Optional response cache; cached entries are revalidated with If-None-Match.
+        # Crawlers created by the MCP tools pick it up from GITHUB_MCP_HTTP_CACHE
+        self.cache = cache if cache is not None else cache_from_env()
+        # Cache keys are prefixed per token so that responses, which may include
+        # private data, are only shared between crawlers using the same credentials
+        self._cache_scope = hashlib.sha256(self.token.encode()).hexdigest()[:16] if self.token else 'anonymous'
+        # Upper bound on concurrent API requests, kept low to stay clear of
+        # GitHub's secondary rate limits
+        self.max_workers = max_workers
+        # Responses already fetched by this crawler, keyed by full URL, so that
+        # identical requests (including concurrent ones) hit the network once
+        self._responses: Dict[str, Future] = {}
+        self._responses_lock = threading.Lock()
+        # Core API quota as last reported by GitHub: {'remaining': int, 'reset': int}
+        self._rate: Optional[Dict[str, int]] = None
         
         self.headers = {
             'Accept': 'application/vnd.github.v3+json'
@@ -62,57 +304,360 @@ class GitHubIssueCrawler:
             self.headers['Authorization'] = f'token {self.token}'
         
         self.base_url = "https://api.github.com"
+        
+        # Connections are pooled across crawlers; the credentials travel with
+        # each request, so crawlers with different tokens can share a session
+        self.session = session or SHARED_SESSION
+    
+    def _get_json(self, url: str, params: Optional[Dict] = None, allow_missing: bool = False):
+        """GET a GitHub API resource, fetching each distinct URL at most once per crawler
+        
+        The returned objects are shared between callers and must not be modified.
+        """
+        return self._get_page(url, params, allow_missing)[0]
+    
+    def _get_paginated(self, url: str, params: Optional[Dict] = None, max_pages: Optional[int] = None) -> List[Dict]:
+        """GET every page of a list resource by following the Link rel="next" headers"""
+        return list(self._iter_paginated(url, params, max_pages))
+    
+    def _iter_paginated(self, url: str, params: Optional[Dict] = None, max_pages: Optional[int] = None):
+        """Yield the items of a list resource, fetching each page only when it is reached"""
+        pages = 0
+        while url:
+            body, link = self._get_page(url, params)
+            yield from body
+            pages += 1
+            if max_pages and pages >= max_pages:
+                break
+            # The next page URL already carries the query parameters
+            match = LINK_NEXT_RE.search(link or '')
+            url = match.group(1) if match else None
+            params = None
     
-    def get_issues(self, repo: str, state: str = "open", since: Optional[str] = None) -> List[Dict]:
-        """Get issues from a repository"""
+    def _get_page(self, url: str, params: Optional[Dict] = None, allow_missing: bool = False) -> tuple:
+        """Return (body, link) for a URL, fetching it at most once per crawler"""
+        key = requests.Request('GET', url, params=params).prepare().url
+        with self._responses_lock:
+            future = self._responses.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._responses[key] = Future()
+        
+        if is_owner:
+            try:
+                future.set_result(self._request_json(url, params, f"{self._cache_scope} {key}", allow_missing))
+            except Exception as e:
+                # Don't remember failures; a later call may succeed
+                with self._responses_lock:
+                    del self._responses[key]
+                future.set_exception(e)
+        
+        return future.result()
+    
+    def _request_json(self, url: str, params: Optional[Dict], cache_key: str, allow_missing: bool = False) -> tuple:
+        """Request a URL, answering from the cache when it is still valid
+        
+        Returns:
+            (body, link) with the decoded JSON body and the Link header, if any
+        """
+        headers = self.headers
+        cached = None
+        
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached:
+                etag, body, fetched_at, link = cached
+                if self.cache.is_fresh(fetched_at):
+                    return json_utils.loads(body), link
+                headers = {**self.headers, 'If-None-Match': etag}
+        
+        response = self.session.get(url, headers=headers, params=params)
+        self._record_rate_limit(response)
+        
+        # Unchanged since the cached copy; 304s don't count against the rate limit
+        if cached and response.status_code == 304:
+            self.cache.touch(cache_key)
+            return json_utils.loads(cached[1]), cached[3]
+        
+        if allow_missing and response.status_code == 404:
+            return None, None
+        if response.status_code in (403, 429) and self._rate and self._rate['remaining'] == 0:
+            raise RateLimitError(
+                f"GitHub API rate limit exhausted; resets at {datetime.fromtimestamp(self._rate['reset'])}",
+                self._rate['reset'],
+                response.status_code
+            )
+        response.raise_for_status()
+        
+        link = response.headers.get('Link')
+        if self.cache is not None and response.headers.get('ETag'):
+            self.cache.set(cache_key, response.headers['ETag'], response.content, link)
+        return json_utils.loads_response(response), link
+    
+    def _record_rate_limit(self, response) -> None:
+        """Remember the quota reported in the X-RateLimit headers of a REST response"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is not None and reset is not None:
+            self._rate = {'remaining': int(remaining), 'reset': int(reset)}
+    
+    def remaining(self) -> int:
+        """Number of core API requests left in the current rate limit window
+        
+        Queries /rate_limit (which is free) if no response has reported it yet.
+        """
+        if self._rate is None:
+            response = self.session.get(f"{self.base_url}/rate_limit", headers=self.headers)
+            response.raise_for_status()
+            core = json_utils.loads_response(response)['resources']['core']
+            self._rate = {'remaining': core['remaining'], 'reset': core['reset']}
+        return self._rate['remaining']
+    
+    def sleep_until_reset(self) -> None:
+        """Block until the current rate limit window has been replenished"""
+        if self._rate is None:
+            self.remaining()
+        time.sleep(max(0, self._rate['reset'] - time.time()) + 1)
+        self._rate = None
+    
+    def clear_cache(self) -> None:
+        """Forget responses fetched by this crawler so the next calls hit the API again"""
+        with self._responses_lock:
+            self._responses.clear()
+    
+    def close(self) -> None:
+        """
+        Release the crawler's responses and connections.
+        
+        A session passed to the constructor is closed; the shared module session
+        stays open because other crawlers keep using it.
+        """
+        self.clear_cache()
+        if self.session is not SHARED_SESSION:
+            self.session.close()
+    
+    def __enter__(self) -> 'GitHubIssueCrawler':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def get_issues(self, repo: str, state: str = "open", since: Optional[str] = None,
+                   per_page: int = 100, max_pages: Optional[int] = None) -> List[Dict]:
+        """Get issues from a repository
+        
+        Args:
+            repo: Repository name in format 'owner/repo'
+            state: Issue state to filter by (open, closed or all)
+            since: Only issues updated at or after this ISO 8601 timestamp (optional)
+            per_page: Issues per request, up to 100; lower it if large pages time out
+            max_pages: Stop after this many pages (default: fetch all)
+        """
         url = f"{self.base_url}/repos/{repo}/issues"
         params = {
             'state': state,
-            'per_page': 100
+            'per_page': per_page
         }
         if since:
             params['since'] = since
             
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._get_paginated(url, params, max_pages)
     
     def get_issue(self, repo: str, issue_number: int) -> Optional[Dict]:
         """Get a specific issue by number"""
         url = f"{self.base_url}/repos/{repo}/issues/{issue_number}"
         
-        response = requests.get(url, headers=self.headers)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        return response.json()
+        return self._get_json(url, allow_missing=True)
     
-    def get_issue_comments(self, repo: str, issue_number: int) -> List[Dict]:
-        """Get all comments for a specific issue"""
+    def get_issue_comments(self, repo: str, issue_number: int, since: Optional[str] = None) -> List[Dict]:
+        """Get all comments for a specific issue
+        
+        Args:
+            repo: Repository name in format 'owner/repo'
+            issue_number: Issue number
+            since: Only comments updated at or after this ISO 8601 timestamp (optional)
+        """
         url = f"{self.base_url}/repos/{repo}/issues/{issue_number}/comments"
         params = {'per_page': 100}
+        if since:
+            params['since'] = since
         
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._get_paginated(url, params)
     
-    def is_epic_update_comment(self, comment_body: str) -> bool:
-        """Check if a comment contains an EPIC update"""
-        # Skip comments that are just the trigger
-        comment_stripped = comment_body.strip()
-        if comment_stripped.lower() == '@epic-update':
-            return False
+    def iter_issue_comments(self, repo: str, issue_number: int):
+        """Yield the comments of an issue lazily, one page of 100 at a time
+        
+        Consumers that stop early (e.g. after finding an EPIC update) never
+        request the remaining pages.
+        """
+        url = f"{self.base_url}/repos/{repo}/issues/{issue_number}/comments"
+        return self._iter_paginated(url, {'per_page': 100})
+    
+    def get_issues_with_comments_graphql(self, repo: str, state: str = "open", first: int = 100) -> List[tuple]:
+        """Get up to `first` issues together with their comments in one GraphQL request
+        
+        Returns (issue, comments) pairs in the same dict shape as the REST
+        endpoints. Issues with more than `first` comments have their comments
+        re-fetched over REST. GraphQL requires authentication, so without a
+        token this falls back to the REST endpoints.
+        """
+        if not self.token:
+            issues = self.get_issues(repo, state=state, per_page=min(first, 100), max_pages=1)[:first]
+            comments = self.get_comments_for_issues(repo, [issue['number'] for issue in issues])
+            return list(zip(issues, comments))
+        
+        owner, name = repo.split('/')
+        states = {'open': ['OPEN'], 'closed': ['CLOSED']}.get(state)  # None means all states
+        data = self._post_graphql(
+            ISSUES_WITH_COMMENTS_QUERY,
+            {'owner': owner, 'name': name, 'first': first, 'states': states}
+        )
+        
+        return [self._from_graphql_node(repo, node) for node in data['repository']['issues']['nodes']]
+    
+    def get_issues_graphql(self, repo: str, issue_numbers: List[int]) -> List[tuple]:
+        """Get specific issues together with their comments through aliased GraphQL queries
+        
+        Up to GRAPHQL_BATCH_SIZE issues are looked up per request instead of two
+        REST calls per issue. Returns (issue, comments) pairs in the order given,
+        skipping numbers that don't exist. Issues with more than 100 comments
+        have their comments re-fetched over REST.
+        """
+        owner, name = repo.split('/')
+        issues_with_comments = []
+        
+        for start in range(0, len(issue_numbers), GRAPHQL_BATCH_SIZE):
+            batch = issue_numbers[start:start + GRAPHQL_BATCH_SIZE]
+            # Issue numbers may also refer to pull requests, which REST treats as issues
+            aliases = "\n".join(
+                f"i{i}: issueOrPullRequest(number: $n{i}) {{ ... on Issue {{ {ISSUE_FIELDS} }} "
+                f"... on PullRequest {{ {ISSUE_FIELDS} }} }}"
+                for i in range(len(batch))
+            )
+            declarations = "".join(f", $n{i}: Int!" for i in range(len(batch)))
+            query = (
+                f"query($owner: String!, $name: String!{declarations}) {{\n"
+                f"  repository(owner: $owner, name: $name) {{\n{aliases}\n  }}\n}}"
+            )
+            variables = {'owner': owner, 'name': name}
+            variables.update((f"n{i}", int(number)) for i, number in enumerate(batch))
             
-        # Look for the specific EPIC update template pattern
-        epic_patterns = [
-            r'<!-- epic-update-template -->',
-            r'## 🚀 Epic Update'
-        ]
+            data = self._post_graphql(query, variables, ignore_missing=True)
+            for i in range(len(batch)):
+                node = data['repository'].get(f"i{i}")
+                if node:
+                    issues_with_comments.append(self._from_graphql_node(repo, node))
+        
+        return issues_with_comments
+    
+    def iter_issues_with_comments_graphql(self, repo: str, since: str, state: str = "open"):
+        """Yield (issue, comments) pairs for issues updated since a date, 100 issues per request
         
-        comment_upper = comment_body.upper()
-        return any(re.search(pattern, comment_upper, re.IGNORECASE) for pattern in epic_patterns)
+        Pull requests updated since the date follow the issues, as the REST
+        /issues listing includes them too.
+        
+        Args:
+            repo: Repository name in format 'owner/repo'
+            since: ISO 8601 timestamp (UTC)
+            state: Issue state to filter by (open, closed or all)
+        """
+        owner, name = repo.split('/')
+        states = {'open': ['OPEN'], 'closed': ['CLOSED']}.get(state)  # None means all states
+        variables = {'owner': owner, 'name': name, 'since': since, 'states': states}
+        
+        for node in self._paginate_graphql(ISSUES_SINCE_QUERY, variables, ('repository', 'issues')):
+            yield self._from_graphql_node(repo, node)
+        
+        # A closed pull request may also be merged
+        pr_states = {'open': ['OPEN'], 'closed': ['CLOSED', 'MERGED']}.get(state)
+        pr_variables = {'owner': owner, 'name': name, 'states': pr_states}
+        for node in self._paginate_graphql(PULL_REQUESTS_SINCE_QUERY, pr_variables, ('repository', 'pullRequests')):
+            # Both timestamps are UTC ISO 8601 strings, so they compare as text
+            if node['updatedAt'] < since:
+                break
+            yield self._from_graphql_node(repo, node)
+    
+    def _paginate_graphql(self, query: str, variables: Dict, path: tuple):
+        """Yield the nodes of the connection at `path`, following endCursor until the last page"""
+        cursor = None
+        while True:
+            connection = self._post_graphql(query, {**variables, 'cursor': cursor})
+            for key in path:
+                connection = connection[key]
+            yield from connection['nodes']
+            if not connection['pageInfo']['hasNextPage']:
+                break
+            cursor = connection['pageInfo']['endCursor']
+    
+    def _post_graphql(self, query: str, variables: Dict, ignore_missing: bool = False) -> Dict:
+        """Run a GraphQL query and return its data, raising CrawlError on query errors"""
+        request = {'query': query, 'variables': variables}
+        cache_key = payload = response = None
+        
+        if self.cache is not None:
+            digest = hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+            cache_key = f"{self._cache_scope} graphql:{digest}"
+            cached = self.cache.get(cache_key)
+            # GraphQL responses carry no ETag, so they are only reused within the TTL
+            if cached and self.cache.is_fresh(cached[2]):
+                payload = json_utils.loads(cached[1])
+        
+        if payload is None:
+            response = self.session.post(f"{self.base_url}/graphql", headers=self.headers, json=request)
+            response.raise_for_status()
+            payload = json_utils.loads_response(response)
+        
+        errors = payload.get('errors') or []
+        if ignore_missing:
+            # Lookups of nonexistent objects resolve to null with a NOT_FOUND error
+            errors = [error for error in errors if error.get('type') != 'NOT_FOUND']
+        if errors:
+            raise CrawlError(f"GraphQL query failed: {errors[0].get('message')}")
+        
+        if cache_key and response is not None:
+            self.cache.set(cache_key, '', response.content)
+        return payload['data']
+    
+    def _from_graphql_node(self, repo: str, node: Dict) -> tuple:
+        """Convert a GraphQL issue node into an (issue, comments) pair in REST shape"""
+        issue = {'number': node['number'], 'title': node['title']}
+        if node['comments']['pageInfo']['hasNextPage']:
+            comments = self.get_issue_comments(repo, node['number'])
+        else:
+            comments = [
+                {
+                    'id': comment['databaseId'],
+                    'body': comment['body'],
+                    # Deleted accounts have no author
+                    'user': {'login': (comment['author'] or {}).get('login', 'ghost')},
+                    'created_at': comment['createdAt']
+                }
+                for comment in node['comments']['nodes']
+            ]
+        return issue, comments
     
-    def extract_epic_updates(self, repo: str, days_back: int = 30, start_date: str = None, end_date: str = None, issue_numbers: Optional[List[int]] = None) -> List[EpicUpdate]:
+    def get_comments_for_issues(self, repo: str, issue_numbers: List[int], since: Optional[str] = None) -> List[List[Dict]]:
+        """Get the comments of several issues concurrently, in the order given"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda num: self.get_issue_comments(repo, num, since), issue_numbers))
+    
+    def _fetch_issue_with_comments(self, repo: str, issue_number: int, since: Optional[str] = None) -> Optional[tuple]:
+        """Fetch an issue and its comments, returning None if the issue is unavailable"""
+        try:
+            issue = self.get_issue(repo, issue_number)
+            if not issue:
+                return None
+            return issue, self.get_issue_comments(repo, issue_number, since)
+        except Exception as e:
+            print(f"Warning: Could not fetch issue #{issue_number}: {e}")
+            return None
+    
+    def is_epic_update_comment(self, comment_body: str) -> bool:
+        """Check if a comment contains an EPIC update"""
+        return _is_epic_update_comment(comment_body)
+    
+    def extract_epic_updates(self, repo: str, days_back: int = 30, start_date: str = None, end_date: str = None, issue_numbers: Optional[List[int]] = None,
+                             parse_template: bool = True) -> List[EpicUpdate]:
         """Extract EPIC updates from issues in the specified date range
         
         Args:
@@ -121,13 +666,32 @@ class GitHubIssueCrawler:
             start_date: Start date in YYYY-MM-DD format (optional)
             end_date: End date in YYYY-MM-DD format (optional)
             issue_numbers: Optional list of specific issue numbers to check
+            parse_template: Parse each update's template into parsed_data (default: True)
+        """
+        return list(self.iter_epic_updates(repo, days_back, start_date, end_date, issue_numbers, parse_template))
+    
+    def iter_epic_updates(self, repo: str, days_back: int = 30, start_date: str = None, end_date: str = None, issue_numbers: Optional[List[int]] = None,
+                          parse_template: bool = True):
+        """Yield EPIC updates from issues in the specified date range as they are found
+        
+        Nothing is fetched until the first update is requested. With a token,
+        issues are requested page by page, so consumers that stop early
+        (e.g. after the first few updates) skip the remaining pages.
+        
+        Args:
+            repo: Repository name in format 'owner/repo'
+            days_back: Number of days to look back (default: 30)
+            start_date: Start date in YYYY-MM-DD format (optional)
+            end_date: End date in YYYY-MM-DD format (optional)
+            issue_numbers: Optional list of specific issue numbers to check
+            parse_template: Parse each update's template into parsed_data (default: True);
+                updates only counted or listed don't need it
         """
         if start_date:
             # Use specific date range
             start_dt = datetime.strptime(start_date, '%Y-%m-%d')
             end_dt = datetime.strptime(end_date, '%Y-%m-%d') if end_date else datetime.now()
-            print(">>>> start_dt", start_dt, type(start_dt))
-            print(">>>> end_dt", end_dt)
+            logger.debug("date range %s to %s", start_dt, end_dt)
             since_date = start_dt.isoformat()
         else:
             # Use days_back
@@ -135,127 +699,162 @@ class GitHubIssueCrawler:
             start_dt = datetime.now() - timedelta(days=days_back)
             end_dt = datetime.now()
         
-        # Get issues - either all issues or specific ones
-        if issue_numbers:
-            # If specific issue numbers provided, get them individually
-            issues = []
-            for issue_num in issue_numbers:
-                try:
-                    issue = self.get_issue(repo, issue_num)
-                    if issue:
-                        issues.append(issue)
-                except Exception as e:
-                    print(f"Warning: Could not fetch issue #{issue_num}: {e}")
+        # Comments created in the range were updated on or after its first day;
+        # the REST endpoints filter on that server-side, the range is still checked below
+        comments_since = start_dt.strftime('%Y-%m-%dT00:00:00Z')
+        
+        # A comment is in the range when the midnight starting its day is, so the
+        # range becomes its first and last whole days as YYYY-MM-DD strings, which
+        # are compared with the prefix of each comment's ISO 8601 timestamp
+        first_day = start_dt.date() if start_dt.time() == dt_time.min else start_dt.date() + timedelta(days=1)
+        first_day, last_day = first_day.isoformat(), end_dt.date().isoformat()
+        
+        # Get issues with their comments - either all issues or specific ones
+        if issue_numbers and self.token:
+            # Specific issues with their comments in one GraphQL round trip
+            issues_with_comments = self.get_issues_graphql(repo, list(issue_numbers))
+        elif issue_numbers:
+            # GraphQL requires a token; fetch the issues concurrently over REST
+            # instead, the work is network-bound so N issues take roughly one round trip
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                fetched = executor.map(lambda num: self._fetch_issue_with_comments(repo, num, comments_since), issue_numbers)
+                issues_with_comments = [item for item in fetched if item]
+        elif self.token:
+            # Issues updated in the date range with their comments, 100 per GraphQL request
+            issues_with_comments = self.iter_issues_with_comments_graphql(repo, since=start_dt.strftime('%Y-%m-%dT%H:%M:%SZ'))
         else:
-            # Get all issues in the date range
+            # Get all issues in the date range, then their comments concurrently.
+            # The search API is not used to narrow them down: its index lags,
+            # results stop at 1000 issues and HTML-comment markers aren't indexed
             issues = self.get_issues(repo, since=since_date)
+            comments_per_issue = self.get_comments_for_issues(
+                repo, [issue['number'] for issue in issues], since=comments_since
+            )
+            issues_with_comments = zip(issues, comments_per_issue)
         
-        epic_updates = []
-        
-        for issue in issues:
-            comments = self.get_issue_comments(repo, issue['number'])
-            
+        for issue, comments in issues_with_comments:
             for comment in comments:
                 # Check if comment is within the date range
-                comment_date = datetime.strptime(comment['created_at'][:10], '%Y-%m-%d')
-                if start_dt <= comment_date <= end_dt:
+                if first_day <= comment['created_at'][:10] <= last_day:
                     if self.is_epic_update_comment(comment['body']):
                         # Parse the structured EPIC data
-                        parsed_data = self.parse_epic_template(comment['body'])
+                        parsed_data = self.parse_epic_template(comment['body']) if parse_template else None
                         
-                        epic_update = EpicUpdate(
+                        yield EpicUpdate(
                             issue_number=issue['number'],
                             issue_title=issue['title'],
                             comment_id=comment['id'],
                             comment_body=comment['body'],
-                            author=comment['user']['login'],
+                            # A few authors write most updates; each decoded page holds
+                            # its own copy of their logins, so share one string instead
+                            author=sys.intern(comment['user']['login']),
                             created_at=comment['created_at'],
                             repo=repo,
                             parsed_data=parsed_data
                         )
-                        epic_updates.append(epic_update)
-        
-        return epic_updates
     
     def parse_epic_template(self, comment_body: str) -> Optional[ParsedEpicData]:
         """Parse structured data from EPIC update template"""
-        try:
-            lines = comment_body.split('\n')
-            parsed = ParsedEpicData(
-                date="",
-                owner="",
-                epic_name="",
-                status="",
-                progress="",
-                what_happened=[],
-                scope_changes=[],
-                risks_blockers=[],
-                next_steps=[],
-                metrics_deliverables=[]
-            )
-            
-            current_section = None
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Extract date
-                if line.startswith('**Date:**'):
-                    parsed.date = line.replace('**Date:**', '').strip()
-                
-                # Extract owner
-                elif line.startswith('**Owner:**'):
-                    parsed.owner = line.replace('**Owner:**', '').strip()
-                
-                # Extract epic name
-                elif line.startswith('**Epic:**'):
-                    parsed.epic_name = line.replace('**Epic:**', '').strip()
-                
-                # Extract status
-                elif line.startswith('- **Current status:**'):
-                    status_text = line.replace('- **Current status:**', '').strip()
-                    if '_' in status_text:
-                        parsed.status = status_text.split('_')[1].split('_')[0].strip()
-                    else:
-                        parsed.status = status_text
-                
-                # Extract progress
-                elif line.startswith('- **Progress (%):**'):
-                    parsed.progress = line.replace('- **Progress (%):**', '').strip()
-                
-                # Detect sections
-                elif line == '### What happened since last update':
-                    current_section = 'what_happened'
-                elif line == '### Scope changes':
-                    current_section = 'scope_changes'
-                elif line == '### Risks / blockers':
-                    current_section = 'risks_blockers'
-                elif line == '### Next steps (with owners & dates)':
-                    current_section = 'next_steps'
-                elif line == '### Metrics / deliverables':
-                    current_section = 'metrics_deliverables'
-                
-                # Collect section content
-                elif current_section and line.startswith('- '):
-                    content = line[2:].strip()  # Remove the "- " prefix
-                    if current_section == 'what_happened':
-                        parsed.what_happened.append(content)
-                    elif current_section == 'scope_changes':
-                        parsed.scope_changes.append(content)
-                    elif current_section == 'risks_blockers':
-                        parsed.risks_blockers.append(content)
-                    elif current_section == 'next_steps':
-                        parsed.next_steps.append(content)
-                    elif current_section == 'metrics_deliverables':
-                        parsed.metrics_deliverables.append(content)
-            
-            return parsed
-            
-        except Exception as e:
-            print(f"Error parsing EPIC template: {e}")
-            return None
+        return _parse_epic_template(comment_body)
+
+def epic_update_to_dict(update: EpicUpdate, **extra) -> Dict:
+    """Convert an EpicUpdate into the serializable dict returned by the tools"""
+    update_data = {
+        'issue_number': update.issue_number,
+        'issue_title': update.issue_title,
+        'comment_id': update.comment_id,
+        'comment_body': update.comment_body,
+        'author': update.author,
+        'created_at': update.created_at,
+        'repo': update.repo,
+        **extra
+    }
+    
+    # Add parsed data if available
+    if update.parsed_data:
+        update_data['parsed_data'] = {
+            'date': update.parsed_data.date,
+            'owner': update.parsed_data.owner,
+            'epic_name': update.parsed_data.epic_name,
+            'status': update.parsed_data.status,
+            'progress': update.parsed_data.progress,
+            # Fresh lists: the returned dicts belong to the caller
+            'what_happened': list(update.parsed_data.what_happened),
+            'scope_changes': list(update.parsed_data.scope_changes),
+            'risks_blockers': list(update.parsed_data.risks_blockers),
+            'next_steps': list(update.parsed_data.next_steps),
+            'metrics_deliverables': list(update.parsed_data.metrics_deliverables)
+        }
+    
+    return update_data
+
+def collect_issue_updates(repo: str, issue_numbers: List[int], crawler: Optional[GitHubIssueCrawler] = None) -> Dict:
+    """
+    Collect all EPIC updates from specific issues, regardless of date.
+    
+    Args:
+        repo: Repository name in format 'owner/repo'
+        issue_numbers: Issue numbers to check
+        crawler: Crawler to use, e.g. one configured with a ResponseCache (optional)
+    
+    Returns:
+        Dict in the same shape as crawl_specific_issues
+    
+    Raises:
+        CrawlError: If the issues could not be crawled
+    """
+    try:
+        crawler = crawler or GitHubIssueCrawler()
+        
+        # Extract EPIC updates from specific issues (no date filtering)
+        epic_updates = crawler.extract_epic_updates(repo, days_back=36500, issue_numbers=issue_numbers)  # Large days_back to include all
+        updates_data = [epic_update_to_dict(update) for update in epic_updates]
+    except Exception as e:
+        raise CrawlError(f"Error crawling specific issues: {str(e)}") from e
+    
+    return {
+        'total_updates': len(updates_data),
+        'repo': repo,
+        'issue_numbers': list(issue_numbers),
+        'updates': updates_data
+    }
+
+def collect_epic_updates(repo: str, days_back: int = 30, start_date: str = None, end_date: str = None,
+                         issue_numbers: Optional[List[int]] = None, crawler: Optional[GitHubIssueCrawler] = None,
+                         parse_template: bool = True) -> Dict:
+    """
+    Collect EPIC updates from the last N days or a specific date range.
+    
+    Args:
+        repo: Repository name in format 'owner/repo'
+        days_back: Number of days to look back for updates (default: 30)
+        start_date: Start date in YYYY-MM-DD format (optional, overrides days_back)
+        end_date: End date in YYYY-MM-DD format (optional, defaults to today)
+        issue_numbers: Specific issue numbers to check (optional)
+        crawler: Crawler to use, e.g. one configured with a ResponseCache (optional)
+        parse_template: Include each update's parsed template data (default: True)
+    
+    Returns:
+        Dict in the same shape as crawl_epic_updates
+    
+    Raises:
+        CrawlError: If the updates could not be crawled
+    """
+    try:
+        crawler = crawler or GitHubIssueCrawler()
+        epic_updates = crawler.extract_epic_updates(repo, days_back, start_date, end_date, issue_numbers, parse_template)
+        
+        # Convert to serializable format
+        updates_data = [epic_update_to_dict(update) for update in epic_updates]
+    except Exception as e:
+        raise CrawlError(f"Error crawling EPIC updates: {str(e)}") from e
+    
+    return {
+        'total_updates': len(updates_data),
+        'repo': repo,
+        'days_back': days_back,
+        'updates': updates_data
+    }
 
 @mcp.tool()
 def crawl_epic_updates(repo: str, days_back: int = 30, start_date: str = None, end_date: str = None, issue_numbers: str = None) -> str:
@@ -273,130 +872,139 @@ def crawl_epic_updates(repo: str, days_back: int = 30, start_date: str = None, e
         JSON string containing all EPIC updates found
     """
     try:
-        crawler = GitHubIssueCrawler()
-        print(">>>> repo", repo)
-        print(">>>> days_back", days_back)
-        print(">>>> start_date", start_date)
-        print(">>>> end_date", end_date)
-        print(">>>> issue_numbers", issue_numbers)
+        logger.debug("crawling %s: days_back=%s start_date=%s end_date=%s issue_numbers=%s",
+                     repo, days_back, start_date, end_date, issue_numbers)
         
         # Parse issue numbers if provided
         parsed_issue_numbers = None
         if issue_numbers:
-            try:
-                parsed_issue_numbers = [int(num.strip()) for num in issue_numbers.split(',')]
-                print(f"Parsed issue numbers: {parsed_issue_numbers}")
-            except ValueError as e:
-                return f"Error parsing issue numbers '{issue_numbers}': {str(e)}"
-        
-        epic_updates = crawler.extract_epic_updates(repo, days_back, start_date, end_date, parsed_issue_numbers)
+            parsed_issue_numbers = _parse_issue_numbers(issue_numbers)
+            if parsed_issue_numbers is None:
+                return f"Error parsing issue numbers '{issue_numbers}': expected comma-separated integers"
         
-        # Convert to serializable format
-        updates_data = []
-        for update in epic_updates:
-            update_data = {
-                'issue_number': update.issue_number,
-                'issue_title': update.issue_title,
-                'comment_id': update.comment_id,
-                'comment_body': update.comment_body,
-                'author': update.author,
-                'created_at': update.created_at,
-                'repo': update.repo
-            }
-            
-            # Add parsed data if available
-            if update.parsed_data:
-                update_data['parsed_data'] = {
-                    'date': update.parsed_data.date,
-                    'owner': update.parsed_data.owner,
-                    'epic_name': update.parsed_data.epic_name,
-                    'status': update.parsed_data.status,
-                    'progress': update.parsed_data.progress,
-                    'what_happened': update.parsed_data.what_happened,
-                    'scope_changes': update.parsed_data.scope_changes,
-                    'risks_blockers': update.parsed_data.risks_blockers,
-                    'next_steps': update.parsed_data.next_steps,
-                    'metrics_deliverables': update.parsed_data.metrics_deliverables
-                }
-            
-            updates_data.append(update_data)
-        
-        return {
-            'total_updates': len(updates_data),
-            'repo': repo,
-            'days_back': days_back,
-            'updates': updates_data
-        }
+        return collect_epic_updates(repo, days_back, start_date, end_date, parsed_issue_numbers)
     
+    except CrawlError as e:
+        return str(e)
     except Exception as e:
         return f"Error crawling EPIC updates: {str(e)}"
 
 @mcp.tool()
-def crawl_specific_issues(repo: str, issue_numbers: str) -> str:
+def crawl_epic_updates_metadata_only(repo: str, days_back: int = 30) -> str:
+    """
+    Crawl EPIC update comments from the last N days without parsing their templates.
+    Faster than crawl_epic_updates and sufficient input for analyze_epic_trends,
+    which only uses the issue, author and date of each update.
+    
+    Args:
+        repo: Repository name in format 'owner/repo' (e.g., 'LDFLK/launch')
+        days_back: Number of days to look back for updates (default: 30)
+    
+    Returns:
+        JSON string containing all EPIC updates found, without parsed_data
+    """
+    try:
+        return collect_epic_updates(repo, days_back, parse_template=False)
+    except CrawlError as e:
+        return str(e)
+
+@mcp.tool()
+def crawl_specific_issues(repo: str, issue_numbers: Union[str, List[int]]) -> str:
     """
     Crawl specific GitHub issues to find EPIC update comments.
     
     Args:
         repo: Repository name in format 'owner/repo' (e.g., 'LDFLK/launch')
-        issue_numbers: Comma-separated list of issue numbers to check (e.g., "151,152,153")
+        issue_numbers: Comma-separated list of issue numbers to check (e.g., "151,152,153"),
+            or a list of issue numbers
     
     Returns:
         JSON string containing all EPIC updates found in the specified issues
     """
     try:
-        crawler = GitHubIssueCrawler()
-        print(f">>>> Crawling specific issues: {issue_numbers} in {repo}")
-        
-        # Parse issue numbers
-        try:
-            parsed_issue_numbers = [int(num.strip()) for num in issue_numbers.split(',')]
-            print(f"Parsed issue numbers: {parsed_issue_numbers}")
-        except ValueError as e:
-            return f"Error parsing issue numbers '{issue_numbers}': {str(e)}"
-        
-        # Extract EPIC updates from specific issues (no date filtering)
-        epic_updates = crawler.extract_epic_updates(repo, days_back=36500, issue_numbers=parsed_issue_numbers)  # Large days_back to include all
+        logger.debug("crawling specific issues %s in %s", issue_numbers, repo)
         
-        # Convert to serializable format
-        updates_data = []
-        for update in epic_updates:
-            update_data = {
-                'issue_number': update.issue_number,
-                'issue_title': update.issue_title,
-                'comment_id': update.comment_id,
-                'comment_body': update.comment_body,
-                'author': update.author,
-                'created_at': update.created_at,
-                'repo': update.repo
-            }
-            
-            # Add parsed data if available
-            if update.parsed_data:
-                update_data['parsed_data'] = {
-                    'date': update.parsed_data.date,
-                    'owner': update.parsed_data.owner,
-                    'epic_name': update.parsed_data.epic_name,
-                    'status': update.parsed_data.status,
-                    'progress': update.parsed_data.progress,
-                    'what_happened': update.parsed_data.what_happened,
-                    'scope_changes': update.parsed_data.scope_changes,
-                    'risks_blockers': update.parsed_data.risks_blockers,
-                    'next_steps': update.parsed_data.next_steps,
-                    'metrics_deliverables': update.parsed_data.metrics_deliverables
-                }
-            
-            updates_data.append(update_data)
+        # Parse issue numbers; lists are used as given
+        if isinstance(issue_numbers, str):
+            parsed_issue_numbers = _parse_issue_numbers(issue_numbers)
+            if parsed_issue_numbers is None:
+                return f"Error parsing issue numbers '{issue_numbers}': expected comma-separated integers"
+        else:
+            parsed_issue_numbers = list(issue_numbers)
         
-        return {
-            'total_updates': len(updates_data),
-            'repo': repo,
-            'issue_numbers': parsed_issue_numbers,
-            'updates': updates_data
-        }
+        return collect_issue_updates(repo, parsed_issue_numbers)
     
+    except CrawlError as e:
+        return str(e)
     except Exception as e:
         return f"Error crawling specific issues: {str(e)}"
 
+def _parse_issue_numbers(issue_numbers: str) -> Optional[List[int]]:
+    """Parse comma-separated issue numbers such as "151, 152,153", or None if any is not a number"""
+    # Validated up front so bad input is rejected without raising from int()
+    tokens = [token.strip() for token in issue_numbers.split(',') if token.strip()]
+    if not all(token.isdecimal() for token in tokens):
+        return None
+    return list(map(int, tokens))
+
+def _parse_issue_url(issue_url: str) -> Optional[Tuple[str, int]]:
+    """Split a GitHub issue URL into (repo, issue number), or None if it is not one"""
+    # Any further path segments, query or fragment (e.g. #issuecomment-...) are ignored
+    url = urlsplit(issue_url)
+    parts = url.path.split('/')
+    if (url.scheme != 'https' or url.netloc != 'github.com' or len(parts) < 5
+            or parts[0] or not parts[1] or not parts[2] or parts[3] != 'issues' or not parts[4].isdecimal()):
+        return None
+    return f"{parts[1]}/{parts[2]}", int(parts[4])
+
+def _collect_issue_epic_updates(issue_url: str, repo: str, issue_number: int, target_date: Optional[str]) -> Dict:
+    """Fetch an issue's EPIC updates (optionally only those on target_date); errors propagate"""
+    crawler = GitHubIssueCrawler()
+    
+    epic_updates = []
+    target_day = None
+    
+    if target_date:
+        # Validate and normalize once; comments are then matched on the
+        # YYYY-MM-DD prefix of their ISO 8601 timestamp without parsing them
+        target_day = datetime.strptime(target_date, '%Y-%m-%d').strftime('%Y-%m-%d')
+    
+    # Comments created on the target day were last updated on or after it
+    comments = crawler.get_issue_comments(repo, issue_number, since=target_day and f"{target_day}T00:00:00Z")
+    
+    for comment in comments:
+        # Filter by date if specified
+        if target_day and comment['created_at'][:10] != target_day:
+            continue
+        
+        if crawler.is_epic_update_comment(comment['body']):
+            # Parse the structured EPIC data
+            parsed_data = crawler.parse_epic_template(comment['body'])
+            
+            epic_update = EpicUpdate(
+                issue_number=issue_number,
+                issue_title=f"Issue #{issue_number}",  # We'll get the actual title if needed
+                comment_id=comment['id'],
+                comment_body=comment['body'],
+                author=comment['user']['login'],
+                created_at=comment['created_at'],
+                repo=repo,
+                parsed_data=parsed_data
+            )
+            epic_updates.append(epic_update)
+    
+    # Convert to serializable format
+    updates_data = [epic_update_to_dict(update, issue_url=issue_url) for update in epic_updates]
+    
+    return {
+        'total_updates': len(updates_data),
+        'repo': repo,
+        'issue_number': issue_number,
+        'issue_url': issue_url,
+        'target_date': target_date,
+        'updates': updates_data
+    }
+
 @mcp.tool()
 def get_epic_updates_from_issue(issue_url: str, target_date: str = None) -> str:
     """
@@ -409,177 +1017,88 @@ def get_epic_updates_from_issue(issue_url: str, target_date: str = None) -> str:
     Returns:
         JSON string containing EPIC updates from the specific issue
     """
+    # Parse the issue URL to extract repo and issue number
+    issue = _parse_issue_url(issue_url)
+    if issue is None:
+        return "Invalid GitHub issue URL format. Expected: https://github.com/owner/repo/issues/number"
+    
     try:
-        # Parse the issue URL to extract repo and issue number
-        import re
-        url_pattern = r'https://github\.com/([^/]+/[^/]+)/issues/(\d+)'
-        match = re.match(url_pattern, issue_url)
-        
-        if not match:
-            return "Invalid GitHub issue URL format. Expected: https://github.com/owner/repo/issues/number"
-        
-        repo = match.group(1)
-        issue_number = int(match.group(2))
-        
-        crawler = GitHubIssueCrawler()
-        comments = crawler.get_issue_comments(repo, issue_number)
-        
-        epic_updates = []
-        target_dt = None
-        
-        if target_date:
-            target_dt = datetime.strptime(target_date, '%Y-%m-%d')
-        
-        for comment in comments:
-            # Filter by date if specified
-            if target_dt:
-                comment_date = datetime.strptime(comment['created_at'][:10], '%Y-%m-%d')
-                if comment_date != target_dt:
-                    continue
-            
-            if crawler.is_epic_update_comment(comment['body']):
-                # Parse the structured EPIC data
-                parsed_data = crawler.parse_epic_template(comment['body'])
-                
-                epic_update = EpicUpdate(
-                    issue_number=issue_number,
-                    issue_title=f"Issue #{issue_number}",  # We'll get the actual title if needed
-                    comment_id=comment['id'],
-                    comment_body=comment['body'],
-                    author=comment['user']['login'],
-                    created_at=comment['created_at'],
-                    repo=repo,
-                    parsed_data=parsed_data
-                )
-                epic_updates.append(epic_update)
-        
-        # Convert to serializable format
-        updates_data = []
-        
-        for update in epic_updates:
-            update_data = {
-                'issue_number': update.issue_number,
-                'issue_title': update.issue_title,
-                'comment_id': update.comment_id,
-                'comment_body': update.comment_body,
-                'author': update.author,
-                'created_at': update.created_at,
-                'repo': update.repo,
-                'issue_url': issue_url
-            }
-            
-            # Add parsed data if available
-            if update.parsed_data:
-                update_data['parsed_data'] = {
-                    'date': update.parsed_data.date,
-                    'owner': update.parsed_data.owner,
-                    'epic_name': update.parsed_data.epic_name,
-                    'status': update.parsed_data.status,
-                    'progress': update.parsed_data.progress,
-                    'what_happened': update.parsed_data.what_happened,
-                    'scope_changes': update.parsed_data.scope_changes,
-                    'risks_blockers': update.parsed_data.risks_blockers,
-                    'next_steps': update.parsed_data.next_steps,
-                    'metrics_deliverables': update.parsed_data.metrics_deliverables
-                }
-            
-            updates_data.append(update_data)
-        
-        return {
-            'total_updates': len(updates_data),
-            'repo': repo,
-            'issue_number': issue_number,
-            'issue_url': issue_url,
-            'target_date': target_date,
-            'updates': updates_data
-        }
+        return _collect_issue_epic_updates(issue_url, *issue, target_date)
     
     except Exception as e:
         return f"Error extracting EPIC updates from issue: {str(e)}"
 
-@mcp.tool()
-def generate_board_report(epic_updates_data: str, format_type: str = "executive") -> str:
-    """
-    Generate a board of directors report from EPIC updates.
+def _period_line(data: Dict, period_label: str) -> str:
+    """Describe the period an EPIC updates payload covers"""
+    # Handle different data sources (some have days_back, others don't)
+    if 'days_back' in data:
+        return f"**{period_label}:** Last {data['days_back']} days\n"
+    elif 'target_date' in data:
+        return f"**Target Date:** {data['target_date']}\n"
+    return f"**{period_label}:** All available updates\n"
+
+@dataclass
+class BoardAccumulator:
+    """Per-issue aggregates behind generate_board_report"""
+    latest: Dict[int, Dict] = field(default_factory=dict)
+    authors: set = field(default_factory=set)
     
-    Args:
-        epic_updates_data: JSON string containing EPIC updates from crawl_epic_updates
-        format_type: Report format - 'executive', 'detailed', or 'summary'
+    def add(self, update: Dict) -> None:
+        """Fold one update into the aggregates"""
+        latest = self.latest.get(update['issue_number'])
+        if latest is None or update['created_at'] > latest['created_at']:
+            self.latest[update['issue_number']] = update
+        self.authors.add(update['author'])
     
-    Returns:
-        Formatted board report
-    """
-    try:
-        import json
-        data = json.loads(epic_updates_data) if isinstance(epic_updates_data, str) else epic_updates_data
-        
-        if not data.get('updates'):
-            return "No EPIC updates found for the specified period."
-        
-        report = f"#EPIC Update Report\n\n"
-        report += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        report += f"**Repository:** {data['repo']}\n"
-        
-        # Handle different data sources (some have days_back, others don't)
-        if 'days_back' in data:
-            report += f"**Period:** Last {data['days_back']} days\n"
-        elif 'target_date' in data:
-            report += f"**Target Date:** {data['target_date']}\n"
-        else:
-            report += f"**Period:** All available updates\n"
-            
-        report += f"**Total Updates:** {data['total_updates']}\n\n"
+    def format(self, data: Dict, format_type: str) -> str:
+        """Render the board report in the requested format"""
+        parts = [f"#EPIC Update Report\n\n"]
+        parts.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(f"**Repository:** {data['repo']}\n")
+        parts.append(_period_line(data, "Period"))
+        parts.append(f"**Total Updates:** {data['total_updates']}\n\n")
         
         if format_type == "summary":
             # Summary format - just key metrics
-            report += "## Executive Summary\n\n"
-            report += f"- **Total EPIC Updates:** {data['total_updates']}\n"
-            report += f"- **Active Issues:** {len(set(u['issue_number'] for u in data['updates']))}\n"
-            report += f"- **Contributors:** {len(set(u['author'] for u in data['updates']))}\n\n"
+            parts.append("## Executive Summary\n\n")
+            parts.append(f"- **Total EPIC Updates:** {data['total_updates']}\n")
+            parts.append(f"- **Active Issues:** {len(self.latest)}\n")
+            parts.append(f"- **Contributors:** {len(self.authors)}\n\n")
             
         elif format_type == "executive":
             # Executive format - high-level overview with structured EPIC data
-            report += "## Key EPIC Updates\n\n"
+            parts.append("## Key EPIC Updates\n\n")
             
-            # Group by issue
-            issues = {}
-            for update in data['updates']:
-                issue_num = update['issue_number']
-                if issue_num not in issues:
-                    issues[issue_num] = []
-                issues[issue_num].append(update)
-            
-            for issue_num, updates in issues.items():
-                latest_update = max(updates, key=lambda x: x['created_at'])
-                report += f"### Issue #{issue_num}: {latest_update['issue_title']}\n"
-                report += f"**Latest Update:** {latest_update['created_at'][:10]} by @{latest_update['author']}\n\n"
+            for issue_num, latest_update in self.latest.items():
+                parts.append(f"### Issue #{issue_num}: {latest_update['issue_title']}\n")
+                parts.append(f"**Latest Update:** {latest_update['created_at'][:10]} by @{latest_update['author']}\n\n")
                 
                 # Use structured EPIC data if available
                 if 'parsed_data' in latest_update and latest_update['parsed_data']:
                     parsed = latest_update['parsed_data']
-                    report += f"**Epic:** {parsed.get('epic_name', 'N/A')}\n"
-                    report += f"**Owner:** {parsed.get('owner', 'N/A')}\n"
-                    report += f"**Status:** {parsed.get('status', 'N/A')}\n"
-                    report += f"**Progress:** {parsed.get('progress', 'N/A')}\n\n"
+                    parts.append(f"**Epic:** {parsed.get('epic_name', 'N/A')}\n")
+                    parts.append(f"**Owner:** {parsed.get('owner', 'N/A')}\n")
+                    parts.append(f"**Status:** {parsed.get('status', 'N/A')}\n")
+                    parts.append(f"**Progress:** {parsed.get('progress', 'N/A')}\n\n")
                     
                     # Add key sections
                     if parsed.get('what_happened'):
-                        report += "**Recent Progress:**\n"
+                        parts.append("**Recent Progress:**\n")
                         for item in parsed['what_happened'][:3]:  # Limit to 3 items
-                            report += f"- {item}\n"
-                        report += "\n"
+                            parts.append(f"- {item}\n")
+                        parts.append("\n")
                     
                     if parsed.get('risks_blockers'):
-                        report += "**Risks/Blockers:**\n"
+                        parts.append("**Risks/Blockers:**\n")
                         for item in parsed['risks_blockers'][:2]:  # Limit to 2 items
-                            report += f"- {item}\n"
-                        report += "\n"
+                            parts.append(f"- {item}\n")
+                        parts.append("\n")
                     
                     if parsed.get('next_steps'):
-                        report += "**Next Steps:**\n"
+                        parts.append("**Next Steps:**\n")
                         for item in parsed['next_steps'][:3]:  # Limit to 3 items
-                            report += f"- {item}\n"
-                        report += "\n"
+                            parts.append(f"- {item}\n")
+                        parts.append("\n")
                 else:
                     # Fallback to raw content extraction
                     lines = latest_update['comment_body'].split('\n')
@@ -596,21 +1115,187 @@ def generate_board_report(epic_updates_data: str, format_type: str = "executive"
                             break
                     
                     if epic_content:
-                        report += "**Update Summary:**\n"
-                        report += "```\n" + '\n'.join(epic_content) + "\n```\n\n"
+                        parts.append("**Update Summary:**\n")
+                        parts.append("```\n" + '\n'.join(epic_content) + "\n```\n\n")
                 
         else:  # detailed format
-            report += "## Detailed EPIC Updates\n\n"
+            parts.append("## Detailed EPIC Updates\n\n")
             
             for update in data['updates']:
-                report += f"### Issue #{update['issue_number']}: {update['issue_title']}\n"
-                report += f"**Author:** @{update['author']}\n"
-                report += f"**Date:** {update['created_at']}\n\n"
-                report += "**Full Update:**\n"
-                report += "```\n" + update['comment_body'] + "\n```\n\n"
-                report += "---\n\n"
+                parts.append(f"### Issue #{update['issue_number']}: {update['issue_title']}\n")
+                parts.append(f"**Author:** @{update['author']}\n")
+                parts.append(f"**Date:** {update['created_at']}\n\n")
+                parts.append("**Full Update:**\n")
+                parts.append("```\n" + update['comment_body'] + "\n```\n\n")
+                parts.append("---\n\n")
+        
+        return "".join(parts)
+
+@dataclass
+class TrendAccumulator:
+    """Contributor, issue and date tallies behind analyze_epic_trends"""
+    author_counts: Counter = field(default_factory=Counter)
+    issue_counts: Counter = field(default_factory=Counter)
+    issue_titles: Dict[int, str] = field(default_factory=dict)
+    date_counts: Counter = field(default_factory=Counter)
+    
+    def add(self, update: Dict) -> None:
+        """Fold one update into the tallies"""
+        self.author_counts[update['author']] += 1
+        self.issue_counts[update['issue_number']] += 1
+        self.issue_titles.setdefault(update['issue_number'], update['issue_title'])
+        self.date_counts[update['created_at'][:10]] += 1
+    
+    def format(self, data: Dict) -> str:
+        """Render the trend analysis"""
+        total_updates = len(data['updates'])
+        unique_issues = len(self.issue_counts)
+        unique_authors = len(self.author_counts)
+        
+        parts = [f"# EPIC Updates Trend Analysis\n\n"]
+        parts.append(_period_line(data, "Analysis Period"))
+        parts.append(f"**Repository:** {data['repo']}\n\n")
+        
+        parts.append("## Key Metrics\n\n")
+        parts.append(f"- **Total EPIC Updates:** {total_updates}\n")
+        parts.append(f"- **Unique Issues with Updates:** {unique_issues}\n")
+        parts.append(f"- **Active Contributors:** {unique_authors}\n")
+        parts.append(f"- **Average Updates per Issue:** {total_updates/unique_issues:.1f}\n\n")
+        
+        parts.append("## Top Contributors\n\n")
+        for author, count in self.author_counts.most_common(5):
+            parts.append(f"- **@{author}:** {count} updates\n")
+        
+        parts.append("\n## Most Active Issues\n\n")
+        for issue_num, count in self.issue_counts.most_common(5):
+            issue_title = self.issue_titles[issue_num]
+            parts.append(f"- **Issue #{issue_num}:** {count} updates - {issue_title}\n")
+        
+        parts.append("\n## Update Frequency\n\n")
+        if self.date_counts:
+            avg_daily = total_updates / len(self.date_counts)
+            parts.append(f"- **Average daily updates:** {avg_daily:.1f}\n")
+            busiest_day, busiest_count = self.date_counts.most_common(1)[0]
+            parts.append(f"- **Busiest day:** {busiest_day} ({busiest_count} updates)\n")
+        
+        return "".join(parts)
+
+@dataclass
+class StatusAccumulator:
+    """Status, progress, risk and scope change data behind generate_epic_status_summary"""
+    status_counts: Counter = field(default_factory=Counter)
+    progress_data: List[Dict] = field(default_factory=list)
+    epics_with_risks: List[Dict] = field(default_factory=list)
+    epics_with_scope_changes: List[Dict] = field(default_factory=list)
+    
+    def add(self, update: Dict) -> None:
+        """Fold one update's parsed template data into the summary"""
+        if 'parsed_data' in update and update['parsed_data']:
+            parsed = update['parsed_data']
+            
+            # Count statuses
+            if parsed.get('status'):
+                self.status_counts[parsed['status']] += 1
+            
+            # Collect progress data
+            if parsed.get('progress'):
+                self.progress_data.append({
+                    'epic': parsed.get('epic_name', f"Issue #{update['issue_number']}"),
+                    'progress': parsed['progress'],
+                    'status': parsed.get('status', 'Unknown')
+                })
+            
+            # Collect epics with risks
+            if parsed.get('risks_blockers'):
+                self.epics_with_risks.append({
+                    'epic': parsed.get('epic_name', f"Issue #{update['issue_number']}"),
+                    'owner': parsed.get('owner', 'Unknown'),
+                    'risks': parsed['risks_blockers']
+                })
+            
+            # Collect epics with scope changes
+            if parsed.get('scope_changes'):
+                self.epics_with_scope_changes.append({
+                    'epic': parsed.get('epic_name', f"Issue #{update['issue_number']}"),
+                    'owner': parsed.get('owner', 'Unknown'),
+                    'changes': parsed['scope_changes']
+                })
+    
+    def format(self, data: Dict) -> str:
+        """Render the status summary"""
+        parts = [f"# EPIC Status Summary\n\n"]
+        parts.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        parts.append(f"**Repository:** {data['repo']}\n")
+        parts.append(_period_line(data, "Period"))
+        parts.append(f"**Total EPIC Updates:** {data['total_updates']}\n\n")
+        
+        # Status breakdown
+        if self.status_counts:
+            parts.append("## Status Breakdown\n\n")
+            for status, count in self.status_counts.most_common():
+                parts.append(f"- **{status}:** {count} epics\n")
+            parts.append("\n")
+        
+        # Progress overview
+        if self.progress_data:
+            parts.append("## Progress Overview\n\n")
+            for item in self.progress_data[:10]:  # Show top 10
+                parts.append(f"- **{item['epic']}:** {item['progress']} ({item['status']})\n")
+            parts.append("\n")
+        
+        # Risks and blockers
+        if self.epics_with_risks:
+            parts.append("## Epics with Risks/Blockers\n\n")
+            for epic in self.epics_with_risks[:5]:  # Show top 5
+                parts.append(f"### {epic['epic']} (Owner: {epic['owner']})\n")
+                for risk in epic['risks'][:3]:  # Show top 3 risks
+                    parts.append(f"- {risk}\n")
+                parts.append("\n")
+        
+        # Scope changes
+        if self.epics_with_scope_changes:
+            parts.append("## Epics with Scope Changes\n\n")
+            for epic in self.epics_with_scope_changes[:5]:  # Show top 5
+                parts.append(f"### {epic['epic']} (Owner: {epic['owner']})\n")
+                for change in epic['changes'][:3]:  # Show top 3 changes
+                    parts.append(f"- {change}\n")
+                parts.append("\n")
+        
+        return "".join(parts)
+
+def _accumulate(updates: List[Dict], *accumulators) -> None:
+    """Feed every update to each accumulator in a single pass"""
+    for update in updates:
+        for accumulator in accumulators:
+            accumulator.add(update)
+
+def _load_report_data(epic_updates_data: Union[str, Dict]) -> Dict:
+    """Report input given either as JSON text or as an already decoded dict"""
+    if isinstance(epic_updates_data, str):
+        return json_utils.loads(epic_updates_data)
+    return epic_updates_data
+
+@mcp.tool()
+def generate_board_report(epic_updates_data: str, format_type: str = "executive") -> str:
+    """
+    Generate a board of directors report from EPIC updates.
+    
+    Args:
+        epic_updates_data: JSON string containing EPIC updates from crawl_epic_updates
+        format_type: Report format - 'executive', 'detailed', or 'summary'
+    
+    Returns:
+        Formatted board report
+    """
+    try:
+        data = _load_report_data(epic_updates_data)
+        
+        if not data.get('updates'):
+            return "No EPIC updates found for the specified period."
         
-        return report
+        board = BoardAccumulator()
+        _accumulate(data['updates'], board)
+        return board.format(data, format_type)
         
     except Exception as e:
         return f"Error generating board report: {str(e)}"
@@ -627,63 +1312,14 @@ def analyze_epic_trends(epic_updates_data: str) -> str:
         Analysis of EPIC update trends
     """
     try:
-        import json
-        from collections import Counter, defaultdict
-        
-        data = json.loads(epic_updates_data) if isinstance(epic_updates_data, str) else epic_updates_data
+        data = _load_report_data(epic_updates_data)
         
         if not data.get('updates'):
             return "No EPIC updates found for analysis."
         
-        updates = data['updates']
-        
-        # Analyze trends
-        author_counts = Counter(update['author'] for update in updates)
-        issue_counts = Counter(update['issue_number'] for update in updates)
-        
-        # Date analysis
-        dates = [update['created_at'][:10] for update in updates]
-        date_counts = Counter(dates)
-        
-        # Content analysis
-        total_updates = len(updates)
-        unique_issues = len(set(update['issue_number'] for update in updates))
-        unique_authors = len(author_counts)
-        
-        analysis = f"# EPIC Updates Trend Analysis\n\n"
-        
-        # Handle different data sources (some have days_back, others don't)
-        if 'days_back' in data:
-            analysis += f"**Analysis Period:** Last {data['days_back']} days\n"
-        elif 'target_date' in data:
-            analysis += f"**Target Date:** {data['target_date']}\n"
-        else:
-            analysis += f"**Analysis Period:** All available updates\n"
-            
-        analysis += f"**Repository:** {data['repo']}\n\n"
-        
-        analysis += "## Key Metrics\n\n"
-        analysis += f"- **Total EPIC Updates:** {total_updates}\n"
-        analysis += f"- **Unique Issues with Updates:** {unique_issues}\n"
-        analysis += f"- **Active Contributors:** {unique_authors}\n"
-        analysis += f"- **Average Updates per Issue:** {total_updates/unique_issues:.1f}\n\n"
-        
-        analysis += "## Top Contributors\n\n"
-        for author, count in author_counts.most_common(5):
-            analysis += f"- **@{author}:** {count} updates\n"
-        
-        analysis += "\n## Most Active Issues\n\n"
-        for issue_num, count in issue_counts.most_common(5):
-            issue_title = next(u['issue_title'] for u in updates if u['issue_number'] == issue_num)
-            analysis += f"- **Issue #{issue_num}:** {count} updates - {issue_title}\n"
-        
-        analysis += "\n## Update Frequency\n\n"
-        if date_counts:
-            avg_daily = total_updates / len(date_counts)
-            analysis += f"- **Average daily updates:** {avg_daily:.1f}\n"
-            analysis += f"- **Busiest day:** {max(date_counts, key=date_counts.get)} ({max(date_counts.values())} updates)\n"
-        
-        return analysis
+        trends = TrendAccumulator()
+        _accumulate(data['updates'], trends)
+        return trends.format(data)
         
     except Exception as e:
         return f"Error analyzing EPIC trends: {str(e)}"
@@ -700,105 +1336,43 @@ def generate_epic_status_summary(epic_updates_data: str) -> str:
         Structured EPIC status summary
     """
     try:
-        import json
-        from collections import Counter
-        
-        data = json.loads(epic_updates_data) if isinstance(epic_updates_data, str) else epic_updates_data
+        data = _load_report_data(epic_updates_data)
         
         if not data.get('updates'):
             return "No EPIC updates found for the specified period."
         
-        updates = data['updates']
+        status = StatusAccumulator()
+        _accumulate(data['updates'], status)
+        return status.format(data)
         
-        # Collect structured data
-        status_counts = Counter()
-        progress_data = []
-        epics_with_risks = []
-        epics_with_scope_changes = []
-        
-        for update in updates:
-            if 'parsed_data' in update and update['parsed_data']:
-                parsed = update['parsed_data']
-                
-                # Count statuses
-                if parsed.get('status'):
-                    status_counts[parsed['status']] += 1
-                
-                # Collect progress data
-                if parsed.get('progress'):
-                    progress_data.append({
-                        'epic': parsed.get('epic_name', f"Issue #{update['issue_number']}"),
-                        'progress': parsed['progress'],
-                        'status': parsed.get('status', 'Unknown')
-                    })
-                
-                # Collect epics with risks
-                if parsed.get('risks_blockers'):
-                    epics_with_risks.append({
-                        'epic': parsed.get('epic_name', f"Issue #{update['issue_number']}"),
-                        'owner': parsed.get('owner', 'Unknown'),
-                        'risks': parsed['risks_blockers']
-                    })
-                
-                # Collect epics with scope changes
-                if parsed.get('scope_changes'):
-                    epics_with_scope_changes.append({
-                        'epic': parsed.get('epic_name', f"Issue #{update['issue_number']}"),
-                        'owner': parsed.get('owner', 'Unknown'),
-                        'changes': parsed['scope_changes']
-                    })
-        
-        # Generate summary report
-        summary = f"# EPIC Status Summary\n\n"
-        summary += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        summary += f"**Repository:** {data['repo']}\n"
-        
-        # Handle different data sources (some have days_back, others don't)
-        if 'days_back' in data:
-            summary += f"**Period:** Last {data['days_back']} days\n"
-        elif 'target_date' in data:
-            summary += f"**Target Date:** {data['target_date']}\n"
-        else:
-            summary += f"**Period:** All available updates\n"
-            
-        summary += f"**Total EPIC Updates:** {data['total_updates']}\n\n"
-        
-        # Status breakdown
-        if status_counts:
-            summary += "## Status Breakdown\n\n"
-            for status, count in status_counts.most_common():
-                summary += f"- **{status}:** {count} epics\n"
-            summary += "\n"
-        
-        # Progress overview
-        if progress_data:
-            summary += "## Progress Overview\n\n"
-            for item in progress_data[:10]:  # Show top 10
-                summary += f"- **{item['epic']}:** {item['progress']} ({item['status']})\n"
-            summary += "\n"
-        
-        # Risks and blockers
-        if epics_with_risks:
-            summary += "## Epics with Risks/Blockers\n\n"
-            for epic in epics_with_risks[:5]:  # Show top 5
-                summary += f"### {epic['epic']} (Owner: {epic['owner']})\n"
-                for risk in epic['risks'][:3]:  # Show top 3 risks
-                    summary += f"- {risk}\n"
-                summary += "\n"
+    except Exception as e:
+        return f"Error generating EPIC status summary: {str(e)}"
+
+@mcp.tool()
+def generate_all_reports(epic_updates_data: str, format_type: str = "executive") -> str:
+    """
+    Generate the board report, status summary and trend analysis together,
+    parsing the data and walking the updates only once.
+    
+    Args:
+        epic_updates_data: JSON string containing EPIC updates from crawl_epic_updates
+        format_type: Board report format - 'executive', 'detailed', or 'summary'
+    
+    Returns:
+        The three reports, separated by horizontal rules
+    """
+    try:
+        data = _load_report_data(epic_updates_data)
         
-        # Scope changes
-        if epics_with_scope_changes:
-            summary += "## Epics with Scope Changes\n\n"
-            for epic in epics_with_scope_changes[:5]:  # Show top 5
-                summary += f"### {epic['epic']} (Owner: {epic['owner']})\n"
-                for change in epic['changes'][:3]:  # Show top 3 changes
-                    summary += f"- {change}\n"
-                summary += "\n"
+        if not data.get('updates'):
+            return "No EPIC updates found for the specified period."
         
-        return summary
+        board, status, trends = BoardAccumulator(), StatusAccumulator(), TrendAccumulator()
+        _accumulate(data['updates'], board, status, trends)
+        return "\n---\n\n".join([board.format(data, format_type), status.format(data), trends.format(data)])
         
     except Exception as e:
-        return f"Error generating EPIC status summary: {str(e)}"
+        return f"Error generating EPIC reports: {str(e)}"
 
 @mcp.tool()
 def process_dated_epic_update(issue_url: str, target_date: str, output_format: str = "board_report") -> str:
@@ -820,22 +1394,58 @@ def process_dated_epic_update(issue_url: str, target_date: str, output_format: s
         if isinstance(epic_data, str) and epic_data.startswith("Error"):
             return epic_data
         
-        if epic_data['total_updates'] == 0:
-            return f"No EPIC updates found for issue {issue_url} on {target_date}"
-        
-        # Process based on output format
-        if output_format == "raw_data":
-            return epic_data
-        elif output_format == "summary":
-            return generate_epic_status_summary(epic_data)
-        elif output_format == "detailed":
-            return generate_board_report(epic_data, "detailed")
-        else:  # board_report (default)
-            return generate_board_report(epic_data, "executive")
+        return _format_dated_epic_data(epic_data, issue_url, target_date, output_format)
     
     except Exception as e:
         return f"Error processing dated EPIC update: {str(e)}"
 
+def process_dated_epic_update_result(issue_url: str, target_date: str, output_format: str = "board_report") -> DatedEpicResult:
+    """
+    Like process_dated_epic_update, but report failures as a structured result
+    so callers can branch on the HTTP status instead of parsing error text.
+    
+    Args:
+        issue_url: Full GitHub issue URL (e.g., 'https://github.com/LDFLK/launch/issues/151')
+        target_date: Specific date in YYYY-MM-DD format for the EPIC update
+        output_format: Output format - 'board_report', 'summary', 'detailed', 'raw_data'
+    
+    Returns:
+        DatedEpicResult with the processed output, or the error and its HTTP status
+    """
+    issue = _parse_issue_url(issue_url)
+    if issue is None:
+        return DatedEpicResult(False, "Error processing dated EPIC update: invalid GitHub issue URL format")
+    
+    try:
+        epic_data = _collect_issue_epic_updates(issue_url, *issue, target_date)
+    except RateLimitError as e:
+        return DatedEpicResult(False, f"Error extracting EPIC updates from issue: {e}", e.status_code)
+    except requests.HTTPError as e:
+        status_code = e.response.status_code if e.response is not None else None
+        return DatedEpicResult(False, f"Error extracting EPIC updates from issue: {e}", status_code)
+    except Exception as e:
+        return DatedEpicResult(False, f"Error extracting EPIC updates from issue: {e}")
+    
+    try:
+        return DatedEpicResult(True, _format_dated_epic_data(epic_data, issue_url, target_date, output_format))
+    except Exception as e:
+        return DatedEpicResult(False, f"Error processing dated EPIC update: {e}")
+
+def _format_dated_epic_data(epic_data: Dict, issue_url: str, target_date: str, output_format: str) -> Union[str, Dict]:
+    """Render one issue's dated EPIC updates in the requested output format"""
+    if epic_data['total_updates'] == 0:
+        return f"No EPIC updates found for issue {issue_url} on {target_date}"
+    
+    # Process based on output format
+    if output_format == "raw_data":
+        return epic_data
+    elif output_format == "summary":
+        return generate_epic_status_summary(epic_data)
+    elif output_format == "detailed":
+        return generate_board_report(epic_data, "detailed")
+    else:  # board_report (default)
+        return generate_board_report(epic_data, "executive")
+
 @mcp.tool()
 def get_epic_update_by_date_range(repo: str, start_date: str, end_date: str, output_format: str = "board_report") -> str:
     """
@@ -851,11 +1461,8 @@ def get_epic_update_by_date_range(repo: str, start_date: str, end_date: str, out
         Processed EPIC updates in the requested format
     """
     try:
-        # Get EPIC updates from the date range
-        epic_data = crawl_epic_updates(repo, start_date=start_date, end_date=end_date)
-        
-        if isinstance(epic_data, str) and epic_data.startswith("Error"):
-            return epic_data
+        # Get EPIC updates from the date range as a dict, without going through the tool
+        epic_data = collect_epic_updates(repo, start_date=start_date, end_date=end_date)
         
         if epic_data['total_updates'] == 0:
             return f"No EPIC updates found for {repo} between {start_date} and {end_date}"
@@ -870,5 +1477,7 @@ def get_epic_update_by_date_range(repo: str, start_date: str, end_date: str, out
         else:  # board_report (default)
             return generate_board_report(epic_data, "executive")
     
+    except CrawlError as e:
+        return str(e)
     except Exception as e:
         return f"Error processing EPIC updates by date range: {str(e)}"
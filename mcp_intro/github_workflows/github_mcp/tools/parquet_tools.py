@@ -14,13 +14,17 @@ except ImportError:
             return decorator
     mcp = DummyMCP()
 
-from ..utils.file_reader import read_parquet_summary
-import pandas as pd
+from ..utils.file_reader import read_parquet_summary, resolve_data_file, slice_batches, format_batches_text
+import pyarrow as pa
+import pyarrow.parquet as pq
 from pathlib import Path
-import os
+from typing import List, Optional, Tuple
 
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
-EXTERNAL_DATA_DIR = os.getenv('EXTERNAL_DATA_DIR')
+DATA_DIR_STR = str(DATA_DIR)
+
+# Parquet files are decoded and formatted this many rows at a time
+PARQUET_BATCH_SIZE = 65536
 
 @mcp.tool()
 def summarize_parquet_file(filename: str) -> str:
@@ -35,14 +39,62 @@ def summarize_parquet_file(filename: str) -> str:
 
 
 @mcp.tool()
-def read_parquet_file(filename: str) -> str:
+def read_parquet_file(filename: str, columns: Optional[List[str]] = None,
+                      offset: int = 0, limit: Optional[int] = None,
+                      filter_expr: Optional[str] = None) -> str:
     """
     Read a Parquet file and return the contents.
     Args:
         filename: Name of the Parquet file in the /data directory (e.g., 'sample.parquet')
+        columns: Names of the columns to read (default: all); other columns are never decoded
+        offset: Number of rows to skip (default: 0)
+        limit: Maximum number of rows to return (default: all); page through
+            large files with offset/limit to keep each response small
+        filter_expr: Only return rows matching this filter, e.g. "score > 10 AND status == 'open'"
+            (comparisons with literals combined with AND, OR, NOT and parentheses);
+            offset/limit then apply to the matching rows, which are numbered from 0
     Returns:
         A string describing the file's contents.
     """
-    file_path = DATA_DIR / filename
-    df = pd.read_parquet(file_path)
-    return df.to_string()
\ No newline at end of file
+    if offset < 0 or (limit is not None and limit < 0):
+        raise ValueError("offset and limit must not be negative")
+    file_path = resolve_data_file(DATA_DIR_STR, filename)
+    if filter_expr:
+        # pyarrow.dataset loads pandas, so it is only imported for filtered reads
+        import pyarrow.dataset as ds
+        from ..utils.filter_expr import parse_filter
+
+        # Pushed down into the scan: row groups whose statistics rule out a
+        # match are skipped without being decoded
+        dataset = ds.dataset(file_path, format="parquet")
+        batches = dataset.to_batches(
+            columns=columns, filter=parse_filter(filter_expr), batch_size=PARQUET_BATCH_SIZE
+        )
+        schema = _projected_schema(dataset.schema, columns)
+        return format_batches_text(slice_batches(batches, offset, limit), schema, offset)
+
+    # Memory-map the file so column chunks are decoded straight from the page cache
+    parquet_file = pq.ParquetFile(file_path, memory_map=True)
+    batches = parquet_file.iter_batches(
+        batch_size=PARQUET_BATCH_SIZE, columns=columns, use_pandas_metadata=True
+    )
+    # Batches are formatted one at a time and reading stops after the last
+    # requested row, so memory use is bounded by a batch rather than the file
+    index_start, index_step = _range_index(parquet_file)
+    schema = _projected_schema(parquet_file.schema_arrow, columns)
+    return format_batches_text(slice_batches(batches, offset, limit), schema, offset, index_start, index_step)
+
+
+def _projected_schema(schema: pa.Schema, columns: Optional[List[str]]) -> pa.Schema:
+    """Schema of the selected columns (default: all); pandas metadata is dropped from projections"""
+    if columns is None:
+        return schema
+    return pa.schema([schema.field(name) for name in columns])
+
+
+def _range_index(parquet_file: pq.ParquetFile) -> Tuple[int, int]:
+    """Start and step of the RangeIndex a file was written with by pandas (default: 0, 1)"""
+    index_columns = (parquet_file.schema_arrow.pandas_metadata or {}).get('index_columns', [])
+    if len(index_columns) == 1 and isinstance(index_columns[0], dict) and index_columns[0].get('kind') == 'range':
+        return index_columns[0]['start'], index_columns[0]['step']
+    return 0, 1
\ No newline at end of file
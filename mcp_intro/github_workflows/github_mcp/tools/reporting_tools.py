@@ -2,9 +2,23 @@
 
 import os
 import json
-import requests
+import hashlib
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
+
+from ..utils import json_utils
+from ..utils.http_cache import DEFAULT_CACHE_PATH, ResponseCache, cache_from_env
+
+logger = logging.getLogger(__name__)
+
+# requests is imported when the first session is created, so loading the
+# tools (e.g. at MCP server start-up) does not pay for it
+if TYPE_CHECKING:
+    import requests
 
 # Try to import MCP server, but make it optional
 try:
@@ -20,76 +34,23 @@ except ImportError:
             return decorator
     mcp = DummyMCP()
 
-
-class EpicReportSummarizer:
-    """Summarizes EPIC reports using DeepSeek LLM"""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or os.getenv('DEEPSEEK_API_KEY')
-        
-        if not self.api_key:
-            print("⚠️  Warning: DEEPSEEK_API_KEY environment variable not set")
-            print("   Set it with: export DEEPSEEK_API_KEY='your-api-key'")
-    
-    def _call_deepseek_api(self, prompt: str, system_prompt: str = None, max_tokens: int = 1000) -> str:
-        """Call DeepSeek API with the given prompt"""
-        
-        if not self.api_key:
-            return "Error: DeepSeek API key not configured"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        data = {
-            "model": "deepseek-chat",
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": 0.7
-        }
-        
-        try:
-            response = requests.post(
-                "https://api.deepseek.com/v1/chat/completions",
-                headers=headers,
-                json=data,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                return response.json()["choices"][0]["message"]["content"]
-            else:
-                return f"Error calling DeepSeek API: {response.status_code} - {response.text}"
-        except Exception as e:
-            return f"Error calling DeepSeek API: {str(e)}"
-    
-    def generate_epic_summary(self, epic_data: Dict) -> str:
-        """Generate a detailed summary for a single EPIC"""
-        
-        repo = epic_data.get('repo', 'N/A')
-        issue_number = epic_data.get('issue_number', 'N/A')
-        
-        prompt = f"""
+# Prompt for the summary of a single EPIC update, filled from the update's
+# fields; fields the update lacks read N/A
+EPIC_SUMMARY_PROMPT = """
 You are a technical project manager creating a summary of an EPIC update from GitHub.
 
 EPIC Information:
-- Repository: {epic_data.get('repo', 'N/A')}
-- Issue Number: {epic_data.get('issue_number', 'N/A')}
-- Issue Title: {epic_data.get('issue_title', 'N/A')}
-- Author: {epic_data.get('author', 'N/A')}
-- Date: {epic_data.get('created_at', 'N/A')}
+- Repository: {repo}
+- Issue Number: {issue_number}
+- Issue Title: {issue_title}
+- Author: {author}
+- Date: {created_at}
 
 EPIC Update Content:
-{epic_data.get('comment_body', 'N/A')}
+{comment_body}
 
 Parsed Data:
-{json.dumps(epic_data.get('parsed_data', {}), indent=2)}
+{parsed_data_json}
 
 Please create a comprehensive summary in markdown format that includes:
 
@@ -125,35 +86,9 @@ Format the response as:
 
 Make the summary engaging, technical but accessible, and highlight the most important achievements.
 """
-        
-        return self._call_deepseek_api(
-            prompt=prompt,
-            system_prompt="You are a technical project manager creating EPIC summaries.",
-            max_tokens=1000
-        )
-    
-    def generate_overall_summary(self, report_data: Dict) -> str:
-        """Generate an overall summary of all EPICs"""
-        
-        total_updates = report_data.get('raw_epic_data', {}).get('total_updates', 0)
-        repo = report_data.get('repo', 'N/A')
-        target_date = report_data.get('target_date', 'N/A')
-        
-        updates = report_data.get('raw_epic_data', {}).get('updates', [])
-        
-        # Extract key information from all updates
-        epic_summaries = []
-        for update in updates:
-            parsed = update.get('parsed_data', {})
-            epic_summaries.append({
-                'issue': update.get('issue_number'),
-                'title': update.get('issue_title'),
-                'status': parsed.get('status', 'Unknown'),
-                'progress': parsed.get('progress', ''),
-                'what_happened': parsed.get('what_happened', [])
-            })
-        
-        prompt = f"""
+
+# Prompt for the summary across all EPIC updates of a report
+OVERALL_SUMMARY_PROMPT = """
 You are creating an overall summary of EPIC updates for a project.
 
 Project Information:
@@ -162,7 +97,7 @@ Project Information:
 - Total EPIC Updates: {total_updates}
 
 EPIC Summaries:
-{json.dumps(epic_summaries, indent=2)}
+{epic_summaries_json}
 
 Please create an overall project summary in markdown format that includes:
 
@@ -190,6 +125,192 @@ Format as:
 
 Make it engaging and highlight the most impactful work done across all EPICs.
 """
+
+# LLM requests in flight at once while summarizing a report
+MAX_CONCURRENT_SUMMARIES = 8
+
+DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
+
+# Environment variables enabling the completion cache: an SQLite path, or "1"
+# for DEFAULT_COMPLETION_CACHE_PATH. It is kept apart from the GitHub response cache.
+COMPLETION_CACHE_ENV_VAR = "DEEPSEEK_CACHE"
+# Seconds a cached completion is reused (default: DEFAULT_COMPLETION_CACHE_TTL)
+COMPLETION_CACHE_TTL_ENV_VAR = "DEEPSEEK_CACHE_TTL"
+DEFAULT_COMPLETION_CACHE_PATH = DEFAULT_CACHE_PATH.with_name("completion_cache.sqlite")
+DEFAULT_COMPLETION_CACHE_TTL = 24 * 60 * 60
+
+
+def completion_cache_from_env() -> Optional[ResponseCache]:
+    """Return the process-wide completion cache configured by DEEPSEEK_CACHE, or None if unset"""
+    return cache_from_env(COMPLETION_CACHE_ENV_VAR, COMPLETION_CACHE_TTL_ENV_VAR,
+                          DEFAULT_COMPLETION_CACHE_PATH, DEFAULT_COMPLETION_CACHE_TTL)
+
+
+def create_session(pool_size: int = 16) -> 'requests.Session':
+    """
+    Create a keep-alive session for the DeepSeek API.
+    
+    Rate limiting (429) and transient server errors are retried with backoff.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # Chat completions have no side effects, so POSTs are safe to retry
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+_shared_session: Optional['requests.Session'] = None
+_shared_session_lock = threading.Lock()
+
+
+def shared_session() -> 'requests.Session':
+    """
+    Session used by every summarizer not given its own, so that the tools, which
+    create a summarizer per call, reuse connections and their TLS handshakes
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+
+def _iter_stream_content(response: 'requests.Response') -> Iterator[str]:
+    """Yield the content deltas of a streamed chat completion (server-sent events)"""
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        payload = line[5:].strip()
+        if payload == b"[DONE]":
+            break
+        for choice in json_utils.loads(payload).get("choices", []):
+            content = choice.get("delta", {}).get("content")
+            if content:
+                yield content
+
+
+class EpicReportSummarizer:
+    """Summarizes EPIC reports using DeepSeek LLM"""
+    
+    def __init__(self, api_key: Optional[str] = None, session: Optional['requests.Session'] = None,
+                 cache: Optional[ResponseCache] = None):
+        """
+        Args:
+            api_key: DeepSeek API key (default: DEEPSEEK_API_KEY)
+            session: Session to send requests with (default: a shared keep-alive session)
+            cache: Cache for completions, reused within its TTL (default: the one configured by DEEPSEEK_CACHE, if any)
+        """
+        self.api_key = api_key or os.getenv('DEEPSEEK_API_KEY')
+        self.session = session or shared_session()
+        self.cache = cache if cache is not None else completion_cache_from_env()
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        if not self.api_key:
+            print("⚠️  Warning: DEEPSEEK_API_KEY environment variable not set")
+            print("   Set it with: export DEEPSEEK_API_KEY='your-api-key'")
+    
+    def _call_deepseek_api(self, prompt: str, system_prompt: str = None, max_tokens: int = 1000) -> str:
+        """Call DeepSeek API with the given prompt"""
+        
+        if not self.api_key:
+            return "Error: DeepSeek API key not configured"
+        
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
+        data = {
+            "model": "deepseek-chat",
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": 0.7
+        }
+        
+        # Completions are sampled, so they are only reused within the cache TTL,
+        # and only for exactly the same request
+        cache_key = None
+        if self.cache is not None and self.cache.ttl > 0:
+            digest = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+            cache_key = f"deepseek:{digest}"
+            cached = self.cache.get(cache_key)
+            if cached and self.cache.is_fresh(cached[2]):
+                return cached[1].decode('utf-8')
+        
+        try:
+            # Stream the completion: tokens are consumed as they are generated,
+            # and the timeout applies between chunks rather than to the whole answer
+            with self.session.post(
+                DEEPSEEK_API_URL,
+                headers=self.headers,
+                json={**data, "stream": True},
+                timeout=30,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    return f"Error calling DeepSeek API: {response.status_code} - {response.text}"
+                content = "".join(_iter_stream_content(response))
+            
+            # An empty answer (e.g. a stream cut off before any content) is not worth keeping
+            if cache_key and content:
+                self.cache.set(cache_key, '', content.encode('utf-8'))
+            return content
+        except Exception as e:
+            return f"Error calling DeepSeek API: {str(e)}"
+    
+    def generate_epic_summary(self, epic_data: Dict) -> str:
+        """Generate a detailed summary for a single EPIC"""
+        
+        context = defaultdict(lambda: 'N/A', epic_data)
+        context['parsed_data_json'] = json_utils.dumps(epic_data.get('parsed_data', {}), indent=True)
+        prompt = EPIC_SUMMARY_PROMPT.format_map(context)
+        
+        return self._call_deepseek_api(
+            prompt=prompt,
+            system_prompt="You are a technical project manager creating EPIC summaries.",
+            max_tokens=1000
+        )
+    
+    def generate_overall_summary(self, report_data: Dict) -> str:
+        """Generate an overall summary of all EPICs"""
+        
+        total_updates = report_data.get('raw_epic_data', {}).get('total_updates', 0)
+        repo = report_data.get('repo', 'N/A')
+        target_date = report_data.get('target_date', 'N/A')
+        
+        updates = report_data.get('raw_epic_data', {}).get('updates', [])
+        
+        # Extract key information from all updates
+        epic_summaries = []
+        for update in updates:
+            parsed = update.get('parsed_data', {})
+            epic_summaries.append({
+                'issue': update.get('issue_number'),
+                'title': update.get('issue_title'),
+                'status': parsed.get('status', 'Unknown'),
+                'progress': parsed.get('progress', ''),
+                'what_happened': parsed.get('what_happened', [])
+            })
+        
+        prompt = OVERALL_SUMMARY_PROMPT.format(
+            repo=repo,
+            target_date=target_date,
+            total_updates=total_updates,
+            epic_summaries_json=json_utils.dumps(epic_summaries, indent=True)
+        )
         
         return self._call_deepseek_api(
             prompt=prompt,
@@ -200,22 +321,24 @@ Make it engaging and highlight the most impactful work done across all EPICs.
     def generate_complete_summary(self, report_data: Dict) -> str:
         """Generate a complete summary report with overall and individual EPIC summaries"""
         
-        print(f"📊 Processing EPIC report from {report_data.get('repo', 'N/A')}")
-        print(f"📅 Target date: {report_data.get('target_date', 'N/A')}")
-        print(f"📋 Total updates: {report_data.get('raw_epic_data', {}).get('total_updates', 0)}")
-        
-        # Generate overall summary
-        print("🤖 Generating overall project summary...")
-        overall_summary = self.generate_overall_summary(report_data)
+        # Progress goes to the log rather than stdout, which the summary
+        # threads would contend on (and which carries the MCP stdio transport)
+        logger.info(
+            "Processing EPIC report from %s, target date %s, %s total updates",
+            report_data.get('repo', 'N/A'),
+            report_data.get('target_date', 'N/A'),
+            report_data.get('raw_epic_data', {}).get('total_updates', 0)
+        )
         
-        # Generate individual EPIC summaries
         updates = report_data.get('raw_epic_data', {}).get('updates', [])
-        epic_summaries = []
         
-        for i, update in enumerate(updates, 1):
-            print(f"🤖 Generating summary for EPIC {i}/{len(updates)}...")
-            epic_summary = self.generate_epic_summary(update)
-            epic_summaries.append(epic_summary)
+        # The LLM calls are independent and spend their time waiting on the
+        # network, so the overall and per-EPIC summaries are requested concurrently
+        logger.info("Generating overall project summary and %d EPIC summaries", len(updates))
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_SUMMARIES, len(updates) + 1)) as executor:
+            overall_future = executor.submit(self.generate_overall_summary, report_data)
+            epic_summaries = list(executor.map(self.generate_epic_summary, updates))
+            overall_summary = overall_future.result()
         
         # Combine all summaries
         final_report = f"""# EPIC Summary Report
@@ -231,11 +354,10 @@ Make it engaging and highlight the most impactful work done across all EPICs.
 ## Individual EPIC Summaries
 
 """
-        
-        for summary in epic_summaries:
-            final_report += f"{summary}\n\n---\n\n"
-        
-        return final_report
+
+        # Joined once rather than appended per EPIC, which would copy the
+        # growing report each time
+        return final_report + "".join(f"{summary}\n\n---\n\n" for summary in epic_summaries)
 
 
 @mcp.tool()
@@ -244,7 +366,7 @@ def generate_epic_summary_report(epic_report_data: str, output_format: str = "ma
     Generate a comprehensive summary report from EPIC data using DeepSeek LLM.
     
     Args:
-        epic_report_data: JSON string containing EPIC report data from epic_summary_generator
+        epic_report_data: JSON string (or dict) containing EPIC report data from epic_summary_generator
         output_format: Output format - 'markdown' or 'json' (default: markdown)
     
     Returns:
@@ -253,7 +375,7 @@ def generate_epic_summary_report(epic_report_data: str, output_format: str = "ma
     try:
         # Parse the report data
         if isinstance(epic_report_data, str):
-            report_data = json.loads(epic_report_data)
+            report_data = json_utils.loads(epic_report_data)
         else:
             report_data = epic_report_data
         
@@ -264,14 +386,15 @@ def generate_epic_summary_report(epic_report_data: str, output_format: str = "ma
         summary_report = summarizer.generate_complete_summary(report_data)
         
         if output_format.lower() == "json":
-            # Return as JSON
-            return json.dumps({
+            # Return as JSON; the report is a long string, which orjson (when
+            # installed) escapes far faster than the json module
+            return json_utils.dumps({
                 "summary_report": summary_report,
                 "generated_at": datetime.now().isoformat(),
                 "repo": report_data.get('repo'),
                 "target_date": report_data.get('target_date'),
                 "total_updates": report_data.get('raw_epic_data', {}).get('total_updates', 0)
-            }, indent=2)
+            }, indent=True)
         else:
             # Return as markdown
             return summary_report
@@ -294,7 +417,7 @@ def generate_individual_epic_summary(epic_data: str) -> str:
     try:
         # Parse the epic data
         if isinstance(epic_data, str):
-            epic_dict = json.loads(epic_data)
+            epic_dict = json_utils.loads(epic_data)
         else:
             epic_dict = epic_data
         
@@ -322,7 +445,7 @@ def generate_project_overview_summary(epic_report_data: str) -> str:
     try:
         # Parse the report data
         if isinstance(epic_report_data, str):
-            report_data = json.loads(epic_report_data)
+            report_data = json_utils.loads(epic_report_data)
         else:
             report_data = epic_report_data
         
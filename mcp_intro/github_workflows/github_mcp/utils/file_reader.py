@@ -1,10 +1,153 @@
 # utils/file_reader.py
 
-import pandas as pd
+import io
+import os
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Iterator, Optional, Tuple
 
 # Base directory where our data lives
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DATA_DIR_STR = str(DATA_DIR)
+
+# CSV files are parsed in blocks of this many bytes so memory use stays bounded
+CSV_BLOCK_SIZE = 1 << 20
+
+# Resolve a file name inside a data directory
+def resolve_data_file(data_dir: str, filename: str) -> str:
+    """
+    Join a user-supplied file name onto a data directory.
+    Args:
+        data_dir: Absolute data directory
+        filename: File name relative to data_dir
+    Returns:
+        The normalized file path as a string
+    Raises:
+        ValueError: If the name points outside data_dir (absolute path or '..')
+    """
+    file_path = os.path.normpath(os.path.join(data_dir, filename))
+    if os.path.commonpath([file_path, data_dir]) != data_dir:
+        raise ValueError(f"File '{filename}' is outside the data directory")
+    return file_path
+
+# Open a CSV file as a stream of record batches
+def open_csv_batches(file_path: str) -> pa_csv.CSVStreamingReader:
+    """
+    Open a CSV file for incremental, multithreaded parsing.
+    Args:
+        file_path: Path of the CSV file
+    Returns:
+        A reader yielding pyarrow RecordBatches of roughly CSV_BLOCK_SIZE bytes of input,
+        with column types that hold for the whole file
+    """
+    stat = os.stat(file_path)
+    column_types = dict(_csv_column_types(file_path, stat.st_mtime_ns, stat.st_size))
+    convert_options = pa_csv.ConvertOptions(column_types=column_types)
+    return pa_csv.open_csv(file_path, read_options=_csv_read_options(), convert_options=convert_options)
+
+def _csv_read_options() -> pa_csv.ReadOptions:
+    """Read options shared by every streaming pass over a CSV file"""
+    return pa_csv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True)
+
+@lru_cache(maxsize=32)
+def _csv_column_types(file_path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, pa.DataType], ...]:
+    """
+    Column types valid for every row of a CSV file (cached per file version).
+
+    open_csv infers types from the first block only, and raises mid-stream when a
+    later value does not fit (e.g. text in a column of integers). The file is
+    parsed once up front; columns that fail there are read as strings instead.
+    """
+    reader = pa_csv.open_csv(file_path, read_options=_csv_read_options())
+    schema = reader.schema
+    try:
+        for _ in reader:
+            pass
+        return tuple(zip(schema.names, schema.types))
+    except pa.ArrowInvalid:
+        pass
+
+    # Read every column as text and keep an inferred type only if all its values convert
+    as_text = pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in schema.names}, strings_can_be_null=True
+    )
+    types = dict(zip(schema.names, schema.types))
+    for batch in pa_csv.open_csv(file_path, read_options=_csv_read_options(), convert_options=as_text):
+        for name, column in zip(batch.schema.names, batch.columns):
+            if types[name] != pa.string():
+                try:
+                    column.cast(types[name])
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    types[name] = pa.string()
+    return tuple(types.items())
+
+# Select a range of rows from a stream of record batches
+def slice_batches(batches: Iterable[pa.RecordBatch], offset: int, limit: Optional[int]) -> Iterator[pa.RecordBatch]:
+    """
+    Yield the rows [offset, offset + limit) of a batch stream, stopping once the range is read.
+    Args:
+        batches: Record batches in file order
+        offset: Number of rows to skip
+        limit: Maximum number of rows to yield (None for all)
+    Returns:
+        An iterator over the (sliced) batches covering the range
+    """
+    end = None if limit is None else offset + limit
+    start = 0
+    if end is not None and end <= offset:
+        return
+    for batch in batches:
+        stop = start + batch.num_rows
+        if stop > offset:
+            first = max(offset - start, 0)
+            last = batch.num_rows if end is None else min(end - start, batch.num_rows)
+            yield batch.slice(first, last - first)
+        # Stop before the next batch is read (and decoded)
+        if end is not None and stop >= end:
+            break
+        start = stop
+
+# Format record batches as text
+def format_batches_text(batches: Iterable[pa.RecordBatch], schema: pa.Schema, offset: int = 0,
+                        index_start: int = 0, index_step: int = 1) -> str:
+    """
+    Format record batches as human-readable text, one batch at a time.
+    Args:
+        batches: Record batches, starting at row offset of the file
+        schema: Schema of the batches, used to list the columns when there are no rows
+        offset: Row number of the first row in batches
+        index_start, index_step: Range index of the file; each batch's own
+            index restarts at 0, so it is renumbered to continue across batches
+    Returns:
+        The rows formatted like DataFrame.to_string, with a header before the first
+        batch only; column widths are computed per batch, so they can change where
+        one batch ends and the next begins. Without rows, pandas' "Empty DataFrame"
+        output listing the columns.
+    """
+    # pandas is only needed to format rows, so summaries never pay for importing it
+    import pandas as pd
+
+    # Only a single batch is held as a DataFrame at a time
+    out = io.StringIO()
+    row = offset
+    for batch in batches:
+        if batch.num_rows == 0:
+            continue
+        df = batch.to_pandas()
+        # Indexes stored as columns (e.g. a Parquet file's pandas index) are kept as they are
+        if isinstance(df.index, pd.RangeIndex):
+            first = index_start + row * index_step
+            df.index = pd.RangeIndex(first, first + batch.num_rows * index_step, index_step)
+        if row > offset:
+            out.write('\n')
+        out.write(df.to_string(header=row == offset, index_names=row == offset))
+        row += batch.num_rows
+    if row == offset:
+        return schema.empty_table().to_pandas().to_string()
+    return out.getvalue()
 
 # Read CSV file
 def read_csv_summary(filename: str) -> str:
@@ -15,9 +158,19 @@ def read_csv_summary(filename: str) -> str:
     Returns:
         A string describing the file's contents.
     """
-    file_path = DATA_DIR / filename
-    df = pd.read_csv(file_path)
-    return f"CSV file '{filename}' has {len(df)} rows and {len(df.columns)} columns."
+    file_path = resolve_data_file(DATA_DIR_STR, filename)
+    # Keyed on modification time and size so an edited file is read again
+    stat = os.stat(file_path)
+    rows, columns = _count_csv(file_path, stat.st_mtime_ns, stat.st_size)
+    return f"CSV file '{filename}' has {rows} rows and {columns} columns."
+
+@lru_cache(maxsize=32)
+def _count_csv(file_path: str, mtime_ns: int, size: int) -> tuple[int, int]:
+    """Count the rows and columns of a CSV file (cached per file version)"""
+    # Count rows batch by batch instead of loading the whole file
+    reader = open_csv_batches(file_path)
+    rows = sum(batch.num_rows for batch in reader)
+    return rows, len(reader.schema)
 
 # Read Parquet file
 def read_parquet_summary(filename: str) -> str:
@@ -28,6 +181,11 @@ def read_parquet_summary(filename: str) -> str:
     Returns:
         A string describing the file's contents.
     """
-    file_path = DATA_DIR / filename
-    df = pd.read_parquet(file_path)
-    return f"Parquet file '{filename}' has {len(df)} rows and {len(df.columns)} columns."
\ No newline at end of file
+    file_path = resolve_data_file(DATA_DIR_STR, filename)
+    # The footer holds the row count and schema, so no column data is decoded
+    parquet_file = pq.ParquetFile(file_path)
+    schema = parquet_file.schema_arrow
+    # Columns written for a pandas index become the index when read, not columns
+    index_columns = (schema.pandas_metadata or {}).get('index_columns', [])
+    columns = len(schema.names) - sum(1 for column in index_columns if isinstance(column, str))
+    return f"Parquet file '{filename}' has {parquet_file.metadata.num_rows} rows and {columns} columns."
\ No newline at end of file
@@ -0,0 +1,130 @@
+# utils/filter_expr.py
+
+import re
+from typing import List, Tuple
+
+import pyarrow.dataset as ds
+
+# Tokens of the filter language: parentheses, comparison operators, quoted
+# strings, numbers and bare words (column names and keywords)
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<paren>[()])
+      | (?P<op>==|!=|<=|>=|<|>)
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+      | (?P<word>[A-Za-z_][A-Za-z0-9_.]*)
+    )""", re.VERBOSE)
+
+# Comparison operators and the dataset expression each builds
+COMPARISONS = {
+    '==': lambda field, value: field == value,
+    '!=': lambda field, value: field != value,
+    '<': lambda field, value: field < value,
+    '<=': lambda field, value: field <= value,
+    '>': lambda field, value: field > value,
+    '>=': lambda field, value: field >= value,
+}
+
+KEYWORDS = {'and', 'or', 'not', 'true', 'false'}
+
+
+def parse_filter(text: str) -> ds.Expression:
+    """
+    Parse a row filter such as "score > 10 AND (status == 'open' OR NOT archived == true)".
+    Args:
+        text: Comparisons of a column with a literal (number, quoted string, true
+            or false), combined with AND, OR, NOT and parentheses
+    Returns:
+        The equivalent pyarrow dataset expression, usable for predicate pushdown
+    Raises:
+        ValueError: If the text is not a valid filter
+    """
+    parser = _FilterParser(_tokenize(text))
+    expression = parser.parse_or()
+    if parser.pos != len(parser.tokens):
+        raise ValueError(f"Unexpected {parser.tokens[parser.pos][1]!r} in filter")
+    return expression
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    """Split a filter into (kind, text) tokens"""
+    tokens = []
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"Invalid filter syntax at {text[pos:pos + 10].strip()!r}")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        pos = match.end()
+    return tokens
+
+
+class _FilterParser:
+    """Recursive descent parser; NOT binds tighter than AND, AND tighter than OR"""
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek_keyword(self, keyword: str) -> bool:
+        """Consume the next token if it is the given keyword"""
+        if self.pos < len(self.tokens):
+            kind, value = self.tokens[self.pos]
+            if kind == 'word' and value.lower() == keyword:
+                self.pos += 1
+                return True
+        return False
+
+    def _next(self, what: str) -> Tuple[str, str]:
+        """Consume and return the next token"""
+        if self.pos >= len(self.tokens):
+            raise ValueError(f"Filter ended where {what} was expected")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse_or(self) -> ds.Expression:
+        expression = self.parse_and()
+        while self._peek_keyword('or'):
+            expression = expression | self.parse_and()
+        return expression
+
+    def parse_and(self) -> ds.Expression:
+        expression = self.parse_not()
+        while self._peek_keyword('and'):
+            expression = expression & self.parse_not()
+        return expression
+
+    def parse_not(self) -> ds.Expression:
+        if self._peek_keyword('not'):
+            return ~self.parse_not()
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> ds.Expression:
+        kind, value = self._next("a column name")
+        if kind == 'paren' and value == '(':
+            expression = self.parse_or()
+            if self._next("')'") != ('paren', ')'):
+                raise ValueError("Missing ')' in filter")
+            return expression
+        if kind != 'word' or value.lower() in KEYWORDS:
+            raise ValueError(f"Expected a column name in filter, got {value!r}")
+        field = ds.field(value)
+
+        kind, op = self._next("a comparison operator")
+        if kind != 'op':
+            raise ValueError(f"Expected a comparison operator after {value!r}, got {op!r}")
+
+        return COMPARISONS[op](field, self._parse_literal())
+
+    def _parse_literal(self):
+        kind, value = self._next("a value")
+        if kind == 'string':
+            return re.sub(r'\\(.)', r'\1', value[1:-1])
+        if kind == 'number':
+            return float(value) if any(c in value for c in '.eE') else int(value)
+        if kind == 'word' and value.lower() in ('true', 'false'):
+            return value.lower() == 'true'
+        raise ValueError(f"Expected a number, quoted string, true or false in filter, got {value!r}")
@@ -0,0 +1,100 @@
+# utils/http_cache.py
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Default on-disk location for cached GitHub API responses
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "github_mcp" / "http_cache.sqlite"
+
+# Environment variable enabling the cache for crawlers created without one:
+# an SQLite path, or "1" for DEFAULT_CACHE_PATH
+CACHE_ENV_VAR = "GITHUB_MCP_HTTP_CACHE"
+# Seconds that cache reuses responses without revalidating them (default: 0)
+CACHE_TTL_ENV_VAR = "GITHUB_MCP_HTTP_CACHE_TTL"
+
+
+class ResponseCache:
+    """SQLite-backed cache of GitHub API responses used for conditional requests"""
+
+    def __init__(self, path: Optional[str] = None, ttl: float = 0):
+        """
+        Args:
+            path: SQLite file to use (default: ~/.cache/github_mcp/http_cache.sqlite)
+            ttl: Seconds a cached response is reused without revalidating it (default: 0)
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The crawler fetches from a thread pool, so share one connection behind a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, etag TEXT, body BLOB, fetched_at REAL, link TEXT)"
+        )
+        # Caches created before pagination support lack the Link header column
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if 'link' not in columns:
+            self._conn.execute("ALTER TABLE responses ADD COLUMN link TEXT")
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Tuple[str, bytes, float, Optional[str]]]:
+        """Return (etag, body, fetched_at, link) for a cached URL, or None"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT etag, body, fetched_at, link FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+
+    def is_fresh(self, fetched_at: float) -> bool:
+        """Whether an entry is recent enough to skip revalidation"""
+        return time.time() - fetched_at < self.ttl
+
+    def set(self, url: str, etag: str, body: bytes, link: Optional[str] = None) -> None:
+        """Store a response body together with its ETag and Link header"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, body, fetched_at, link) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, body, time.time(), link)
+            )
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark a cached response as revalidated (after a 304 Not Modified)"""
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+# Process-wide caches opened from the environment, keyed by their variable
+_env_caches: Dict[str, ResponseCache] = {}
+_env_cache_lock = threading.Lock()
+
+
+def cache_from_env(env_var: str = CACHE_ENV_VAR, ttl_env_var: str = CACHE_TTL_ENV_VAR,
+                   default_path: Path = DEFAULT_CACHE_PATH, default_ttl: float = 0) -> Optional[ResponseCache]:
+    """
+    Return the process-wide cache configured by an environment variable, or None if unset.
+    Args:
+        env_var: Variable holding an SQLite path, or "1" for default_path (default: GITHUB_MCP_HTTP_CACHE)
+        ttl_env_var: Variable holding the cache TTL in seconds (default: GITHUB_MCP_HTTP_CACHE_TTL)
+        default_path: SQLite file used when env_var is "1"
+        default_ttl: TTL used when ttl_env_var is unset
+    """
+    path = os.getenv(env_var)
+    if not path:
+        return None
+    with _env_cache_lock:
+        if env_var not in _env_caches:
+            ttl = float(os.getenv(ttl_env_var) or default_ttl)
+            _env_caches[env_var] = ResponseCache(default_path if path == "1" else path, ttl=ttl)
+        return _env_caches[env_var]
@@ -0,0 +1,50 @@
+# utils/json_utils.py
+
+import json
+from typing import Any, Union
+
+# Use orjson when it is installed (pip install github_mcp[fast]), otherwise
+# fall back to the standard library with matching output
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with a two space indent
+    Returns:
+        The encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to a JSON string (see dumpb)"""
+    return dumpb(obj, indent).decode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document from str or bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_response(response) -> Any:
+    """Decode the JSON body of a requests response (with orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Test cases for the CSV and Parquet data tools
+"""
+
+import base64
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from github_mcp.tools import csv_tools, parquet_tools
+from github_mcp.tools.csv_tools import read_csv_file
+from github_mcp.tools.parquet_tools import read_parquet_file
+from github_mcp.utils import file_reader
+from github_mcp.utils.file_reader import slice_batches
+from github_mcp.utils.filter_expr import parse_filter
+
+
+def _rows(table):
+    """Values of the id column, in order"""
+    return table.column('id').to_pylist()
+
+
+@pytest.fixture
+def people_table():
+    """Ten rows covering ints, floats, strings (some with quotes) and booleans"""
+    return pa.table({
+        'id': list(range(10)),
+        'score': [5, 15, 25, 35, 45, 55, 65, 75, 85, 95],
+        'ratio': [0.5 * i for i in range(10)],
+        'status': ['open', 'closed', "it's", 'say "hi"', 'open',
+                   'closed', 'open', 'closed', 'open', 'closed'],
+        'archived': [i % 3 == 0 for i in range(10)],
+    })
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch, people_table):
+    """Data directory holding people.csv and people.parquet, used by both tools"""
+    people_table.to_pandas().to_csv(tmp_path / 'people.csv', index=False)
+    pq.write_table(people_table, tmp_path / 'people.parquet', row_group_size=3)
+    monkeypatch.setattr(csv_tools, 'DATA_DIR_STR', str(tmp_path))
+    monkeypatch.setattr(parquet_tools, 'DATA_DIR_STR', str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    """Read files a few rows at a time so offset/limit cross batch boundaries"""
+    # Rows of the fixture are ~25 bytes, so the CSV is parsed in several blocks
+    monkeypatch.setattr(file_reader, 'CSV_BLOCK_SIZE', 64)
+    monkeypatch.setattr(parquet_tools, 'PARQUET_BATCH_SIZE', 3)
+
+
+class TestFilterExpr:
+    """Test the filter_expr language used for Parquet predicate pushdown"""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("score > 50", [5, 6, 7, 8, 9]),
+        ("score >= 55 and score <= 65", [5, 6]),
+        ("id != 0 AND id < 3", [1, 2]),
+        ("ratio == 1.5", [3]),
+        ("archived == true", [0, 3, 6, 9]),
+        ("archived == FALSE and id < 3", [1, 2]),
+        ("score > -1e3 and id == 0", [0]),
+        ("status == 'open'", [0, 4, 6, 8]),
+    ])
+    def test_comparisons(self, people_table, text, expected):
+        """Test comparisons of each literal type"""
+        assert _rows(people_table.filter(parse_filter(text))) == expected
+
+    @pytest.mark.parametrize("text, expected", [
+        # AND binds tighter than OR
+        ("id == 0 or id == 1 and score > 50", [0]),
+        ("(id == 0 or id == 1) and score > 10", [1]),
+        # NOT binds tighter than AND
+        ("not id < 8 and archived == true", [9]),
+        ("not (id < 8 and archived == true)", [1, 2, 4, 5, 7, 8, 9]),
+        ("not not id == 4", [4]),
+        ("((id == 2))", [2]),
+    ])
+    def test_precedence(self, people_table, text, expected):
+        """Test that NOT binds tighter than AND, AND tighter than OR, and parentheses group"""
+        assert _rows(people_table.filter(parse_filter(text))) == expected
+
+    @pytest.mark.parametrize("text, expected", [
+        ("status == \"closed\" and id < 2", [1]),
+        ("status == 'it\\'s'", [2]),
+        ("status == \"it's\"", [2]),
+        ("status == 'say \"hi\"'", [3]),
+        ("status == \"say \\\"hi\\\"\"", [3]),
+        ("status == 'and or not'", []),
+    ])
+    def test_quoting(self, people_table, text, expected):
+        """Test single and double quoted strings, escapes and keywords inside quotes"""
+        assert _rows(people_table.filter(parse_filter(text))) == expected
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "score",
+        "score >",
+        "score > 10 and",
+        "score = 10",
+        "score > 10 score < 20",
+        "(score > 10",
+        "score > 10)",
+        "and > 10",
+        "10 > score",
+        "score > other",
+        "status == 'open",
+        "score > 10 && id < 3",
+    ])
+    def test_invalid_expressions(self, text):
+        """Test that malformed filters raise ValueError"""
+        with pytest.raises(ValueError):
+            parse_filter(text)
+
+
+class TestSliceBatches:
+    """Test selecting a row range from a stream of record batches"""
+
+    @pytest.fixture
+    def batches(self):
+        """Ten rows split into batches of 4, 3 and 3 rows"""
+        table = pa.table({'id': list(range(10))})
+        return [table.slice(0, 4).to_batches()[0],
+                table.slice(4, 3).to_batches()[0],
+                table.slice(7, 3).to_batches()[0]]
+
+    @pytest.mark.parametrize("offset, limit", [
+        (0, None), (0, 4), (4, 3), (3, 2), (3, 5), (4, None), (9, 5), (10, None), (12, 3), (2, 0),
+    ])
+    def test_ranges(self, batches, offset, limit):
+        """Test ranges starting, ending and spanning across batch boundaries"""
+        end = None if limit is None else offset + limit
+        sliced = list(slice_batches(batches, offset, limit))
+        assert [row for batch in sliced for row in batch.column('id').to_pylist()] == list(range(10))[offset:end]
+
+    def test_stops_after_range(self):
+        """Test that batches past the requested range are never read"""
+        def generate():
+            yield pa.record_batch({'id': [0, 1, 2]})
+            raise AssertionError("read past the requested rows")
+        sliced = list(slice_batches(generate(), 1, 2))
+        assert [batch.column('id').to_pylist() for batch in sliced] == [[1, 2]]
+
+
+class TestCsvTools:
+    """Test reading CSV files in pages and in each output format"""
+
+    @pytest.mark.parametrize("offset, limit", [(0, None), (0, 3), (2, 5), (5, 2), (9, 10), (10, None)])
+    def test_text_pages(self, data_dir, small_batches, people_table, offset, limit):
+        """Test that a page has one header and the requested rows numbered by file position, whatever the batching"""
+        end = None if limit is None else offset + limit
+        df = people_table.to_pandas().iloc[offset:end]
+        text = read_csv_file('people.csv', offset=offset, limit=limit)
+        lines = text.splitlines()
+        if df.empty:
+            assert text == df.to_string()
+            return
+        # One header, then one line per row numbered by its position in the file
+        assert lines[0].split() == list(df.columns)
+        assert [int(line.split()[0]) for line in lines[1:]] == list(df.index)
+        assert [int(line.split()[1]) for line in lines[1:]] == df['id'].tolist()
+
+    def test_text_single_batch_matches_pandas(self, data_dir, people_table):
+        """Test that a file read in one batch formats exactly like DataFrame.to_string"""
+        assert read_csv_file('people.csv', offset=2, limit=4) == people_table.to_pandas().iloc[2:6].to_string()
+
+    @pytest.mark.parametrize("offset, limit", [(0, None), (3, 4), (8, 5)])
+    def test_arrow_output(self, data_dir, small_batches, people_table, offset, limit):
+        """Test that arrow output is a base64 Arrow IPC stream of the requested rows"""
+        encoded = read_csv_file('people.csv', output_format='arrow', offset=offset, limit=limit)
+        table = pa.ipc.open_stream(base64.b64decode(encoded)).read_all()
+        end = None if limit is None else offset + limit
+        assert table.column_names == people_table.column_names
+        assert _rows(table) == list(range(10))[offset:end]
+        assert table.column('status').to_pylist() == people_table.column('status').to_pylist()[offset:end]
+
+    @pytest.mark.parametrize("offset, limit", [(0, None), (3, 4), (8, 5)])
+    def test_parquet_output(self, data_dir, small_batches, people_table, offset, limit):
+        """Test that parquet output is a base64 zstd Parquet file of the requested rows"""
+        encoded = read_csv_file('people.csv', output_format='parquet', offset=offset, limit=limit)
+        parquet_file = pq.ParquetFile(io.BytesIO(base64.b64decode(encoded)))
+        table = parquet_file.read()
+        end = None if limit is None else offset + limit
+        assert parquet_file.metadata.row_group(0).column(0).compression == 'ZSTD'
+        assert _rows(table) == list(range(10))[offset:end]
+        assert table.column('archived').to_pylist() == people_table.column('archived').to_pylist()[offset:end]
+
+    def test_empty_page_in_binary_formats(self, data_dir):
+        """Test that a page past the end still carries the schema"""
+        encoded = read_csv_file('people.csv', output_format='arrow', offset=20)
+        table = pa.ipc.open_stream(base64.b64decode(encoded)).read_all()
+        assert table.num_rows == 0
+        assert table.column_names == ['id', 'score', 'ratio', 'status', 'archived']
+
+    @pytest.mark.parametrize("kwargs", [
+        {'output_format': 'json'},
+        {'offset': -1},
+        {'limit': -1},
+    ])
+    def test_invalid_arguments(self, data_dir, kwargs):
+        """Test that unknown formats and negative offsets/limits are rejected"""
+        with pytest.raises(ValueError):
+            read_csv_file('people.csv', **kwargs)
+
+    def test_rejects_paths_outside_data_dir(self, data_dir):
+        """Test that file names cannot escape the data directory"""
+        with pytest.raises(ValueError):
+            read_csv_file('../people.csv')
+
+    def test_late_type_change(self, data_dir, small_batches, monkeypatch):
+        """Test that a value not matching the type inferred from the first block is read as text"""
+        rows = [f"{i},{i * 2}" for i in range(50)]
+        rows[45] = "45,oops"
+        (data_dir / 'late.csv').write_text("id,value\n" + "\n".join(rows) + "\n")
+        monkeypatch.setattr(file_reader, 'DATA_DIR_STR', str(data_dir))
+
+        assert csv_tools.summarize_csv_file('late.csv') == "CSV file 'late.csv' has 50 rows and 2 columns."
+        encoded = read_csv_file('late.csv', output_format='arrow')
+        table = pa.ipc.open_stream(base64.b64decode(encoded)).read_all()
+        # Only the column holding the unexpected value falls back to strings
+        assert table.schema.field('id').type == pa.int64()
+        assert table.schema.field('value').type == pa.string()
+        assert table.column('value').to_pylist()[44:46] == ['88', 'oops']
+        assert read_csv_file('late.csv', offset=45, limit=1).splitlines()[1].split() == ['45', '45', 'oops']
+
+
+class TestParquetTools:
+    """Test reading Parquet files in pages, by column and with a pushed-down filter"""
+
+    @pytest.mark.parametrize("offset, limit", [(0, None), (0, 3), (2, 5), (5, 2), (9, 10), (10, None)])
+    def test_pages(self, data_dir, small_batches, people_table, offset, limit):
+        """Test that pages across batch and row group boundaries keep file row numbers"""
+        end = None if limit is None else offset + limit
+        df = people_table.to_pandas().iloc[offset:end]
+        text = read_parquet_file('people.parquet', offset=offset, limit=limit)
+        lines = text.splitlines()
+        if df.empty:
+            assert text == df.to_string()
+            return
+        assert lines[0].split() == list(df.columns)
+        assert [int(line.split()[0]) for line in lines[1:]] == list(df.index)
+        assert [int(line.split()[1]) for line in lines[1:]] == df['id'].tolist()
+
+    def test_columns(self, data_dir, people_table):
+        """Test that only the requested columns are returned"""
+        text = read_parquet_file('people.parquet', columns=['id', 'status'], limit=2)
+        assert text == people_table.to_pandas()[['id', 'status']].iloc[:2].to_string()
+
+    def test_pandas_range_index(self, data_dir):
+        """Test that a RangeIndex written by pandas is continued across pages"""
+        df = pd.DataFrame({'value': range(6)}, index=pd.RangeIndex(100, 112, 2))
+        df.to_parquet(data_dir / 'indexed.parquet')
+        assert read_parquet_file('indexed.parquet', offset=2, limit=3) == df.iloc[2:5].to_string()
+
+    @pytest.mark.parametrize("filter_expr, offset, limit", [
+        ("status == 'open' or archived == true", 0, None),
+        ("status == 'open' or archived == true", 2, 3),
+        ("score > 30 and not archived == true", 1, 10),
+        ("score > 1000", 0, None),
+    ])
+    def test_filter_pushdown(self, data_dir, small_batches, people_table, filter_expr, offset, limit):
+        """Test that offset/limit page through the matching rows, numbered from 0"""
+        expected = people_table.filter(parse_filter(filter_expr)).to_pandas()
+        end = None if limit is None else offset + limit
+        expected = expected.iloc[offset:end].reset_index(drop=True)
+        expected.index += offset
+        text = read_parquet_file('people.parquet', offset=offset, limit=limit, filter_expr=filter_expr)
+        lines = text.splitlines()
+        if expected.empty:
+            assert text == expected.to_string()
+            return
+        assert [int(line.split()[0]) for line in lines[1:]] == list(expected.index)
+        assert [int(line.split()[1]) for line in lines[1:]] == expected['id'].tolist()
+
+    @pytest.mark.parametrize("kwargs, columns", [
+        ({'filter_expr': "score > 1000"}, ['id', 'score', 'ratio', 'status', 'archived']),
+        ({'filter_expr': "score > 1000", 'columns': ['status', 'id']}, ['status', 'id']),
+        ({'offset': 20, 'columns': ['id']}, ['id']),
+    ])
+    def test_no_rows_lists_columns(self, data_dir, kwargs, columns):
+        """Test that a page without rows still names the columns, as pandas does"""
+        text = read_parquet_file('people.parquet', **kwargs)
+        assert text == pd.DataFrame(columns=columns).to_string()
+        assert text.splitlines()[1] == f"Columns: [{', '.join(columns)}]"
+
+    def test_filter_with_columns(self, data_dir, people_table):
+        """Test that a filter may use columns that are not returned"""
+        text = read_parquet_file('people.parquet', columns=['id'], filter_expr="score > 80")
+        lines = text.splitlines()
+        assert lines[0].split() == ['id']
+        assert [line.split() for line in lines[1:]] == [['0', '8'], ['1', '9']]
+
+    def test_filter_pushed_into_scan(self, data_dir, monkeypatch):
+        """Test that the filter and columns are handed to the dataset scan rather than applied afterwards"""
+        import pyarrow.dataset as ds
+        scans = []
+        open_dataset = ds.dataset
+
+        class RecordingDataset:
+            def __init__(self, *args, **kwargs):
+                self.dataset = open_dataset(*args, **kwargs)
+                self.schema = self.dataset.schema
+
+            def to_batches(self, **kwargs):
+                scans.append(kwargs)
+                return self.dataset.to_batches(**kwargs)
+
+        monkeypatch.setattr(ds, 'dataset', RecordingDataset)
+        text = read_parquet_file('people.parquet', columns=['id'], filter_expr="id >= 9")
+        assert len(scans) == 1
+        assert scans[0]['columns'] == ['id']
+        assert scans[0]['filter'].equals(parse_filter("id >= 9"))
+        assert [line.split() for line in text.splitlines()[1:]] == [['0', '9']]
+
+    def test_invalid_filter(self, data_dir):
+        """Test that a malformed filter is reported as a ValueError"""
+        with pytest.raises(ValueError):
+            read_parquet_file('people.parquet', filter_expr="score >")
+
+    @pytest.mark.parametrize("kwargs", [{'offset': -1}, {'limit': -1}])
+    def test_invalid_arguments(self, data_dir, kwargs):
+        """Test that negative offsets and limits are rejected"""
+        with pytest.raises(ValueError):
+            read_parquet_file('people.parquet', **kwargs)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Test cases for the EPIC summary generator CLI helpers
+"""
+
+import pytest
+
+from epic_summary_generator import parse_issue_numbers
+
+
+class TestParseIssueNumbers:
+    """Test parsing comma- and newline-separated issue numbers"""
+
+    @pytest.mark.parametrize("issues_input, expected", [
+        ("144, 145,146", [144, 145, 146]),
+        ("144\n145\n\n146\n", [144, 145, 146]),
+        ("144,\n145", [144, 145]),
+        # A comment ends at the next comma, like any other field
+        ("# note, 12", [12]),
+        ("# sprint 1, 12, # sprint 2, 13", [12, 13]),
+        ("# header line\n144\n# trailing, 145", [144, 145]),
+        ("", []),
+    ])
+    def test_valid_input(self, issues_input, expected):
+        """Test that issue numbers are kept in order and comments skipped"""
+        assert list(parse_issue_numbers(issues_input)) == expected
+
+    def test_invalid_fields_are_skipped(self, capsys):
+        """Test that fields that are not numbers are reported and skipped"""
+        assert list(parse_issue_numbers("12, abc, 13 14\n15")) == [12, 15]
+        output = capsys.readouterr().out
+        assert "Skipping invalid issue number 'abc'" in output
+        assert "Skipping invalid issue number '13 14'" in output
@@ -2,46 +2,95 @@
 """
 Pytest-based tests for GitHub setup and repository access.
 Tests both public and private repository access scenarios.
+
+The tests call the live GitHub API; with pytest-xdist installed they can run
+in parallel:
+
+    pytest -n auto tests/test_github_setup.py
 """
 
 import os
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 from unittest.mock import patch, Mock
+from urllib3.util.retry import Retry
+
+# Read once; tests needing a valid token take the auth_headers fixture
+GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
+
+ACCEPT_HEADERS = {'Accept': 'application/vnd.github.v3+json'}
+INVALID_TOKEN_HEADERS = {'Authorization': 'token invalid-token', **ACCEPT_HEADERS}
+
+# Each repository is a separate test case, so failures are reported per
+# repository and pytest-xdist can spread the requests over workers
+PUBLIC_REPOS = [
+    "octocat/Hello-World",
+    "microsoft/vscode",
+    "facebook/react",
+    "LDFLK/archives"
+]
+PRIVATE_REPOS = [
+    "LDFLK/launch"  # Your private repository
+]
+
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Headers authenticating with GITHUB_TOKEN; skips the test when it is not set"""
+    if not GITHUB_TOKEN:
+        pytest.skip("GITHUB_TOKEN not set")
+    return {'Authorization': f'token {GITHUB_TOKEN}', **ACCEPT_HEADERS}
+
+
+def gh_graphql_repos(session, headers, repos):
+    """
+    Look up several repositories in a single GraphQL request (requires a token)
+    
+    Returns:
+        Dict mapping each 'owner/name' to its isPrivate/name/nameWithOwner, or None if inaccessible
+    """
+    aliases = "\n".join(
+        f'r{i}: repository(owner: "{owner}", name: "{name}") {{ isPrivate name nameWithOwner }}'
+        for i, (owner, name) in enumerate(repo.split('/') for repo in repos)
+    )
+    response = session.post('https://api.github.com/graphql', headers=headers, json={'query': f"{{\n{aliases}\n}}"})
+    assert response.status_code == 200, f"GraphQL request failed: {response.status_code}"
+    data = response.json().get('data') or {}
+    return {repo: data.get(f"r{i}") for i, repo in enumerate(repos)}
+
+
+@pytest.fixture(scope="session")
+def gh_session():
+    """Keep-alive session shared by all tests, so they reuse one TLS connection"""
+    session = requests.Session()
+    # Retry throttled and failed responses, but fail fast when the API is unreachable
+    retry = Retry(total=3, connect=0, backoff_factor=1.0, status_forcelist=(429, 500, 502, 503, 504),
+                  raise_on_status=False)
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry))
+    yield session
+    session.close()
 
 
 class TestGitHubToken:
     """Test GitHub token functionality"""
     
-    def test_github_token_not_set(self):
+    def test_github_token_not_set(self, gh_session):
         """Test behavior when GitHub token is not set"""
         with patch.dict(os.environ, {}, clear=True):
             # Test that we can still access public repositories without a token
-            headers = {'Accept': 'application/vnd.github.v3+json'}
-            response = requests.get('https://api.github.com/repos/octocat/Hello-World', headers=headers)
+            response = gh_session.get('https://api.github.com/repos/octocat/Hello-World', headers=ACCEPT_HEADERS)
             assert response.status_code == 200
     
-    def test_github_token_invalid(self):
+    def test_github_token_invalid(self, gh_session):
         """Test behavior with invalid GitHub token"""
         with patch.dict(os.environ, {'GITHUB_TOKEN': 'invalid-token'}):
-            headers = {
-                'Authorization': 'token invalid-token',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-            response = requests.get('https://api.github.com/user', headers=headers)
+            response = gh_session.get('https://api.github.com/user', headers=INVALID_TOKEN_HEADERS)
             assert response.status_code == 401
     
-    def test_github_token_valid(self):
+    def test_github_token_valid(self, auth_headers, gh_session):
         """Test behavior with valid GitHub token (requires actual token)"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN not set - skipping valid token test")
-        
-        headers = {
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        response = requests.get('https://api.github.com/user', headers=headers)
+        response = gh_session.get('https://api.github.com/user', headers=auth_headers)
         assert response.status_code == 200
         
         user_data = response.json()
@@ -52,125 +101,71 @@ class TestGitHubToken:
 class TestPublicRepositoryAccess:
     """Test access to public repositories (should work without token)"""
     
-    @pytest.fixture
-    def public_repos(self):
-        """List of public repositories to test"""
-        return [
-            "octocat/Hello-World",
-            "microsoft/vscode", 
-            "facebook/react",
-            "LDFLK/archives"
-        ]
-    
-    def test_public_repo_access_without_token(self, public_repos):
+    @pytest.mark.parametrize("repo", PUBLIC_REPOS)
+    def test_public_repo_access_without_token(self, repo, gh_session):
         """Test that public repositories are accessible without a token"""
-        headers = {'Accept': 'application/vnd.github.v3+json'}
+        response = gh_session.get(f'https://api.github.com/repos/{repo}', headers=ACCEPT_HEADERS)
+        assert response.status_code == 200, f"Failed to access {repo}"
         
-        for repo in public_repos:
-            response = requests.get(f'https://api.github.com/repos/{repo}', headers=headers)
-            assert response.status_code == 200, f"Failed to access {repo}"
-            
-            repo_data = response.json()
-            assert repo_data['private'] == False, f"{repo} should be public"
-            assert 'name' in repo_data
-            assert 'full_name' in repo_data
+        repo_data = response.json()
+        assert repo_data['private'] == False, f"{repo} should be public"
+        assert 'name' in repo_data
+        assert 'full_name' in repo_data
     
-    def test_public_repo_access_with_token(self, public_repos):
-        """Test that public repositories are accessible with a token"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN not set - skipping token test")
+    def test_public_repo_access_with_token(self, auth_headers, gh_session):
+        """Test that public repositories are accessible with a token (one GraphQL request for all)"""
+        repos = gh_graphql_repos(gh_session, auth_headers, PUBLIC_REPOS)
         
-        headers = {
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        
-        for repo in public_repos:
-            response = requests.get(f'https://api.github.com/repos/{repo}', headers=headers)
-            assert response.status_code == 200, f"Failed to access {repo}"
-            
-            repo_data = response.json()
-            assert repo_data['private'] == False, f"{repo} should be public"
-            assert 'name' in repo_data
-            assert 'full_name' in repo_data
+        for repo in PUBLIC_REPOS:
+            repo_data = repos[repo]
+            assert repo_data is not None, f"Failed to access {repo}"
+            assert repo_data['isPrivate'] == False, f"{repo} should be public"
+            assert repo_data['nameWithOwner'].lower() == repo.lower()
 
 
 class TestPrivateRepositoryAccess:
     """Test access to private repositories (requires valid token)"""
     
-    @pytest.fixture
-    def private_repos(self):
-        """List of private repositories to test"""
-        return [
-            "LDFLK/launch"  # Your private repository
-        ]
-    
-    def test_private_repo_access_without_token(self, private_repos):
+    @pytest.mark.parametrize("repo", PRIVATE_REPOS)
+    def test_private_repo_access_without_token(self, repo, gh_session):
         """Test that private repositories are NOT accessible without a token"""
-        headers = {'Accept': 'application/vnd.github.v3+json'}
-        
-        for repo in private_repos:
-            response = requests.get(f'https://api.github.com/repos/{repo}', headers=headers)
-            # Should return 404 for private repos without token
-            assert response.status_code in [404, 401], f"Unexpected response for {repo}"
+        response = gh_session.get(f'https://api.github.com/repos/{repo}', headers=ACCEPT_HEADERS)
+        # Should return 404 for private repos without token
+        assert response.status_code in [404, 401], f"Unexpected response for {repo}"
     
-    def test_private_repo_access_with_token(self, private_repos):
+    @pytest.mark.parametrize("repo", PRIVATE_REPOS)
+    def test_private_repo_access_with_token(self, repo, auth_headers, gh_session):
         """Test that private repositories are accessible with a valid token"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN not set - cannot test private repository access")
-        
-        headers = {
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
+        response = gh_session.get(f'https://api.github.com/repos/{repo}', headers=auth_headers)
+        assert response.status_code == 200, f"Failed to access private repo {repo}"
         
-        for repo in private_repos:
-            response = requests.get(f'https://api.github.com/repos/{repo}', headers=headers)
-            assert response.status_code == 200, f"Failed to access private repo {repo}"
-            
-            repo_data = response.json()
-            assert repo_data['private'] == True, f"{repo} should be private"
-            assert 'name' in repo_data
-            assert 'full_name' in repo_data
+        repo_data = response.json()
+        assert repo_data['private'] == True, f"{repo} should be private"
+        assert 'name' in repo_data
+        assert 'full_name' in repo_data
     
-    def test_private_repo_access_with_invalid_token(self, private_repos):
+    @pytest.mark.parametrize("repo", PRIVATE_REPOS)
+    def test_private_repo_access_with_invalid_token(self, repo, gh_session):
         """Test that private repositories are NOT accessible with invalid token"""
-        headers = {
-            'Authorization': 'token invalid-token',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        
-        for repo in private_repos:
-            response = requests.get(f'https://api.github.com/repos/{repo}', headers=headers)
-            assert response.status_code in [401, 404], f"Unexpected response for {repo}"
+        response = gh_session.get(f'https://api.github.com/repos/{repo}', headers=INVALID_TOKEN_HEADERS)
+        assert response.status_code in [401, 404], f"Unexpected response for {repo}"
 
 
 class TestGitHubAPIRateLimiting:
     """Test GitHub API rate limiting behavior"""
     
-    def test_rate_limit_headers_present(self):
+    def test_rate_limit_headers_present(self, gh_session):
         """Test that rate limit headers are present in API responses"""
-        headers = {'Accept': 'application/vnd.github.v3+json'}
-        response = requests.get('https://api.github.com/repos/octocat/Hello-World', headers=headers)
+        response = gh_session.get('https://api.github.com/repos/octocat/Hello-World', headers=ACCEPT_HEADERS)
         
         # Check for rate limit headers
         assert 'X-RateLimit-Limit' in response.headers
         assert 'X-RateLimit-Remaining' in response.headers
         assert 'X-RateLimit-Reset' in response.headers
     
-    def test_rate_limit_with_token(self):
+    def test_rate_limit_with_token(self, auth_headers, gh_session):
         """Test rate limiting with authenticated requests"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN not set - skipping authenticated rate limit test")
-        
-        headers = {
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        response = requests.get('https://api.github.com/repos/octocat/Hello-World', headers=headers)
+        response = gh_session.get('https://api.github.com/repos/octocat/Hello-World', headers=auth_headers)
         
         # Authenticated requests have higher rate limits
         assert 'X-RateLimit-Limit' in response.headers
@@ -181,36 +176,19 @@ class TestGitHubAPIRateLimiting:
 class TestRepositoryIssuesAccess:
     """Test access to repository issues"""
     
-    def test_public_repo_issues_without_token(self):
+    def test_public_repo_issues_without_token(self, gh_session):
         """Test accessing issues from public repository without token"""
-        headers = {'Accept': 'application/vnd.github.v3+json'}
-        response = requests.get('https://api.github.com/repos/octocat/Hello-World/issues', headers=headers)
+        response = gh_session.get('https://api.github.com/repos/octocat/Hello-World/issues', headers=ACCEPT_HEADERS)
         assert response.status_code == 200
     
-    def test_public_repo_issues_with_token(self):
+    def test_public_repo_issues_with_token(self, auth_headers, gh_session):
         """Test accessing issues from public repository with token"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN not set - skipping token test")
-        
-        headers = {
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        response = requests.get('https://api.github.com/repos/octocat/Hello-World/issues', headers=headers)
+        response = gh_session.get('https://api.github.com/repos/octocat/Hello-World/issues', headers=auth_headers)
         assert response.status_code == 200
     
-    def test_private_repo_issues_with_token(self):
+    def test_private_repo_issues_with_token(self, auth_headers, gh_session):
         """Test accessing issues from private repository with token"""
-        token = os.getenv('GITHUB_TOKEN')
-        if not token:
-            pytest.skip("GITHUB_TOKEN not set - cannot test private repository issues")
-        
-        headers = {
-            'Authorization': f'token {token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-        response = requests.get('https://api.github.com/repos/LDFLK/launch/issues', headers=headers)
+        response = gh_session.get('https://api.github.com/repos/LDFLK/launch/issues', headers=auth_headers)
         assert response.status_code == 200
 
 
@@ -5,13 +5,11 @@ Test cases for GitHub EPIC tools
 
 import json
 import os
-import sys
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import pytest
-
-# Add the current directory to the path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import requests
 
 from github_mcp.tools.github_tools import (
     GitHubIssueCrawler, 
@@ -20,12 +18,30 @@ from github_mcp.tools.github_tools import (
     crawl_epic_updates,
     get_epic_updates_from_issue,
     process_dated_epic_update,
+    process_dated_epic_update_result,
     generate_board_report,
     generate_epic_status_summary,
-    analyze_epic_trends
+    analyze_epic_trends,
+    generate_all_reports,
+    epic_update_to_dict,
+    _parse_epic_template
 )
-
-@pytest.fixture
+from github_mcp.utils.http_cache import ResponseCache
+
+
+def _response(body, headers=None, status_code=200):
+    """Stub of a successful requests response; only the attributes the crawler reads"""
+    return SimpleNamespace(
+        status_code=status_code,
+        headers=headers or {},
+        json=lambda: body,
+        # Read instead of json() when orjson is installed
+        content=json.dumps(body).encode(),
+        raise_for_status=lambda: None
+    )
+
+# The template is an immutable string, so one instance serves every test
+@pytest.fixture(scope="session")
 def sample_epic_template():
     """Sample EPIC update template content"""
     return """<!-- epic-update-template -->
@@ -130,6 +146,15 @@ class TestGitHubEpicTools:
         assert "Third-party API rate limiting" in parsed.risks_blockers
         assert len(parsed.next_steps) == 3
         assert "Complete UI testing by @qa-team (2025-01-20)" in parsed.next_steps
+        
+        # Parsing is memoized on the comment body, across crawlers
+        assert GitHubIssueCrawler().parse_epic_template(sample_epic_template) is parsed
+        
+        # The shared result can't be changed through the dicts handed to callers
+        update = EpicUpdate(151, "Test Issue", 1, sample_epic_template, "test-user",
+                            "2025-01-15T14:30:00Z", "test-org/test-repo", parsed)
+        epic_update_to_dict(update)['parsed_data']['metrics_deliverables'].append("Extra")
+        assert len(crawler.parse_epic_template(sample_epic_template).metrics_deliverables) == 3
 
     def test_epic_template_parsing_edge_cases(self, github_token):
         """Test EPIC template parsing with edge cases"""
@@ -161,14 +186,11 @@ class TestGitHubEpicTools:
         assert len(parsed.what_happened) == 1
         assert len(parsed.risks_blockers) == 0  # Missing section
 
-    @patch('github_mcp.tools.github_tools.requests.get')
+    @patch('github_mcp.tools.github_tools.requests.Session.get')
     def test_get_issues(self, mock_get, sample_github_data, github_token):
         """Test getting issues from GitHub API"""
         # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = [sample_github_data['issue']]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = _response([sample_github_data['issue']])
         
         crawler = GitHubIssueCrawler()
         issues = crawler.get_issues("test-org/test-repo")
@@ -177,17 +199,54 @@ class TestGitHubEpicTools:
         assert issues[0]['number'] == 151
         assert issues[0]['title'] == 'Implement User Authentication System'
 
-    @patch('github_mcp.tools.github_tools.requests.get')
+    @patch('github_mcp.tools.github_tools.requests.Session.get')
+    def test_get_issues_follows_pagination(self, mock_get, sample_github_data, github_token):
+        """Test that get_issues walks the Link rel="next" headers"""
+        next_url = "https://api.github.com/repositories/1/issues?state=open&per_page=100&page=2"
+        first_page = _response(
+            [sample_github_data['issue']],
+            headers={'Link': f'<{next_url}>; rel="next", <{next_url}>; rel="last"'}
+        )
+        second_page = _response([dict(sample_github_data['issue'], number=152)])
+        mock_get.side_effect = [first_page, second_page]
+        
+        crawler = GitHubIssueCrawler()
+        issues = crawler.get_issues("test-org/test-repo")
+        
+        assert [issue['number'] for issue in issues] == [151, 152]
+        assert mock_get.call_args_list[1][0][0] == next_url
+        
+        # max_pages stops before following the link
+        mock_get.reset_mock(side_effect=True)
+        mock_get.return_value = first_page
+        assert len(GitHubIssueCrawler().get_issues("test-org/test-repo", max_pages=1)) == 1
+
+    @patch('github_mcp.tools.github_tools.requests.Session.get')
+    def test_get_issues_revalidates_cached_response(self, mock_get, sample_github_data, github_token, tmp_path):
+        """Test that a cached response is revalidated with its ETag and reused on 304"""
+        issues = [sample_github_data['issue']]
+        first = _response(issues, headers={'ETag': '"abc"'})
+        not_modified = Mock(status_code=304, headers={})
+        mock_get.side_effect = [first, not_modified]
+        
+        cache = ResponseCache(str(tmp_path / "cache.sqlite"))
+        assert GitHubIssueCrawler(cache=cache).get_issues("test-org/test-repo") == issues
+        # A new crawler doesn't share the first one's in-memory responses
+        assert GitHubIssueCrawler(cache=cache).get_issues("test-org/test-repo") == issues
+        
+        assert 'If-None-Match' not in mock_get.call_args_list[0][1]['headers']
+        assert mock_get.call_args_list[1][1]['headers']['If-None-Match'] == '"abc"'
+        not_modified.json.assert_not_called()
+        cache.close()
+
+    @patch('github_mcp.tools.github_tools.requests.Session.get')
     def test_get_issue_comments(self, mock_get, sample_github_data, sample_epic_template, github_token):
         """Test getting issue comments from GitHub API"""
         # Set the comment body
         sample_github_data['comment']['body'] = sample_epic_template
         
         # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = [sample_github_data['comment']]
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = _response([sample_github_data['comment']])
         
         crawler = GitHubIssueCrawler()
         comments = crawler.get_issue_comments("test-org/test-repo", 151)
@@ -196,20 +255,16 @@ class TestGitHubEpicTools:
         assert comments[0]['id'] == 12345
         assert comments[0]['user']['login'] == 'test-user'
 
-    @patch('github_mcp.tools.github_tools.requests.get')
+    @patch('github_mcp.tools.github_tools.requests.Session.get')
     def test_extract_epic_updates(self, mock_get, sample_github_data, sample_epic_template, github_token):
         """Test extracting EPIC updates from issues"""
-        # Set the comment body
+        # Set the comment body, posted inside the days_back window
         sample_github_data['comment']['body'] = sample_epic_template
+        sample_github_data['comment']['created_at'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
         
         # Mock responses for both issues and comments
-        mock_issues_response = Mock()
-        mock_issues_response.json.return_value = [sample_github_data['issue']]
-        mock_issues_response.raise_for_status.return_value = None
-        
-        mock_comments_response = Mock()
-        mock_comments_response.json.return_value = [sample_github_data['comment']]
-        mock_comments_response.raise_for_status.return_value = None
+        mock_issues_response = _response([sample_github_data['issue']])
+        mock_comments_response = _response([sample_github_data['comment']])
         
         # Configure mock to return different responses for different URLs
         def mock_get_side_effect(url, **kwargs):
@@ -221,58 +276,118 @@ class TestGitHubEpicTools:
         
         mock_get.side_effect = mock_get_side_effect
         
-        crawler = GitHubIssueCrawler()
-        
-        # Mock the instance methods directly
-        crawler.is_epic_update_comment = Mock(return_value=True)
+        # Without a token the issues are listed over REST
+        with patch.dict(os.environ, {}, clear=True):
+            crawler = GitHubIssueCrawler()
         
-        # Create a mock parsed data
-        mock_parsed = Mock()
-        mock_parsed.status = "On Track"
-        crawler.parse_epic_template = Mock(return_value=mock_parsed)
-        # https://github.com/LDFLK/launch/issues/151
         epic_updates = crawler.extract_epic_updates("test-org/test-repo", days_back=30)
         
+        # Issues come from the complete REST listing, not the search API
+        assert mock_get.call_args_list[0][0][0] == "https://api.github.com/repos/test-org/test-repo/issues"
+        
         assert len(epic_updates) == 1
         assert epic_updates[0].issue_number == 151
         assert epic_updates[0].author == "test-user"
         assert epic_updates[0].parsed_data is not None
         assert epic_updates[0].parsed_data.status == "On Track"
 
-    def test_crawl_epic_updates_with_date_range(self, sample_epic_template, github_token):
-        """Test crawling EPIC updates with specific date range"""
-        with patch('github_mcp.tools.github_tools.GitHubIssueCrawler') as mock_crawler_class:
-            mock_crawler = Mock()
-            mock_crawler_class.return_value = mock_crawler
-            
-            # Create a mock EpicUpdate
-            mock_epic_update = EpicUpdate(
-                issue_number=151,
-                issue_title="Test Issue",
-                comment_id=12345,
-                comment_body=sample_epic_template,
-                author="test-user",
-                created_at="2025-01-15T14:30:00Z",
-                repo="test-org/test-repo",
-                parsed_data=Mock()
-            )
-            
-            mock_crawler.extract_epic_updates.return_value = [mock_epic_update]
-            
-            result = crawl_epic_updates(
-                "test-org/test-repo", 
-                start_date="2025-01-15", 
-                end_date="2025-01-15"
-            )
-            
-            # Verify the result structure
-            assert isinstance(result, dict)
-            assert result['total_updates'] == 1
-            assert result['repo'] == "test-org/test-repo"
-            assert len(result['updates']) == 1
+    @patch('github_mcp.tools.github_tools.requests.Session.post')
+    def test_iter_issues_with_comments_graphql_pagination(self, mock_post, github_token):
+        """Test that issue pages are followed through their endCursor, then recent pull requests"""
+        def page(number, has_next, cursor):
+            return _response({'data': {'repository': {'issues': {
+                'pageInfo': {'hasNextPage': has_next, 'endCursor': cursor},
+                'nodes': [{
+                    'number': number,
+                    'title': f'Issue {number}',
+                    'comments': {'pageInfo': {'hasNextPage': False}, 'nodes': []}
+                }]
+            }}}})
+
+        # Pull requests come newest first; the one updated before the date ends the listing
+        pull_requests = _response({'data': {'repository': {'pullRequests': {
+            'pageInfo': {'hasNextPage': True, 'endCursor': 'pr-cursor-1'},
+            'nodes': [
+                {'number': number, 'title': f'PR {number}', 'updatedAt': updated_at,
+                 'comments': {'pageInfo': {'hasNextPage': False}, 'nodes': []}}
+                for number, updated_at in [(160, '2025-01-03T08:00:00Z'), (120, '2024-12-30T08:00:00Z')]
+            ]
+        }}}})
+
+        mock_post.side_effect = [page(151, True, 'cursor-1'), page(152, False, None), pull_requests]
+
+        crawler = GitHubIssueCrawler()
+        pairs = list(crawler.iter_issues_with_comments_graphql("test-org/test-repo", since="2025-01-01T00:00:00Z"))
+
+        assert [issue['number'] for issue, comments in pairs] == [151, 152, 160]
+        variables = [call[1]['json']['variables'] for call in mock_post.call_args_list]
+        assert [v['cursor'] for v in variables] == [None, 'cursor-1', None]
+        assert variables[0]['since'] == "2025-01-01T00:00:00Z"
+        assert 'pullRequests' in mock_post.call_args_list[2][1]['json']['query']
 
-    def test_crawl_epic_updates_with_issue_numbers(self, sample_epic_template, github_token):
-        """Test crawling EPIC updates with specific issue numbers"""
+    @patch('github_mcp.tools.github_tools.requests.Session.get')
+    def test_extract_epic_updates_for_issue_numbers(self, mock_get, sample_github_data, sample_epic_template):
+        """Test extracting EPIC updates from specific issues fetched concurrently over REST"""
+        sample_github_data['comment']['body'] = sample_epic_template
+        sample_github_data['comment']['created_at'] = datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        def mock_get_side_effect(url, **kwargs):
+            number = int(url.split('/issues/')[1].split('/')[0])
+            if number == 404:
+                return _response(None, status_code=404)
+            if url.endswith('/comments'):
+                return _response([sample_github_data['comment']])
+            return _response(dict(sample_github_data['issue'], number=number))
+
+        mock_get.side_effect = mock_get_side_effect
+
+        # Without a token the GraphQL API is unavailable
+        with patch.dict(os.environ, {}, clear=True):
+            crawler = GitHubIssueCrawler(max_workers=4)
+        epic_updates = crawler.extract_epic_updates("test-org/test-repo", issue_numbers=[153, 404, 151, 152])
+
+        # Missing issues are skipped and the requested order is preserved
+        assert [update.issue_number for update in epic_updates] == [153, 151, 152]
+
+    @patch('github_mcp.tools.github_tools.requests.Session.post')
+    def test_extract_epic_updates_for_issue_numbers_graphql(self, mock_post, sample_epic_template, github_token):
+        """Test that specific issues are fetched through a single aliased GraphQL query"""
+        def issue_node(number):
+            return {
+                'number': number,
+                'title': f'Issue {number}',
+                'comments': {
+                    'pageInfo': {'hasNextPage': False},
+                    'nodes': [{
+                        'databaseId': number * 10,
+                        'body': sample_epic_template,
+                        'author': None,
+                        'createdAt': datetime.now().strftime('%Y-%m-%dT%H:%M:%SZ')
+                    }]
+                }
+            }
+
+        mock_post.return_value = _response({
+            'data': {'repository': {'i0': issue_node(153), 'i1': None, 'i2': issue_node(151)}},
+            'errors': [{'type': 'NOT_FOUND', 'path': ['repository', 'i1'], 'message': 'Could not resolve'}]
+        })
+
+        crawler = GitHubIssueCrawler()
+        epic_updates = crawler.extract_epic_updates("test-org/test-repo", issue_numbers=[153, 404, 151])
+
+        assert mock_post.call_count == 1
+        assert mock_post.call_args[1]['json']['variables'] == {
+            'owner': 'test-org', 'name': 'test-repo', 'n0': 153, 'n1': 404, 'n2': 151
+        }
+        assert [update.issue_number for update in epic_updates] == [153, 151]
+        assert epic_updates[0].author == 'ghost'
+
+    @pytest.mark.parametrize("kwargs", [
+        {'start_date': "2025-01-15", 'end_date': "2025-01-15"},
+        {'issue_numbers': "151,152,153"},
+    ], ids=["date_range", "issue_numbers"])
+    def test_crawl_epic_updates(self, kwargs, sample_epic_template, github_token):
+        """Test crawling EPIC updates with a date range or specific issue numbers"""
         with patch('github_mcp.tools.github_tools.GitHubIssueCrawler') as mock_crawler_class:
             mock_crawler = Mock()
             mock_crawler_class.return_value = mock_crawler
@@ -286,15 +401,12 @@ class TestGitHubEpicTools:
                 author="test-user",
                 created_at="2025-01-15T14:30:00Z",
                 repo="test-org/test-repo",
-                parsed_data=Mock()
+                parsed_data=_parse_epic_template(sample_epic_template)
             )
             
             mock_crawler.extract_epic_updates.return_value = [mock_epic_update]
             
-            result = crawl_epic_updates(
-                "test-org/test-repo", 
-                issue_numbers="151,152,153"
-            )
+            result = crawl_epic_updates("test-org/test-repo", **kwargs)
             
             # Verify the result structure
             assert isinstance(result, dict)
@@ -317,7 +429,7 @@ class TestGitHubEpicTools:
                 author="test-user",
                 created_at="2025-01-15T14:30:00Z",
                 repo="test-org/test-repo",
-                parsed_data=Mock()
+                parsed_data=_parse_epic_template(sample_epic_template)
             )
             
             mock_crawler.extract_epic_updates.return_value = [mock_epic_update]
@@ -336,6 +448,13 @@ class TestGitHubEpicTools:
             assert result['repo'] == "test-org/test-repo"
             assert result['issue_numbers'] == [151, 152, 153]
             assert len(result['updates']) == 1
+            
+            # A list of issue numbers is accepted without string parsing
+            result = crawl_specific_issues("test-org/test-repo", [151, 152, 153])
+            assert result['issue_numbers'] == [151, 152, 153]
+            mock_crawler.extract_epic_updates.assert_called_with(
+                "test-org/test-repo", days_back=36500, issue_numbers=[151, 152, 153]
+            )
 
     def test_crawl_epic_updates_invalid_issue_numbers(self, github_token):
         """Test crawling EPIC updates with invalid issue numbers"""
@@ -359,7 +478,7 @@ class TestGitHubEpicTools:
             # Mock the comment response
             mock_crawler.get_issue_comments.return_value = [sample_github_data['comment']]
             mock_crawler.is_epic_update_comment.return_value = True
-            mock_crawler.parse_epic_template.return_value = Mock()
+            mock_crawler.parse_epic_template.return_value = _parse_epic_template(sample_epic_template)
             
             result = get_epic_updates_from_issue(
                 "https://github.com/LDFLK/launch/issues/151",
@@ -488,6 +607,68 @@ class TestGitHubEpicTools:
         assert "Top Contributors" in analysis
         assert "**@user1:** 2 updates" in analysis
 
+    def test_generate_all_reports_matches_individual_reports(self, github_token):
+        """Test the single-pass report bundle against the individual generators"""
+        epic_data = {
+            'total_updates': 2,
+            'repo': 'test-org/test-repo',
+            'target_date': '2025-01-15',
+            'updates': [
+                {
+                    'issue_number': 151,
+                    'issue_title': 'Test Issue 1',
+                    'comment_body': 'Test comment body',
+                    'author': 'user1',
+                    'created_at': '2025-01-15T14:30:00Z',
+                    'parsed_data': {'epic_name': 'Epic 1', 'status': 'On Track', 'progress': '75%'}
+                },
+                {
+                    'issue_number': 151,
+                    'issue_title': 'Test Issue 1',
+                    'comment_body': 'Later comment body',
+                    'author': 'user2',
+                    'created_at': '2025-01-16T14:30:00Z',
+                    'parsed_data': {'epic_name': 'Epic 1', 'status': 'At Risk', 'progress': '80%'}
+                }
+            ]
+        }
+        
+        with patch('github_mcp.tools.github_tools.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 1, 20)
+            combined = generate_all_reports(epic_data)
+            separate = [
+                generate_board_report(epic_data, "executive"),
+                generate_epic_status_summary(epic_data),
+                analyze_epic_trends(epic_data)
+            ]
+        
+        assert combined == "\n---\n\n".join(separate)
+        assert "**Latest Update:** 2025-01-16 by @user2" in combined
+
+    def test_generate_all_reports_parses_json_once(self, github_token):
+        """Test that the combined report parses its JSON input only once"""
+        epic_json = json.dumps({
+            'total_updates': 1,
+            'repo': 'test-org/test-repo',
+            'days_back': 7,
+            'updates': [{
+                'issue_number': 152,
+                'issue_title': 'Combined Issue',
+                'comment_body': 'Combined comment body',
+                'author': 'user3',
+                'created_at': '2025-02-01T09:00:00Z',
+                'parsed_data': {'epic_name': 'Epic 2', 'status': 'On Track', 'progress': '10%'}
+            }]
+        })
+        
+        with patch('github_mcp.tools.github_tools.json_utils.loads', wraps=json.loads) as mock_loads:
+            combined = generate_all_reports(epic_json, "summary")
+        
+        assert mock_loads.call_count == 1
+        assert "**Active Issues:** 1" in combined
+        assert "**On Track:** 1 epics" in combined
+        assert "**Issue #152:** 1 updates - Combined Issue" in combined
+
     def test_process_dated_epic_update(self, github_token):
         """Test processing specific dated EPIC update"""
         with patch('github_mcp.tools.github_tools.get_epic_updates_from_issue') as mock_get:
@@ -526,6 +707,24 @@ class TestGitHubEpicTools:
             
             assert "EPIC Update Report" in result
 
+    @patch('requests.Session.get')
+    def test_process_dated_epic_update_result_reports_status(self, mock_get, github_token):
+        """Test that failed GitHub requests surface their HTTP status"""
+        response = Mock()
+        response.status_code = 404
+        response.headers = {}
+        response.raise_for_status.side_effect = requests.HTTPError("404 Not Found", response=response)
+        mock_get.return_value = response
+        
+        result = process_dated_epic_update_result(
+            "https://github.com/LDFLK/launch/issues/151",
+            "2025-07-28"
+        )
+        
+        assert not result.ok
+        assert result.status_code == 404
+        assert result.body.startswith("Error")
+
     def test_error_handling(self):
         """Test error handling in various scenarios"""
         # Test that GitHubIssueCrawler can be created without token (for public repos)